@@ -9,6 +9,13 @@ import yaml
 from datetime import datetime
 
 
+# Root of the SabbathSchool/lessons tree on GitHub (raw file access)
+LESSONS_BASE_URL = "https://raw.githubusercontent.com/SabbathSchool/lessons/refs/heads/master"
+
+# Default location for cached intermediate results
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "sabbath-school-reproducer")
+
+
 class Config:
     """Handles configuration loading and validation for Sabbath School lessons."""
     
@@ -41,6 +48,10 @@ class Config:
                 config['front_cover_svg'] = None
             if 'back_cover_svg' not in config:
                 config['back_cover_svg'] = None
+            if 'cache_dir' not in config:
+                config['cache_dir'] = DEFAULT_CACHE_DIR
+            if config['cache_dir']:
+                config['cache_dir'] = os.path.expanduser(config['cache_dir'])
                 
             # Handle reproduction config or set defaults
             if 'reproduce' not in config:
@@ -199,7 +210,10 @@ class Config:
         decade = f"{year // 10 * 10}s"
         lang = self.config['language']
         
-        base_url = f"https://raw.githubusercontent.com/SabbathSchool/lessons/refs/heads/master/{decade}/{year}/{quarter}/{lang}"
+        # Allow a mirror (e.g. a local stand-in server) in place of GitHub
+        lessons_base_url = (self.config.get('lessons_base_url') or LESSONS_BASE_URL).rstrip('/')
+        
+        base_url = f"{lessons_base_url}/{decade}/{year}/{quarter}/{lang}"
         contents_url = f"{base_url}/contents.json"
         front_matter_url = f"{base_url}/front-matter.md"
         back_matter_url = f"{base_url}/back-matter.md"
@@ -0,0 +1,203 @@
+"""
+Booklet Imposition for Sabbath School Lessons PDF
+
+Quarterlies are printed as saddle-stitched booklets: pages are placed two per
+sheet side, in the order that reads correctly once the sheets are folded and
+nested. This module imposes the pages of the rendered WeasyPrint document while
+its PDF is written: each laid-out page becomes a form XObject drawn onto the
+imposed sheets, so pages are neither laid out nor rasterized a second time.
+"""
+
+import pydyf
+
+
+class BookletImposer:
+    """Imposes rendered pages 2-up in saddle-stitch order."""
+
+    # Points per inch in PDF user space
+    POINTS_PER_INCH = 72
+
+    @staticmethod
+    def signature_order(page_count, signature_pages=None):
+        """
+        Get the pages printed on each sheet side of a saddle-stitched booklet
+
+        Pages are padded with blanks to a multiple of 4 and split into
+        signatures (groups of nested sheets folded together). Sides are listed
+        sheet by sheet, front then back, for duplex printing.
+
+        Args:
+            page_count (int): Number of rendered pages
+            signature_pages (int, optional): Pages per signature, a multiple of 4; one signature if None
+
+        Returns:
+            list: (left, right, sheet, sheets) per side, where left and right are
+                0-based page indices (None for blank pages), sheet is the 0-based
+                sheet position in its signature (0 outermost) and sheets is the
+                number of sheets in the signature
+
+        Raises:
+            ValueError: If signature_pages is not a positive multiple of 4
+        """
+        padded = page_count + (-page_count % 4)
+        if signature_pages is None:
+            signature_pages = padded
+        elif signature_pages <= 0 or signature_pages % 4:
+            raise ValueError(f"Booklet signatures must have a multiple of 4 pages, not {signature_pages}")
+
+        def page(index):
+            return index if index < page_count else None
+
+        sides = []
+        for first in range(0, padded, signature_pages):
+            size = min(signature_pages, padded - first)
+            last = first + size - 1
+            sheets = size // 4
+            for sheet in range(sheets):
+                outer = 2 * sheet
+                sides.append((page(last - outer), page(first + outer), sheet, sheets))
+                sides.append((page(first + outer + 1), page(last - outer - 1), sheet, sheets))
+        return sides
+
+    @staticmethod
+    def creep_shift(sheet, sheets, creep):
+        """
+        Get how far to move a sheet's pages toward the spine
+
+        Inner sheets of a folded signature push out past the outer ones and lose
+        more at the fore-edge trim, so their pages move toward the spine in
+        proportion to their depth: none on the outermost sheet, the full creep
+        on the innermost.
+
+        Args:
+            sheet (int): 0-based sheet position in its signature (0 outermost)
+            sheets (int): Number of sheets in the signature
+            creep (float): Shift of the innermost sheet, in points
+
+        Returns:
+            float: Shift toward the spine, in points
+        """
+        if sheets <= 1:
+            return 0
+        return creep * sheet / (sheets - 1)
+
+    @staticmethod
+    def page_number(reference):
+        """
+        Get the object number of a PDF reference
+
+        Args:
+            reference (bytes or str): Reference such as b'12 0 R'
+
+        Returns:
+            int: Object number
+        """
+        if isinstance(reference, bytes):
+            reference = reference.decode('ascii')
+        return int(str(reference).split()[0])
+
+    @staticmethod
+    def impose(pdf, signature_pages=None, creep=0):
+        """
+        Replace the pages of a PDF being written with imposed booklet sheets
+
+        Each page content stream is turned into a form XObject with the page's
+        resources, and every sheet side draws its two pages side by side,
+        clipped to their halves. Links, outlines and named destinations point
+        at reader pages, so they are dropped from the print file.
+
+        Args:
+            pdf (pydyf.PDF): PDF being written, with one page per rendered page
+            signature_pages (int, optional): Pages per signature, a multiple of 4; one signature if None
+            creep (float): Shift of the innermost sheet toward the spine, in points
+
+        Returns:
+            int: Number of imposed sheet sides
+        """
+        kids = pdf.pages['Kids']
+        pages = [pdf.objects[number] for number in kids[::3]]
+        if not pages:
+            return 0
+
+        forms = []
+        for page in pages:
+            form = pdf.objects[BookletImposer.page_number(page['Contents'])]
+            form.extra.update({
+                'Type': '/XObject',
+                'Subtype': '/Form',
+                'BBox': page['MediaBox'],
+                'Resources': page['Resources'],
+            })
+            forms.append(form)
+            # The reader page is replaced by its sheet side
+            page.free = 'f'
+
+        left, top, right, bottom = pages[0]['MediaBox']
+        width, height = right - left, bottom - top
+
+        pdf.pages['Kids'] = pydyf.Array()
+        pdf.pages['Count'] = 0
+        sides = BookletImposer.signature_order(len(pages), signature_pages)
+        for left_page, right_page, sheet, sheets in sides:
+            shift = BookletImposer.creep_shift(sheet, sheets, creep)
+            stream = pydyf.Stream(compress=True)
+            x_objects = pydyf.Dictionary()
+            for index, cell, offset in ((left_page, 0, shift), (right_page, width, -shift)):
+                if index is None:
+                    continue
+                form = forms[index]
+                form_left, form_top = pdf.objects[kids[3 * index]]['MediaBox'][:2]
+                name = f'P{index}'
+                x_objects[name] = form.reference
+                stream.push_state()
+                stream.rectangle(cell, 0, width, height)
+                stream.clip()
+                stream.end()
+                stream.set_matrix(1, 0, 0, 1, cell + offset - form_left, -form_top)
+                stream.draw_x_object(name)
+                stream.pop_state()
+            pdf.add_object(stream)
+
+            resources = pydyf.Dictionary({'XObject': x_objects})
+            pdf.add_object(resources)
+            pdf.add_page(pydyf.Dictionary({
+                'Type': '/Page',
+                'Parent': pdf.pages.reference,
+                'MediaBox': pydyf.Array([0, 0, 2 * width, height]),
+                'Contents': stream.reference,
+                'Resources': resources.reference,
+            }))
+
+        pdf.catalog.pop('Outlines', None)
+        pdf.catalog.pop('PageMode', None)
+        if 'Names' in pdf.catalog:
+            pdf.catalog['Names'].pop('Dests', None)
+        return len(sides)
+
+    @staticmethod
+    def write_booklet(document, output_pdf, config=None, **options):
+        """
+        Write an imposed booklet PDF from a rendered WeasyPrint document
+
+        Args:
+            document (Document): Rendered WeasyPrint document
+            output_pdf (str): Path to save the booklet PDF
+            config (dict, optional): Configuration dictionary (booklet_signature, booklet_creep)
+            **options: Options passed on to Document.write_pdf(); a finisher runs after the imposition
+
+        Returns:
+            int: Number of imposed sheet sides
+        """
+        config = config or {}
+        signature_pages = config.get('booklet_signature')
+        creep = (config.get('booklet_creep') or 0) * BookletImposer.POINTS_PER_INCH
+        next_finisher = options.pop('finisher', None)
+        sides = []
+
+        def finisher(document, pdf):
+            sides.append(BookletImposer.impose(pdf, signature_pages, creep))
+            if next_finisher:
+                next_finisher(document, pdf)
+
+        document.write_pdf(output_pdf, finisher=finisher, **options)
+        return sides[0] if sides else 0
@@ -0,0 +1,116 @@
+"""
+Cover Artwork for Sabbath School Lessons PDF
+
+Cover SVGs are normally inlined into the HTML, so WeasyPrint parses and draws
+the vector artwork on every build. When rasterization is enabled, the final
+cover SVG (after text substitution) is rendered once to a PNG at print
+resolution, cached by content hash, and referenced from an <img> instead.
+"""
+
+import base64
+import hashlib
+import os
+import pathlib
+
+from sabbath_school_reproducer.utils.cache import DiskCache
+
+
+class CoverRasterizer:
+    """Renders cover SVGs to cached PNG images."""
+
+    # Resolution used when the config does not set cover_dpi
+    DEFAULT_DPI = 300
+
+    # Width of the letter-size page the covers fill
+    PAGE_WIDTH_INCHES = 8.5
+
+    # Image URIs of the covers rasterized in this process
+    _rasterized = {}
+
+    @staticmethod
+    def make_key(svg_content, dpi):
+        """
+        Build the cache key of a rasterized cover
+
+        Args:
+            svg_content (str): Final cover SVG markup
+            dpi (int): Print resolution
+
+        Returns:
+            str: Cache key
+        """
+        svg_hash = hashlib.sha256(svg_content.encode('utf-8')).hexdigest()
+        return DiskCache.make_key(svg_hash, int(dpi))
+
+    @staticmethod
+    def rasterize(svg_content, cache_dir=None, dpi=DEFAULT_DPI):
+        """
+        Render a cover SVG to a PNG, reusing a cached image of the same SVG
+
+        Requires the optional cairosvg package unless the image is already cached.
+
+        Args:
+            svg_content (str): Final cover SVG markup
+            cache_dir (str, optional): Root cache directory; the image is inlined as a data URI if None
+            dpi (int): Print resolution
+
+        Returns:
+            str or None: URI of the PNG image, or None if the cover could not be rasterized
+        """
+        key = CoverRasterizer.make_key(svg_content, dpi)
+        uri = CoverRasterizer._rasterized.get(key)
+        if uri is not None:
+            return uri
+
+        disk = DiskCache(cache_dir, 'covers') if cache_dir else None
+        if disk and os.path.exists(disk.path_for(key, '.png')):
+            uri = pathlib.Path(disk.path_for(key, '.png')).resolve().as_uri()
+            CoverRasterizer._rasterized[key] = uri
+            return uri
+
+        try:
+            import cairosvg
+        except ImportError:
+            print("Warning: rasterize_covers requires the cairosvg package; covers stay inline SVG")
+            return None
+
+        try:
+            png = cairosvg.svg2png(
+                bytestring=svg_content.encode('utf-8'),
+                output_width=round(CoverRasterizer.PAGE_WIDTH_INCHES * dpi)
+            )
+        except Exception as e:
+            print(f"Warning: Could not rasterize cover: {e}")
+            return None
+
+        path = disk.store_bytes(key, png, '.png') if disk else None
+        if path:
+            uri = pathlib.Path(path).resolve().as_uri()
+        else:
+            uri = f"data:image/png;base64,{base64.b64encode(png).decode('ascii')}"
+        CoverRasterizer._rasterized[key] = uri
+        return uri
+
+    @staticmethod
+    def artwork_html(svg_content, config=None):
+        """
+        Get the markup that shows a cover: an <img> of the rasterized cover, or the SVG itself
+
+        Args:
+            svg_content (str): Final cover SVG markup
+            config (dict, optional): Configuration dictionary (rasterize_covers, cover_dpi, cache_dir)
+
+        Returns:
+            str: Cover artwork HTML
+        """
+        if not svg_content or not config or not config.get('rasterize_covers'):
+            return svg_content
+
+        uri = CoverRasterizer.rasterize(
+            svg_content,
+            config.get('cache_dir'),
+            config.get('cover_dpi') or CoverRasterizer.DEFAULT_DPI
+        )
+        if uri is None:
+            return svg_content
+        return f'<img class="cover-image" src="{uri}" alt="">'
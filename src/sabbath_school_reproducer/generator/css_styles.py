@@ -111,15 +111,37 @@ body {
     @bottom-right { content: ""; }
 }
 
-/* Explicitly define counter reset points in the document flow */
+/* Blank pages inserted to start a section on the right side carry no folio */
+@page :blank, frontmatter:blank, mainmatter:blank {
+    @bottom-center { content: ""; }
+    @bottom-left { content: ""; }
+    @bottom-right { content: ""; }
+}
+
+/* Page numbering restarts on the first page of each named-page group */
+@page :nth(1 of frontmatter) {
+    counter-reset: page 1;
+}
+
+@page :nth(1 of mainmatter) {
+    counter-reset: page 1;
+}
+
 .frontmatter-container {
     page: frontmatter;
-    counter-reset: page 1;
 }
 
 .mainmatter-container {
     page: mainmatter;
-    counter-reset: page 1;
+}
+
+/* Sections start on a right (odd) or left (even) page */
+.recto-start {
+    break-before: right;
+}
+
+.verso-start {
+    break-before: left;
 }
 
 /* Cover page styling - Full page with no margins */
@@ -138,6 +160,15 @@ body {
     display: block;
 }
 
+/* Rasterized covers keep the artwork's proportions, like the inline SVG */
+.cover-page img.cover-image,
+.back-cover-page img.cover-image {
+    width: 100%;
+    height: 100%;
+    object-fit: contain;
+    display: block;
+}
+
 /* Fix for blank page after cover */
 .blank-page {
     height: 100vh;
@@ -203,6 +234,11 @@ body {
     text-decoration: none;
 }
 
+/* Page numbers are resolved from the lesson anchors during layout */
+.toc-table a.toc-page::after {
+    content: target-counter(attr(href), page);
+}
+
 /* Lesson Header styling */
 .lesson-header {
     background-color: #f5f1e6;
@@ -0,0 +1,119 @@
+"""
+Font Subset Cache for Sabbath School Lessons PDF
+
+WeasyPrint subsets every embedded font each time a PDF is written. The editions
+use the same faces and mostly the same glyphs, so this module keeps subset
+fonts in memory and on disk, keyed by the font data, the face and the glyph set.
+"""
+
+import hashlib
+import contextlib
+
+from sabbath_school_reproducer.utils.cache import DiskCache
+
+
+class FontSubsetCache:
+    """Caches the font files produced by WeasyPrint's font subsetting."""
+
+    # Shared caches per cache directory, so every render in a process reuses the memory tier
+    _shared = {}
+
+    def __init__(self, cache_dir=None, namespace='fonts'):
+        """
+        Initialize a font subset cache
+
+        Args:
+            cache_dir (str, optional): Root cache directory for the disk tier; memory only if None
+            namespace (str): Subdirectory for the disk tier
+        """
+        self.memory = {}
+        self.disk = DiskCache(cache_dir, namespace) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def shared(cache_dir=None, namespace='fonts'):
+        """
+        Get the process-wide font subset cache for a directory
+
+        Args:
+            cache_dir (str, optional): Root cache directory for the disk tier
+            namespace (str): Subdirectory for the disk tier
+
+        Returns:
+            FontSubsetCache: Shared cache
+        """
+        key = (cache_dir, namespace)
+        if key not in FontSubsetCache._shared:
+            FontSubsetCache._shared[key] = FontSubsetCache(cache_dir, namespace)
+        return FontSubsetCache._shared[key]
+
+    @staticmethod
+    def make_key(file_content, index, glyph_ids, hinting, notdef_outline):
+        """
+        Build the cache key of a subset
+
+        Args:
+            file_content (bytes): Complete font file
+            index (int): Face index within the file (collections such as .ttc hold several)
+            glyph_ids (iterable): Glyph ids kept in the subset
+            hinting (bool): Whether hinting instructions are kept
+            notdef_outline (bool): Whether the .notdef glyph keeps its outline
+
+        Returns:
+            str: Cache key
+        """
+        font_hash = hashlib.sha256(file_content).hexdigest()
+        return DiskCache.make_key(font_hash, index, sorted(glyph_ids), bool(hinting), bool(notdef_outline))
+
+    def subset(self, font, to_unicode, hinting, subset_font):
+        """
+        Subset a font, reusing a cached result for the same font and glyphs
+
+        Args:
+            font (Font): WeasyPrint font; its file_content is replaced by the subset
+            to_unicode (dict): Glyph id -> text of the glyphs used in the document
+            hinting (bool): Whether hinting instructions are kept
+            subset_font (callable): WeasyPrint's subsetting, called as subset_font(font, to_unicode, hinting)
+        """
+        if not to_unicode:
+            subset_font(font, to_unicode, hinting)
+            return
+
+        key = self.make_key(font.file_content, font.index, to_unicode, hinting, font.missing)
+        data = self.memory.get(key)
+        if data is None and self.disk:
+            data = self.disk.load_bytes(key, '.font')
+            if data is not None:
+                self.memory[key] = data
+        if data is not None:
+            self.hits += 1
+            font.file_content = data
+            return
+
+        self.misses += 1
+        subset_font(font, to_unicode, hinting)
+        self.memory[key] = font.file_content
+        if self.disk:
+            self.disk.store_bytes(key, font.file_content, '.font')
+
+    @contextlib.contextmanager
+    def installed(self):
+        """
+        Route WeasyPrint's font subsetting through this cache while the context is active
+
+        Yields:
+            FontSubsetCache: This cache
+        """
+        from weasyprint.pdf.fonts import Font
+
+        original = Font.subset
+
+        def subset(font, to_unicode, hinting):
+            self.subset(font, to_unicode, hinting, original)
+
+        Font.subset = subset
+        try:
+            yield self
+        finally:
+            Font.subset = original
@@ -5,12 +5,28 @@ import json
 import requests
 from sabbath_school_reproducer.generator.css_styles import CSS_TEMPLATE, CssUpdater
 from sabbath_school_reproducer.generator.css_editor import  CSSEditor
+from sabbath_school_reproducer.generator.cover_assets import CoverRasterizer
+from sabbath_school_reproducer.generator.html_optimizer import HtmlOptimizer
+from sabbath_school_reproducer.generator.templates import (
+    LessonTemplates, TEMPLATE_VERSION, COVER_PAGE_TEMPLATE, PRELIMINARY_TEMPLATE, ADDITIONAL_SECTION_TEMPLATE,
+    NOTES_TEMPLATE, LESSON_TEMPLATE
+)
+from sabbath_school_reproducer.models import Lesson
+from sabbath_school_reproducer.utils.cache import DiskCache, FragmentCache
 from sabbath_school_reproducer.utils.language_utils import  LanguageConfig
+from sabbath_school_reproducer.utils.markdown_lists import MarkdownLists
 
 
 class HtmlGenerator:
     """Generates HTML content for PDF generation with incremental approach."""
     
+    # Markdown converter shared by all conversions
+    _markdown_converter = None
+    
+    # Stand-ins for the lesson number and date in cached lesson fragments
+    NUMBER_PLACEHOLDER = '\ue000LESSON_NUMBER\ue000'
+    DATE_PLACEHOLDER = '\ue000LESSON_DATE\ue000'
+    
     @staticmethod
     def get_quarter_display(quarter, language_code='en'):
         """
@@ -47,19 +63,18 @@ class HtmlGenerator:
             return None
     
     @staticmethod
-    def create_cover_page(front_cover_svg_path=None, config=None):
+    def create_cover_page(front_cover_svg_path=None, config=None, svg_content=None):
         """
         Creates the cover page HTML using the SVG from file if provided
         
         Args:
             front_cover_svg_path (str, optional): Path to front cover SVG
             config (dict, optional): Configuration dictionary
+            svg_content (str, optional): Front cover SVG markup, used instead of reading the file
             
         Returns:
             str: HTML for cover page
         """
-        svg_content = ""
-                    
         # Set default values
         year = 2025
         quarter = "q1"
@@ -109,29 +124,21 @@ class HtmlGenerator:
         )
         
         # If a path is provided, try to read the SVG from file
-        if front_cover_svg_path:
+        if not svg_content and front_cover_svg_path:
             svg_content = HtmlGenerator.read_svg_file(front_cover_svg_path)
             if not svg_content:
                 print(f"Warning: Could not read SVG from {front_cover_svg_path}")
                 # We'll fall back to the default SVG
         
         if not svg_content:
-            # Get translated text for the cover page
-            sabbath_school_text = LanguageConfig.get_translation(language_code, 'sabbath_school', 'SABBATH SCHOOL', config)
-            lessons_text = LanguageConfig.get_translation(language_code, 'lessons', 'LESSONS', config)
-            
-            # Use default fallback SVG with dynamic content
-            svg_content = f"""
-            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 1000" width="800" height="1000">
-                <rect width="800" height="1000" fill="#ffffff"/>
-                <rect x="30" y="30" width="740" height="940" stroke="#7d2b2b" stroke-width="3" fill="none"/>
-                <text x="400" y="170" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{sabbath_school_text}</text>
-                <text x="400" y="230" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{lessons_text}</text>
-                <text x="400" y="730" font-family="Georgia, serif" font-size="36" font-weight="bold" text-anchor="middle" fill="#5a4130">{lesson_title}</text>
-                <text x="400" y="790" font-family="Georgia, serif" font-size="24" text-anchor="middle" fill="#5a4130">{quarter_display}, {year}</text>
-                <text x="400" y="830" font-family="Georgia, serif" font-size="18" text-anchor="middle" fill="#5a4130">{quarter_months} {year}</text>
-            </svg>
-            """
+            # Use default fallback SVG (with translated labels) with dynamic content
+            templates = LessonTemplates.for_language(language_code)
+            svg_content = templates.cover_svg.format(
+                lesson_title=lesson_title,
+                quarter_display=quarter_display,
+                quarter_months=quarter_months,
+                year=year
+            )
                 
             # Add source attribution if this is a reproduction
             if config and config.get("reproduce", {}).get("year"):
@@ -146,43 +153,36 @@ class HtmlGenerator:
                     config
                 )
                 
-                adapted_from = LanguageConfig.get_translation(language_code, 'adapted_from', 'Adapted from', config)
-                
                 # Add source attribution text to SVG
-                svg_content = svg_content.replace('</svg>', f"""
-                <text x="400" y="870" font-family="Georgia, serif" font-size="16" text-anchor="middle" font-style="italic" fill="#666666">
-                    {adapted_from} {source_quarter_name}, {source_year}
-                </text>
-                </svg>
-                """)
+                svg_content = svg_content.replace('</svg>', templates.cover_attribution.format(
+                    source_quarter_name=source_quarter_name,
+                    source_year=source_year
+                ))
         
-        return f"""
-        <div class="cover-page">
-            {svg_content}
-        </div>
-        """
+        # Reference a cached raster of the final SVG when enabled
+        return COVER_PAGE_TEMPLATE.format(svg=CoverRasterizer.artwork_html(svg_content, config))
 
     @staticmethod
-    def create_back_cover(back_cover_svg_path=None):
+    def create_back_cover(back_cover_svg_path=None, config=None, svg_content=None):
         """
         Creates the back cover page HTML using the SVG from file if provided
         
         Args:
             back_cover_svg_path (str, optional): Path to back cover SVG
+            config (dict, optional): Configuration dictionary
+            svg_content (str, optional): Back cover SVG markup, used instead of reading the file
             
         Returns:
             str: HTML for back cover
         """
-        if not back_cover_svg_path:
-            return ""
-            
-        svg_content = HtmlGenerator.read_svg_file(back_cover_svg_path)
+        if not svg_content and back_cover_svg_path:
+            svg_content = HtmlGenerator.read_svg_file(back_cover_svg_path)
         if not svg_content:
             return ""
         
         return f"""
-        <div class="back-cover-page">
-            {svg_content}
+        <div class="back-cover-page" id="back-cover">
+            {CoverRasterizer.artwork_html(svg_content, config)}
         </div>
         """
     
@@ -197,10 +197,12 @@ class HtmlGenerator:
         Returns:
             str: HTML content
         """
-        return markdown.markdown(
-            markdown_content,
-            extensions=['tables', 'extra']  # Enable table and extra extensions for better markdown support
-        )
+        # Build the converter once; reset() clears per-document state between conversions
+        if HtmlGenerator._markdown_converter is None:
+            HtmlGenerator._markdown_converter = markdown.Markdown(
+                extensions=['tables', 'extra']  # Enable table and extra extensions for better markdown support
+            )
+        return HtmlGenerator._markdown_converter.reset().convert(markdown_content)
     
     @staticmethod
     def create_frontmatter_html(frontmatter_content):
@@ -246,7 +248,7 @@ class HtmlGenerator:
         
         # Wrap in appropriate container
         return f"""
-        <div class="back-matter">
+        <div class="back-matter" id="backmatter">
             {html_content}
         </div>
         """
@@ -258,31 +260,33 @@ class HtmlGenerator:
         Creates HTML for a single lesson with improved formatting for title and date
         
         Args:
-            lesson (dict): Lesson dictionary
+            lesson (Lesson or dict): Lesson to render
             language_code (str): Language code for translations
             
         Returns:
             str: HTML for lesson
         """
+        lesson = Lesson.coerce(lesson)
+        
         # Determine title font size based on length
         title_font_size = "24px"  # Default
         title_top = '40px'
-        if lesson.get('title'):
-            if len(lesson.get('title', '')) <= 31:
+        if lesson.title:
+            if len(lesson.title) <= 31:
                 title_top = '45px'
-            if len(lesson.get('title', '')) > 57:
+            if len(lesson.title) > 57:
                 title_font_size = "18px"
         
         # Process preliminary note if present
         preliminary_html = ""
-        if lesson.get('preliminary_note'):
+        if lesson.preliminary_note:
             # Convert markdown to HTML with proper formatting
-            preliminary_content = HtmlGenerator.convert_markdown_to_html(lesson['preliminary_note'])
+            preliminary_content = HtmlGenerator.convert_markdown_to_html(lesson.preliminary_note)
             
             # Remove any lines that match the lesson date
-            if lesson.get('date'):
+            if lesson.date:
                 # Create more flexible patterns to match the date in various formats
-                date_only = lesson['date'].strip()
+                date_only = lesson.date.strip()
                 date_patterns = [
                     re.escape(date_only),  # Exact match
                     re.escape(date_only) + r'\s*$',  # Date at end of line
@@ -296,149 +300,104 @@ class HtmlGenerator:
             
             # If there's still content after removing dates, add it
             if preliminary_content.strip():
-                preliminary_html = f"""
-                <div class="preliminary-note">
-                    {preliminary_content}
-                </div>
-                """
+                preliminary_html = PRELIMINARY_TEMPLATE.format(content=preliminary_content)
         
-        # Process question sections with headers
-        question_sections_html = ""
+        # Templates for the language, with translated labels
+        templates = LessonTemplates.for_language(language_code)
+        default_questions_header = templates.questions_header
         
         # Group questions by section
         question_sections = {}
         
-        # Get translations
-        default_questions_header = LanguageConfig.get_translation(language_code, 'questions', 'QUESTIONS')
-        
         # Create a default questions section if no headers are present
-        if not lesson.get('question_headers'):
+        if not lesson.question_headers:
             question_sections[default_questions_header] = []
         
         # Group questions by their sections
-        for question in lesson.get('questions', []):
-            section = question.get('section', default_questions_header)
-            if section not in question_sections:
-                question_sections[section] = []
-            question_sections[section].append(question)
+        for question in lesson.questions:
+            question_sections.setdefault(question.section or default_questions_header, []).append(question)
         
         # Sort sections to ensure they're in the correct order if numbers are in section names
-        section_names = sorted(question_sections.keys())
-        
-        # Get answer prefix translation
-        answer_prefix = LanguageConfig.get_translation(language_code, 'answer_prefix', 'Ans.')
-        
-        # Process each section
-        for section_name in section_names:
-            section_questions = question_sections[section_name]
-            section_questions_html = ""
-            
-            for i, question in enumerate(section_questions, 1):
-                # Handle scripture reference with proper punctuation
-                scripture_html = ""
-                if question.get('scripture'):
-                    # Ensure the scripture reference ends with a period if it doesn't already
-                    scripture_with_period = question['scripture']
-                    if not scripture_with_period.endswith('.'):
-                        scripture_with_period += '.'
-                    scripture_html = f'<span class="scripture-ref">{scripture_with_period}</span>'
-                
-                # Handle answer
-                answer_html = ""
-                if question.get('answer'):
-                    answer_html = f'<div class="answer"><em>{answer_prefix} — {question["answer"]}</em></div>'
-                
-                # Add padding for two-digit numbers
-                num_class = "two-digit" if i >= 10 else "one-digit"
-                
-                # Make sure question text ends with proper punctuation
-                question_text = question.get('text', '')
-                if question_text and not re.search(r'[.?!]$', question_text):
-                    question_text += '.'
-                    
-                question_html = f"""
-                <div class="question">
-                    <span class="question-number {num_class}">{i}.</span>
-                    <div class="question-text">
-                        {question_text} {scripture_html}
-                        {answer_html}
-                    </div>
-                    <div class="clearfix"></div>
-                </div>
-                """
-                section_questions_html += question_html
-            
-            # Create the section with the proper header
-            question_sections_html += f"""
-            <div class="questions-section">
-                <div class="questions-header">{section_name}</div>
-                {section_questions_html}
-            </div>
-            """
+        question_sections_html = ''.join(
+            templates.render_questions_section(section_name, question_sections[section_name])
+            for section_name in sorted(question_sections)
+        )
         
         # Process additional sections if present
-        additional_sections_html = ""
-        if lesson.get('additional_sections'):
-            for section in lesson.get('additional_sections', []):
-                section_title = section.get('title', 'ADDITIONAL')
-                section_content = section.get('content', '')
-                
-                # Convert markdown to HTML with proper formatting
-                section_content_html = HtmlGenerator.convert_markdown_to_html(section_content)
-                
-                additional_sections_html += f"""
-                <div class="additional-section">
-                    <div class="additional-header">{section_title}</div>
-                    <div class="additional-content">
-                        {section_content_html}
-                    </div>
-                </div>
-                """
+        additional_sections_html = ''.join(
+            ADDITIONAL_SECTION_TEMPLATE.format(
+                title=section.title or 'ADDITIONAL',
+                content=HtmlGenerator.convert_markdown_to_html(section.content)
+            )
+            for section in lesson.additional_sections
+        )
         
         # Process notes if present
         notes_html = ""
-        if lesson.get('notes'):
-            # Get translations for 'NOTES' and 'NOTE'
-            notes_header = LanguageConfig.get_translation(language_code, 'notes', 'NOTES')
-            note_header = LanguageConfig.get_translation(language_code, 'note', 'NOTE')
-            
+        if lesson.notes:
             # Convert markdown to HTML with proper formatting
-            notes_content = HtmlGenerator.convert_markdown_to_html(HtmlGenerator.fix_markdown_lists(lesson['notes']))
+            notes_content = HtmlGenerator.convert_markdown_to_html(HtmlGenerator.fix_markdown_lists(lesson.notes))
             paragraphs = notes_content.split('</p>')
             non_empty_paragraphs = [p for p in paragraphs if p.strip()]
             
             # Use singular or plural form based on number of paragraphs
-            header = note_header if len(non_empty_paragraphs) == 1 else notes_header
-
-            notes_html = f"""
-                <div class="notes-section">
-                    <div class="notes-header">{header}</div>
-                    <div class="notes-content">
-                        {notes_content}
-                    </div>
-                </div>
-            """
+            header = templates.note_header if len(non_empty_paragraphs) == 1 else templates.notes_header
+            notes_html = NOTES_TEMPLATE.format(header=header, content=notes_content)
         
         # Combine all sections with updated header structure
-        return f"""
-        <div class="lesson">
-            <div class="lesson-header">
-                <div class="corner top-left"></div>
-                <div class="corner top-right"></div>
-                <div class="corner bottom-left"></div>
-                <div class="corner bottom-right"></div>
-                <div class="lesson-circle">{lesson.get('number', '')}</div>
-                <div class="lesson-title-container">
-                    <div class="lesson-title" style="font-size: {title_font_size};top: {title_top}">{lesson.get('title', '')}</div>
-                    <div class="lesson-date">{lesson.get('date', '')}</div>
-                </div>
-            </div>
-            {preliminary_html}
-            {question_sections_html}
-            {additional_sections_html}
-            {notes_html}
-        </div>
+        return LESSON_TEMPLATE.format(
+            number=lesson.number,
+            title_font_size=title_font_size,
+            title_top=title_top,
+            title=lesson.title,
+            date=lesson.date,
+            preliminary=preliminary_html,
+            questions=question_sections_html,
+            additional_sections=additional_sections_html,
+            notes=notes_html
+        )
+
+    @staticmethod
+    def create_lesson_html_cached(lesson, language_code='en', cache=None):
         """
+        Creates HTML for a single lesson, reusing a cached fragment when the lesson is unchanged
+        
+        Fragments are cached without the lesson number and date, so editions that
+        only move a lesson to a new date or position still reuse them.
+        
+        Args:
+            lesson (Lesson or dict): Lesson to render
+            language_code (str): Language code for translations
+            cache (FragmentCache, optional): Fragment cache; renders directly if None
+            
+        Returns:
+            str: HTML for lesson
+        """
+        lesson = Lesson.coerce(lesson)
+        if cache is None:
+            return HtmlGenerator.create_lesson_html(lesson, language_code)
+        
+        # The date also removes matching lines from the preliminary note, so keep it then
+        keep_date = bool(lesson.date and lesson.date.strip() in lesson.preliminary_note)
+        
+        template_lesson = Lesson.from_dict(lesson.to_dict())
+        template_lesson.number = HtmlGenerator.NUMBER_PLACEHOLDER
+        template_lesson.original_date = None
+        if not keep_date:
+            template_lesson.date = HtmlGenerator.DATE_PLACEHOLDER
+        
+        # Translated labels are baked into the fragment, so the language file is part of the key
+        language_file_hash = DiskCache.hash_file(LanguageConfig.get_language_file_path(language_code))
+        key = DiskCache.make_key('lesson', TEMPLATE_VERSION, language_code, language_file_hash, template_lesson.to_dict())
+        html = cache.get(key)
+        if html is None:
+            html = HtmlGenerator.create_lesson_html(template_lesson, language_code)
+            cache.put(key, html)
+        
+        html = html.replace(HtmlGenerator.NUMBER_PLACEHOLDER, str(lesson.number))
+        if not keep_date:
+            html = html.replace(HtmlGenerator.DATE_PLACEHOLDER, str(lesson.date))
+        return html
 
     @staticmethod
     def create_table_of_contents(lessons, language_code='en', config=None):
@@ -446,48 +405,19 @@ class HtmlGenerator:
         Creates the table of contents HTML with links to lessons
         
         Args:
-            lessons (list): List of lesson dictionaries
+            lessons (list): List of Lesson objects (or lesson dictionaries)
             language_code (str): Language code for translations
             config (dict, optional): Configuration dictionary containing language_config_path
             
         Returns:
             str: HTML for table of contents
         """
-        toc_rows = ""
-        
-        # Get translations
-        table_title = LanguageConfig.get_translation(language_code, 'table_of_contents', 'TABLE OF CONTENTS', config)
-        lesson_column = LanguageConfig.get_translation(language_code, 'lesson_column', 'Lesson', config)
-        title_column = LanguageConfig.get_translation(language_code, 'title_column', 'Title', config)
-        date_column = LanguageConfig.get_translation(language_code, 'date_column', 'Date', config)
-        page_column = LanguageConfig.get_translation(language_code, 'page_column', 'Page', config)
-        
-        for lesson in lessons:
-            # Only include items that have proper lesson structure
-            if 'number' in lesson and 'title' in lesson and 'date' in lesson:
-                toc_row = f"""
-                <tr>
-                    <td style="width: 40px; padding: 5px;">{lesson['number']}</td>
-                    <td style=""><a href="#lesson-{lesson['number']}">{lesson['title']}</a></td>
-                    <td style="">{lesson['date']}</td>
-                    <td style="width: 40px; padding: 5px; text-align: right;">{lesson['number']}</td>
-                </tr>
-                """
-                toc_rows += toc_row
-        
-        return f"""
-        <div class="toc-title">{table_title}</div>
-        <table class="toc-table">
-            <tr class="header">
-                <td style="width: 40px; padding: 5px;">{lesson_column}</td>
-                <td style="padding: 5px;">{title_column}</td>
-                <td style="width: 100px; padding: 5px;">{date_column}</td>
-                <td style="width: 40px; padding: 5px; text-align: right;">{page_column}</td>
-            </tr>
-            {toc_rows}
-        </table>
-        <div class="sectionbreaknone"></div>
-        """
+        # Only include items that have proper lesson structure
+        toc_lessons = [
+            Lesson.coerce(lesson) for lesson in lessons
+            if 'number' in lesson and 'title' in lesson and 'date' in lesson
+        ]
+        return LessonTemplates.for_language(language_code).render_toc(toc_lessons)
 
     @staticmethod
     def fix_markdown_lists(markdown_content):
@@ -508,12 +438,8 @@ class HtmlGenerator:
         if len(lines) == 1:
             return markdown_content
         
-        # Check if there's at least one numbered list item
-        has_numbered_list = any(re.match(r'^\s*(\d+)\.\s+', line) for line in lines)
-        
         # Only indent non-numbered list lines if there's at least one numbered list item
-        if has_numbered_list:
-            lines = list(map(lambda line: "\t" + line if not re.match(r'^\s*(\d+)\.\s+', line) else line, lines))
+        lines = MarkdownLists.indent_continuations(lines)
         
         # Join the lines back together and return the modified content
         return '\n'.join(lines)
@@ -554,83 +480,57 @@ class HtmlGenerator:
         return complete_html
     
     @staticmethod
-    def add_section(content_parts, dynamic_css, state, section_name, section_html, 
-                    start_on_odd=True, reset_counter=False):
+    def add_section(content_parts, state, section_name, section_html, start_on_odd=True):
         """
         Adds a section to the document, ensuring it starts on the correct page
-        
+
+        The section is wrapped in a break-before: right (or left) container, so
+        WeasyPrint inserts any blank page itself; page numbering restarts through
+        the named pages of the stylesheet, which stays the same for every document.
+
         Args:
             content_parts (list): List of HTML content parts
-            dynamic_css (str): CSS content with modifications
             state (dict): Current state tracking page numbers, etc.
             section_name (str): Name of the section for comments
             section_html (str): HTML content for the section
             start_on_odd (bool): Whether section should start on odd-numbered page
-            reset_counter (bool): Whether to reset page counter for this section
-            
+
         Returns:
-            tuple: (updated content_parts, updated dynamic_css, updated state)
+            tuple: (updated content_parts, updated state)
         """
         absolute_page_number = state.get('absolute_page_number', 1)
-        
-        # Check if we need to add a blank page to start on correct page type
+
+        # Account for the blank page the break will add, so later padding stays even
         if start_on_odd and absolute_page_number % 2 == 0:  # Need odd page but on even
-            # Add a blank page
-            content_parts.append('<div class="blank-page" style="page-break-after: always; height: 100vh;"></div>')
-            
-            # Add comment for debugging
-            content_parts.append(f'<!-- Added blank page to ensure {section_name} starts on odd page {absolute_page_number + 1} -->')
-            
+            content_parts.append(f'<!-- Expected blank page so {section_name} starts on odd page {absolute_page_number + 1} -->')
             absolute_page_number += 1
-            state['absolute_page_number'] = absolute_page_number
         elif not start_on_odd and absolute_page_number % 2 == 1:  # Need even page but on odd
-            # Add a blank page
-            content_parts.append('<div class="blank-page" style="page-break-after: always; height: 100vh;"></div>')
-            
-            # Add comment for debugging
-            content_parts.append(f'<!-- Added blank page to ensure {section_name} starts on even page {absolute_page_number + 1} -->')
-            
+            content_parts.append(f'<!-- Expected blank page so {section_name} starts on even page {absolute_page_number + 1} -->')
             absolute_page_number += 1
-            state['absolute_page_number'] = absolute_page_number
-        
-        # Add page-specific CSS rule if needed
-        section_start_page = absolute_page_number
-        if reset_counter:
-            dynamic_css += f"""
-/* {section_name} starts on page {section_start_page} */
-@page :nth({section_start_page}) {{
-    counter-reset: page 1;  /* Reset page counter for {section_name} */
-}}
-"""
-        else:
-            dynamic_css += f"""
-/* {section_name} starts on page {section_start_page} */
-@page :nth({section_start_page}) {{
-    /* {section_name} specific styling can go here */
-}}
-"""
-        
+
         # Add the section content
-        content_parts.append(section_html)
-        
+        break_class = "recto-start" if start_on_odd else "verso-start"
+        content_parts.append(f'<div class="{break_class}">{section_html}</div>')
+
         # Add comment for debugging
         content_parts.append(f'<!-- {section_name}: starts at page {absolute_page_number} -->')
-        
+
         # Estimate how many pages this section will add
         # This is a simplistic estimate - for accurate counts, we'd need to render the HTML
         estimated_pages = section_html.count('page-break-after: always') + 1
-        
+
         # Update the absolute page number
         absolute_page_number += estimated_pages
         state['absolute_page_number'] = absolute_page_number
-        
+
         # Add comment about section page count
         content_parts.append(f'<!-- {section_name}: estimated {estimated_pages} pages -->')
-        
-        return content_parts, dynamic_css, state
-    
+
+        return content_parts, state
+
     @staticmethod
-    def generate_html(content_data, front_cover_svg_path=None, back_cover_svg_path=None, config=None):
+    def generate_html(content_data, front_cover_svg_path=None, back_cover_svg_path=None, config=None,
+                      front_cover_svg=None, back_cover_svg=None):
         """
         Generate complete HTML document from content data with incremental approach
         
@@ -639,11 +539,13 @@ class HtmlGenerator:
             front_cover_svg_path (str, optional): Path to front cover SVG
             back_cover_svg_path (str, optional): Path to back cover SVG
             config (dict, optional): Configuration dictionary
+            front_cover_svg (str, optional): Front cover SVG markup, used instead of reading front_cover_svg_path
+            back_cover_svg (str, optional): Back cover SVG markup, used instead of reading back_cover_svg_path
             
         Returns:
             str: Complete HTML document
         """
-        lessons = content_data['lessons']
+        lessons = [Lesson.coerce(lesson) for lesson in content_data['lessons']]
         frontmatter = content_data['frontmatter']
         backmatter = content_data['backmatter']
         
@@ -662,40 +564,45 @@ class HtmlGenerator:
         # Update CSS with configuration if available
         if config:
             dynamic_css = CssUpdater.update_css_template(dynamic_css, config, content_data)
-        # Replace first page selector with nth-child selector for more control
-        dynamic_css = dynamic_css.replace("@page :first {", "@page :nth(1) {")
         
         # 1. Add cover page - pass the config to the cover page creation
-        cover_html = HtmlGenerator.create_cover_page(front_cover_svg_path, config)
-        content_parts, dynamic_css, state = HtmlGenerator.add_section(
-            content_parts, dynamic_css, state,
+        cover_html = HtmlGenerator.create_cover_page(front_cover_svg_path, config, front_cover_svg)
+        content_parts, state = HtmlGenerator.add_section(
+            content_parts, state,
             "Cover page", cover_html,
-            start_on_odd=True, reset_counter=False
+            start_on_odd=True
         )
         
-        # 2. Add front matter if present
+        # 2. Add front matter if present; it shares one frontmatter page group with
+        # the table of contents, so their page numbering runs on
+        content_parts.append('<div class="frontmatter-container" id="frontmatter">')
         if frontmatter:
-            frontmatter_html = f'<div class="frontmatter-container">{HtmlGenerator.create_frontmatter_html(frontmatter)}</div>'
-            content_parts, dynamic_css, state = HtmlGenerator.add_section(
-                content_parts, dynamic_css, state,
+            frontmatter_html = HtmlGenerator.create_frontmatter_html(frontmatter)
+            content_parts, state = HtmlGenerator.add_section(
+                content_parts, state,
                 "Front matter", frontmatter_html,
-                start_on_odd=True, reset_counter=True
+                start_on_odd=True
             )
         
         # 3. Add table of contents - pass language_code
-        toc_html = f'<div class="frontmatter-container">{HtmlGenerator.create_table_of_contents(lessons, language_code)}</div>'
-        content_parts, dynamic_css, state = HtmlGenerator.add_section(
-            content_parts, dynamic_css, state,
+        toc_html = HtmlGenerator.create_table_of_contents(lessons, language_code)
+        content_parts, state = HtmlGenerator.add_section(
+            content_parts, state,
             "Table of contents", toc_html,
-            start_on_odd=True, reset_counter=False
+            start_on_odd=True
         )
+        content_parts.append('</div>')
         
         # 4. Add main content (lessons)
         main_content_html = '<div class="mainmatter-container">'
         
-        # Add each lesson - pass language_code
+        # Add each lesson - pass language_code; unchanged lessons come from the fragment cache
+        fragment_cache = FragmentCache.shared(config['cache_dir']) if config and config.get('cache_dir') else None
+        hits = fragment_cache.hits if fragment_cache else 0
         for lesson in lessons:
-            main_content_html += f'<div id="lesson-{lesson["number"]}">{HtmlGenerator.create_lesson_html(lesson, language_code)}</div>'
+            main_content_html += f'<div id="lesson-{lesson.number}">{HtmlGenerator.create_lesson_html_cached(lesson, language_code, fragment_cache)}</div>'
+        if fragment_cache:
+            print(f"Lesson HTML: {fragment_cache.hits - hits} of {len(lessons)} lessons from cache")
         
         # Add back matter if present
         if backmatter:
@@ -705,10 +612,10 @@ class HtmlGenerator:
         # Close main content container
         main_content_html += '</div>'
         
-        content_parts, dynamic_css, state = HtmlGenerator.add_section(
-            content_parts, dynamic_css, state,
+        content_parts, state = HtmlGenerator.add_section(
+            content_parts, state,
             "Main content", main_content_html,
-            start_on_odd=True, reset_counter=True
+            start_on_odd=True
         )
         
         # 5. Add blank pages to ensure total is divisible by 4
@@ -720,20 +627,28 @@ class HtmlGenerator:
             for i in range(blank_pages_needed):
                 blank_html += '<div class="blank-page" style="page-break-after: always; height: 100vh;"></div>'
             
-            content_parts, dynamic_css, state = HtmlGenerator.add_section(
-                content_parts, dynamic_css, state,
+            content_parts, state = HtmlGenerator.add_section(
+                content_parts, state,
                 "Padding blank pages", blank_html,
-                start_on_odd=False, reset_counter=False
+                start_on_odd=False
             )
         
         # 6. Add back cover if provided
-        if back_cover_svg_path:
-            back_cover_html = HtmlGenerator.create_back_cover(back_cover_svg_path)
-            content_parts, dynamic_css, state = HtmlGenerator.add_section(
-                content_parts, dynamic_css, state,
+        if back_cover_svg_path or back_cover_svg:
+            back_cover_html = HtmlGenerator.create_back_cover(back_cover_svg_path, config, back_cover_svg)
+            content_parts, state = HtmlGenerator.add_section(
+                content_parts, state,
                 "Back cover", back_cover_html,
-                start_on_odd=False, reset_counter=False
+                start_on_odd=False
             )
         
         # Generate the complete HTML document
-        return HtmlGenerator.create_debug_html_with_css(content_parts, dynamic_css)
\ No newline at end of file
+        html = HtmlGenerator.create_debug_html_with_css(content_parts, dynamic_css)
+        
+        # Production output: minified, without debug comments, inline styles or unused CSS
+        if config and config.get('lean_html'):
+            lean_html = HtmlOptimizer.optimize(html)
+            print(f"Lean HTML: {len(lean_html)} characters (from {len(html)})")
+            html = lean_html
+        
+        return html
\ No newline at end of file
@@ -0,0 +1,323 @@
+"""
+Lean HTML Output for Sabbath School Lessons PDF
+
+This module shrinks the generated document before it is handed to WeasyPrint:
+it strips debug comments, moves inline styles to classes, prunes CSS rules
+that cannot match the document and minifies the HTML and CSS.
+"""
+
+import re
+
+
+class HtmlOptimizer:
+    """Produces a lean version of a generated HTML document."""
+
+    # Elements whose surrounding whitespace never renders
+    BLOCK_TAGS = frozenset([
+        '!doctype', 'html', 'head', 'body', 'meta', 'title', 'style', 'link', 'div', 'p', 'table',
+        'thead', 'tbody', 'tr', 'td', 'th', 'ul', 'ol', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+        'blockquote', 'hr', 'br', 'dl', 'dt', 'dd'
+    ])
+
+    # Content kept exactly as generated: SVG has its own styling, pre and textarea keep whitespace
+    PROTECTED_PATTERN = re.compile(r'<(svg|pre|textarea)\b.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+    COMMENT_PATTERN = re.compile(r'<!--.*?-->', re.DOTALL)
+    STYLE_BLOCK_PATTERN = re.compile(r'<style[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+    TAG_PATTERN = re.compile(r'(<[^>]*>)')
+    TAG_NAME_PATTERN = re.compile(r'<\s*/?\s*([!\w-]+)')
+    STYLE_ATTR_PATTERN = re.compile(r'\sstyle="([^"]*)"')
+    CLASS_ATTR_PATTERN = re.compile(r'\sclass="([^"]*)"')
+    ID_ATTR_PATTERN = re.compile(r'\sid="([^"]*)"')
+
+    # HTML whitespace (unlike \s, this leaves non-breaking spaces alone)
+    WHITESPACE_PATTERN = re.compile(r'[ \t\r\n\f]+')
+
+    # CSS strings are kept verbatim; comments outside them are dropped
+    CSS_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+
+    # Prefix of the classes that replace inline styles
+    STYLE_CLASS_PREFIX = 'inline-style-'
+
+    @staticmethod
+    def optimize(html):
+        """
+        Produce the lean version of a complete HTML document
+
+        Args:
+            html (str): HTML document with <style> blocks in the head
+
+        Returns:
+            str: Minified document with pruned CSS
+        """
+        protected = []
+
+        def protect(match):
+            protected.append(match.group(0))
+            return f"\ue001{len(protected) - 1}\ue001"
+
+        html = HtmlOptimizer.PROTECTED_PATTERN.sub(protect, html)
+        html = HtmlOptimizer.COMMENT_PATTERN.sub('', html)
+
+        css = '\n'.join(HtmlOptimizer.STYLE_BLOCK_PATTERN.findall(html))
+        html = HtmlOptimizer.STYLE_BLOCK_PATTERN.sub('', html)
+
+        html, style_rules = HtmlOptimizer.inline_styles_to_classes(html)
+        features = HtmlOptimizer.collect_features(html + ''.join(protected))
+        css = HtmlOptimizer.prune_css(css, features) + style_rules
+
+        html = HtmlOptimizer.minify_html(html)
+        html = html.replace('</head>', f"<style>{HtmlOptimizer.minify_css(css)}</style></head>", 1)
+
+        return re.sub('\ue001(\\d+)\ue001', lambda match: protected[int(match.group(1))], html)
+
+    @staticmethod
+    def inline_styles_to_classes(html):
+        """
+        Replace style attributes with generated classes
+
+        The generated rules are marked !important so they still win over the
+        stylesheet, as the inline styles did.
+
+        Args:
+            html (str): HTML content
+
+        Returns:
+            tuple: (HTML without style attributes, CSS rules for the generated classes)
+        """
+        classes = {}
+
+        def replace_tag(match):
+            tag = match.group(0)
+            style_match = HtmlOptimizer.STYLE_ATTR_PATTERN.search(tag)
+            if not style_match:
+                return tag
+
+            declarations = [item.strip() for item in style_match.group(1).split(';') if item.strip()]
+            tag = tag[:style_match.start()] + tag[style_match.end():]
+            if not declarations:
+                return tag
+
+            style = ';'.join(declarations)
+            if style not in classes:
+                classes[style] = f"{HtmlOptimizer.STYLE_CLASS_PREFIX}{len(classes) + 1}"
+            class_name = classes[style]
+
+            class_match = HtmlOptimizer.CLASS_ATTR_PATTERN.search(tag)
+            if class_match:
+                return f'{tag[:class_match.start(1)]}{class_match.group(1)} {class_name}{tag[class_match.end(1):]}'
+            name_end = HtmlOptimizer.TAG_NAME_PATTERN.match(tag).end()
+            return f'{tag[:name_end]} class="{class_name}"{tag[name_end:]}'
+
+        html = HtmlOptimizer.TAG_PATTERN.sub(replace_tag, html)
+
+        rules = []
+        for style, class_name in classes.items():
+            declarations = ';'.join(
+                declaration if declaration.endswith('!important') else f"{declaration} !important"
+                for declaration in style.split(';')
+            )
+            rules.append(f"\n.{class_name} {{{declarations}}}")
+        return html, ''.join(rules)
+
+    @staticmethod
+    def collect_features(html):
+        """
+        Collect the tag names, classes and ids used in a document
+
+        Args:
+            html (str): HTML content
+
+        Returns:
+            dict: 'tags', 'classes' and 'ids' sets
+        """
+        features = {'tags': set(), 'classes': set(), 'ids': set()}
+        for tag in HtmlOptimizer.TAG_PATTERN.findall(html):
+            name_match = HtmlOptimizer.TAG_NAME_PATTERN.match(tag)
+            if name_match:
+                features['tags'].add(name_match.group(1).lower())
+            for class_attr in HtmlOptimizer.CLASS_ATTR_PATTERN.findall(tag):
+                features['classes'].update(class_attr.split())
+            features['ids'].update(HtmlOptimizer.ID_ATTR_PATTERN.findall(tag))
+        return features
+
+    @staticmethod
+    def selector_may_match(selector, features):
+        """
+        Check whether a selector could match the document
+
+        Only the tag names, classes and ids a selector requires are checked, so a
+        selector is kept whenever it might match.
+
+        Args:
+            selector (str): A single CSS selector
+            features (dict): Result of collect_features()
+
+        Returns:
+            bool: False if the selector certainly matches nothing
+        """
+        # Pseudo-classes, pseudo-elements and attribute conditions never rule a selector out
+        selector = re.sub(r'::?[\w-]+(\([^)]*\))?', ' ', selector)
+        selector = re.sub(r'\[[^\]]*\]', ' ', selector)
+
+        if any(name not in features['classes'] for name in re.findall(r'\.([\w-]+)', selector)):
+            return False
+        if any(name not in features['ids'] for name in re.findall(r'#([\w-]+)', selector)):
+            return False
+        tags = re.findall(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)', selector)
+        return all(tag.lower() in features['tags'] for tag in tags)
+
+    @staticmethod
+    def split_rules(css):
+        """
+        Split a stylesheet into its top-level rules
+
+        Args:
+            css (str): Stylesheet without comments
+
+        Returns:
+            list: (prelude, block) tuples; block is None for statements like @import
+        """
+        rules = []
+        position = 0
+        length = len(css)
+        while position < length:
+            start = position
+            # Read the prelude up to its block or terminating semicolon
+            while position < length and css[position] not in '{;':
+                if css[position] in '"\'':
+                    position = HtmlOptimizer._skip_string(css, position)
+                else:
+                    position += 1
+            prelude = css[start:position].strip()
+            if position >= length:
+                if prelude:
+                    rules.append((prelude, None))
+                break
+            if css[position] == ';':
+                rules.append((prelude, None))
+                position += 1
+                continue
+
+            # Find the matching closing brace
+            depth = 0
+            block_start = position + 1
+            while position < length:
+                char = css[position]
+                if char in '"\'':
+                    position = HtmlOptimizer._skip_string(css, position)
+                    continue
+                if char == '{':
+                    depth += 1
+                elif char == '}':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                position += 1
+            rules.append((prelude, css[block_start:position]))
+            position += 1
+        return rules
+
+    @staticmethod
+    def _skip_string(css, position):
+        """Get the position just after the CSS string starting at position"""
+        quote = css[position]
+        position += 1
+        while position < len(css) and css[position] != quote:
+            position += 2 if css[position] == '\\' else 1
+        return position + 1
+
+    @staticmethod
+    def strip_css_comments(css):
+        """
+        Remove comments from a stylesheet, leaving strings intact
+
+        Args:
+            css (str): Stylesheet
+
+        Returns:
+            str: Stylesheet without comments
+        """
+        return HtmlOptimizer.CSS_STRING_OR_COMMENT.sub(lambda match: match.group(1) or '', css)
+
+    @staticmethod
+    def prune_css(css, features):
+        """
+        Drop style rules whose selectors cannot match the document
+
+        At-rules are kept, except that @media blocks are pruned recursively
+        (and dropped once empty).
+
+        Args:
+            css (str): Stylesheet
+            features (dict): Result of collect_features()
+
+        Returns:
+            str: Pruned stylesheet
+        """
+        kept = []
+        for prelude, block in HtmlOptimizer.split_rules(HtmlOptimizer.strip_css_comments(css)):
+            if block is None:
+                kept.append(f"{prelude};")
+            elif prelude.lower().startswith('@media'):
+                inner = HtmlOptimizer.prune_css(block, features)
+                if inner.strip():
+                    kept.append(f"{prelude} {{{inner}}}")
+            elif prelude.startswith('@'):
+                kept.append(f"{prelude} {{{block}}}")
+            else:
+                selectors = [selector.strip() for selector in prelude.split(',')]
+                selectors = [selector for selector in selectors if HtmlOptimizer.selector_may_match(selector, features)]
+                if selectors:
+                    kept.append(f"{','.join(selectors)} {{{block}}}")
+        return '\n'.join(kept)
+
+    @staticmethod
+    def minify_css(css):
+        """
+        Collapse the whitespace of a stylesheet, leaving strings intact
+
+        Args:
+            css (str): Stylesheet
+
+        Returns:
+            str: Minified stylesheet
+        """
+        parts = re.split(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')', HtmlOptimizer.strip_css_comments(css))
+        for index in range(0, len(parts), 2):
+            text = re.sub(r'\s+', ' ', parts[index])
+            parts[index] = re.sub(r'\s*([{};])\s*', r'\1', text)
+        return ''.join(parts).strip()
+
+    @staticmethod
+    def minify_html(html):
+        """
+        Collapse whitespace in HTML, dropping it entirely next to block elements
+
+        Args:
+            html (str): HTML content (without pre, textarea or svg content)
+
+        Returns:
+            str: Minified HTML
+        """
+        tokens = HtmlOptimizer.TAG_PATTERN.split(html)
+
+        def is_block(tag):
+            name_match = HtmlOptimizer.TAG_NAME_PATTERN.match(tag) if tag else None
+            return bool(name_match) and name_match.group(1).lower() in HtmlOptimizer.BLOCK_TAGS
+
+        # Tokens alternate: text, tag, text, ..., text
+        for index in range(0, len(tokens), 2):
+            text = tokens[index]
+            if not text:
+                continue
+            previous_tag = tokens[index - 1] if index > 0 else None
+            next_tag = tokens[index + 1] if index + 1 < len(tokens) else None
+            if not HtmlOptimizer.WHITESPACE_PATTERN.sub('', text):
+                if previous_tag is None or next_tag is None or is_block(previous_tag) or is_block(next_tag):
+                    tokens[index] = ''
+                else:
+                    tokens[index] = ' '
+            else:
+                tokens[index] = HtmlOptimizer.WHITESPACE_PATTERN.sub(' ', text)
+        return ''.join(tokens)
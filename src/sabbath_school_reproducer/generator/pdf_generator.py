@@ -7,11 +7,35 @@ This module handles the final conversion from HTML to PDF with specific paginati
 import os
 import tempfile
 from weasyprint import HTML, CSS, Document
+from weasyprint.text.fonts import FontConfiguration
+
+from sabbath_school_reproducer.generator.booklet import BookletImposer
+from sabbath_school_reproducer.generator.font_cache import FontSubsetCache
+from sabbath_school_reproducer.generator.pdf_optimizer import PdfOptimizer
+from sabbath_school_reproducer.generator.pdf_splitter import PdfSplitter
 
 
 class PdfGenerator:
     """Handles conversion of HTML to PDF with pagination control."""
     
+    # Font configuration shared by every render in the process
+    _font_config = None
+    
+    @staticmethod
+    def get_font_config():
+        """
+        Get the process-wide WeasyPrint font configuration
+        
+        Building a FontConfiguration loads the system font list, so one is
+        created per process and reused by every edition rendered in it.
+        
+        Returns:
+            FontConfiguration: Shared font configuration
+        """
+        if PdfGenerator._font_config is None:
+            PdfGenerator._font_config = FontConfiguration()
+        return PdfGenerator._font_config
+    
     @staticmethod
     def count_pages_in_document(document):
         """
@@ -25,6 +49,56 @@ class PdfGenerator:
         """
         return len(document.pages)
     
+    @staticmethod
+    def get_anchor_pages(document):
+        """
+        Get the page each anchor (element id) landed on in a rendered document
+        
+        Args:
+            document (Document): WeasyPrint document
+            
+        Returns:
+            dict: Anchor name -> 1-based page number in the document
+        """
+        anchor_pages = {}
+        for page_number, page in enumerate(document.pages, 1):
+            for anchor in page.anchors:
+                anchor_pages.setdefault(anchor, page_number)
+        return anchor_pages
+    
+    @staticmethod
+    def verify_toc_pages(document, prefix='lesson-'):
+        """
+        Check that every table of contents link resolved to a page during layout
+        
+        The table of contents gets its page numbers from target-counter(), so
+        this reads the resolved pages back from the same rendered document
+        instead of laying it out a second time.
+        
+        Args:
+            document (Document): WeasyPrint document
+            prefix (str): Anchor name prefix of table of contents entries
+            
+        Returns:
+            dict: Link target -> 1-based page number in the document (None if unresolved)
+        """
+        anchor_pages = PdfGenerator.get_anchor_pages(document)
+        toc_pages = {}
+        for page in document.pages:
+            for link_type, target, *_ in page.links:
+                if link_type == 'internal' and target.startswith(prefix):
+                    toc_pages.setdefault(target, anchor_pages.get(target))
+        
+        unresolved = [target for target, page_number in toc_pages.items() if page_number is None]
+        if unresolved:
+            print(f"Warning: Table of contents entries without a target: {', '.join(unresolved)}")
+        
+        ordered = [page_number for page_number in toc_pages.values() if page_number is not None]
+        if ordered != sorted(ordered):
+            print("Warning: Table of contents entries are not in page order")
+        
+        return toc_pages
+    
     @staticmethod
     def create_section_document(html_content):
         """
@@ -118,6 +192,49 @@ p {
             f.write(css_content)
         return css_path
     
+    @staticmethod
+    def write_booklet(document, output_pdf, config=None, **options):
+        """
+        Write the imposed booklet next to the reader PDF, if the config asks for one
+        
+        Args:
+            document (Document): Rendered WeasyPrint document
+            output_pdf (str): Path of the reader PDF
+            config (dict, optional): Configuration dictionary (booklet, booklet_signature, booklet_creep)
+            **options: Options passed on to Document.write_pdf()
+            
+        Returns:
+            str or None: Path to the booklet PDF, or None if no booklet was requested
+        """
+        if not config or not config.get('booklet'):
+            return None
+        
+        booklet_pdf = output_pdf.replace('.pdf', '_booklet.pdf')
+        BookletImposer.write_booklet(document, booklet_pdf, config, **options)
+        return booklet_pdf
+    
+    @staticmethod
+    def write_sections(document, output_pdf, config=None, **options):
+        """
+        Write each lesson and the front and back matter as separate PDFs, if the config asks for them
+        
+        The sections are cut from the same layout as the full PDF.
+        
+        Args:
+            document (Document): Rendered WeasyPrint document
+            output_pdf (str): Path of the full PDF
+            config (dict, optional): Configuration dictionary (split_lessons, jobs)
+            **options: Options passed on to Document.write_pdf()
+            
+        Returns:
+            list: Paths to the section PDFs (empty if no split was requested)
+        """
+        if not config or not config.get('split_lessons'):
+            return []
+        
+        anchor_pages = PdfGenerator.get_anchor_pages(document)
+        return PdfSplitter.write_sections(document, output_pdf, anchor_pages, config.get('jobs'), **options)
+    
     @staticmethod
     def generate_pdf(html_content, output_pdf, config=None):
         """
@@ -149,8 +266,13 @@ p {
             # Create CSS file with pagination rules
             css_path = PdfGenerator.add_css_for_pagination(temp_dir)
             
-            # Count pages in the document for verification
-            doc = PdfGenerator.create_section_document(html_content)
+            # Lay the document out once; the same render is verified and written
+            font_config = PdfGenerator.get_font_config()
+            doc = HTML(string=html_content).render(
+                stylesheets=[CSS(filename=css_path, font_config=font_config)],
+                font_config=font_config,
+                **PdfOptimizer.render_options(config)
+            )
             page_count = PdfGenerator.count_pages_in_document(doc)
             
             # Check if page count is divisible by 4 (for booklet printing)
@@ -159,11 +281,37 @@ p {
                 print(f"Warning: Page count ({page_count}) is not divisible by 4. "
                       f"Adding {4 - remainder} padding pages for proper booklet printing.")
             
-            # Generate PDF with the custom CSS
-            HTML(string=html_content).write_pdf(
-                output_pdf,
-                stylesheets=[CSS(filename=css_path)]
-            )
+            # Table of contents page numbers were resolved by target-counter() during layout
+            toc_pages = PdfGenerator.verify_toc_pages(doc)
+            if toc_pages:
+                print(f"Table of contents: {sum(1 for page in toc_pages.values() if page)} of {len(toc_pages)} entries resolved")
+            
+            # Write the PDF from the rendered document. Fonts are either embedded
+            # whole (the same superset for every edition) or subset through a cache
+            options = PdfOptimizer.write_options(config)
+            if config and config.get('full_fonts'):
+                doc.write_pdf(output_pdf, **options)
+                booklet_pdf = PdfGenerator.write_booklet(doc, output_pdf, config, **options)
+                section_pdfs = PdfGenerator.write_sections(doc, output_pdf, config, **options)
+            else:
+                font_cache = FontSubsetCache.shared(config.get('cache_dir') if config else None)
+                hits, misses = font_cache.hits, font_cache.misses
+                with font_cache.installed():
+                    doc.write_pdf(output_pdf, **options)
+                    booklet_pdf = PdfGenerator.write_booklet(doc, output_pdf, config, **options)
+                    section_pdfs = PdfGenerator.write_sections(doc, output_pdf, config, **options)
+                subsets = font_cache.hits - hits + font_cache.misses - misses
+                print(f"Font subsets: {font_cache.hits - hits} of {subsets} from cache")
+            
+            if booklet_pdf:
+                print(f"Booklet PDF created: {booklet_pdf}")
+            if section_pdfs:
+                print(f"Section PDFs created: {len(section_pdfs)} in {os.path.dirname(section_pdfs[0])}")
+            
+            # Linearize the reader PDF for fast first page display over HTTP
+            if config and config.get('linearize_pdf'):
+                if PdfOptimizer.linearize(output_pdf):
+                    print(f"Linearized {output_pdf} for fast web view")
             
             print(f"PDF created successfully: {output_pdf} with {page_count} pages")
             return output_pdf
@@ -172,7 +320,7 @@ p {
             print(f"Error generating PDF: {str(e)}")
             # Try without custom CSS as fallback
             try:
-                HTML(string=html_content).write_pdf(output_pdf)
+                HTML(string=html_content).write_pdf(output_pdf, font_config=PdfGenerator.get_font_config())
                 print(f"PDF created with fallback method: {output_pdf}")
                 return output_pdf
             except Exception as e2:
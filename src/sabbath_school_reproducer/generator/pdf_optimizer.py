@@ -0,0 +1,225 @@
+"""
+PDF Output Optimization for Sabbath School Lessons
+
+WeasyPrint writes each image, pattern and font object as it meets it, so the
+same artwork reached through different URLs, or identical font and ToUnicode
+streams, end up stored more than once. This module merges identical objects
+while the PDF is written, keeps WeasyPrint's compressed object streams and
+lossless image optimization on, and can linearize the result for fast first
+page display when the PDF is served over HTTP.
+"""
+
+import os
+import re
+
+import pydyf
+
+
+class PdfOptimizer:
+    """Shrinks the PDFs written from rendered documents."""
+
+    # Serialized indirect reference, e.g. b'12 0 R'
+    REFERENCE_PATTERN = re.compile(rb'^(\d+) 0 R$')
+
+    # Dictionaries that may be merged; pages and the document structure never are
+    MERGEABLE_TYPES = ('/Font', '/FontDescriptor', '/ExtGState', '/Pattern', '/Shading')
+
+    @staticmethod
+    def replace_references(value, replacements):
+        """
+        Point the references inside a PDF value at their replacement objects
+
+        Args:
+            value: PDF value (dict, list, bytes, ...) to update in place
+            replacements (dict): Old object number -> new object number
+
+        Returns:
+            The updated value
+        """
+        if isinstance(value, bytes):
+            match = PdfOptimizer.REFERENCE_PATTERN.match(value)
+            if match and int(match.group(1)) in replacements:
+                return f'{replacements[int(match.group(1))]} 0 R'.encode()
+            return value
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = PdfOptimizer.replace_references(item, replacements)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = PdfOptimizer.replace_references(item, replacements)
+        return value
+
+    @staticmethod
+    def mergeable_objects(pdf):
+        """
+        Get the objects of a PDF that may be replaced by an identical copy
+
+        Page content streams and pages stay distinct, since a page tree cannot
+        list the same page twice.
+
+        Args:
+            pdf (pydyf.PDF): PDF being written
+
+        Returns:
+            list: Mergeable objects, in object order
+        """
+        contents = set()
+        for number in pdf.pages['Kids'][::3]:
+            page_contents = pdf.objects[number].get('Contents')
+            if isinstance(page_contents, bytes):
+                match = PdfOptimizer.REFERENCE_PATTERN.match(page_contents)
+                if match:
+                    contents.add(int(match.group(1)))
+
+        objects = []
+        for obj in pdf.objects:
+            if obj.free == 'f' or obj.number in contents:
+                continue
+            if isinstance(obj, pydyf.Stream):
+                objects.append(obj)
+            elif isinstance(obj, pydyf.Dictionary) and obj.get('Type') in PdfOptimizer.MERGEABLE_TYPES:
+                objects.append(obj)
+        return objects
+
+    @staticmethod
+    def object_key(obj):
+        """
+        Get the serialized form two objects share when they are identical
+
+        Streams are compared uncompressed, so nothing is compressed twice.
+
+        Args:
+            obj (pydyf.Object): Stream or dictionary
+
+        Returns:
+            bytes: Comparison key
+        """
+        if not isinstance(obj, pydyf.Stream):
+            return obj.data
+        compress = obj.compress
+        obj.compress = False
+        try:
+            return (b'1' if compress else b'0') + obj.data
+        finally:
+            obj.compress = compress
+
+    @staticmethod
+    def deduplicate(pdf):
+        """
+        Merge identical streams and resource dictionaries of a PDF being written
+
+        Objects are compared by their serialized data, and merging repeats
+        until nothing changes, since fonts only become identical once their
+        descriptors and font files have been merged.
+
+        Args:
+            pdf (pydyf.PDF): PDF being written
+
+        Returns:
+            int: Number of objects removed
+        """
+        removed = 0
+        while True:
+            kept = {}
+            replacements = {}
+            for obj in PdfOptimizer.mergeable_objects(pdf):
+                data = PdfOptimizer.object_key(obj)
+                if data in kept:
+                    replacements[obj.number] = kept[data].number
+                else:
+                    kept[data] = obj
+            if not replacements:
+                return removed
+
+            for obj in pdf.objects:
+                if obj.number in replacements:
+                    obj.free = 'f'
+                elif hasattr(obj, 'extra'):
+                    PdfOptimizer.replace_references(obj.extra, replacements)
+                elif isinstance(obj, (dict, list)):
+                    PdfOptimizer.replace_references(obj, replacements)
+            removed += len(replacements)
+
+    @staticmethod
+    def finisher(document, pdf):
+        """
+        WeasyPrint finisher that merges duplicate objects before the PDF is written
+
+        Args:
+            document (Document): Rendered WeasyPrint document
+            pdf (pydyf.PDF): PDF being written
+        """
+        removed = PdfOptimizer.deduplicate(pdf)
+        if removed:
+            print(f"PDF optimization: merged {removed} duplicate objects")
+
+    @staticmethod
+    def render_options(config=None):
+        """
+        Get the HTML.render() options for the configured output optimization
+
+        Images are loaded during layout, so their lossless optimization is a render option.
+
+        Args:
+            config (dict, optional): Configuration dictionary (optimize_pdf)
+
+        Returns:
+            dict: Options for HTML.render()
+        """
+        if config and config.get('optimize_pdf'):
+            return {'optimize_images': True}
+        return {}
+
+    @staticmethod
+    def write_options(config=None):
+        """
+        Get the Document.write_pdf() options for the configured output optimization
+
+        Args:
+            config (dict, optional): Configuration dictionary (optimize_pdf, full_fonts)
+
+        Returns:
+            dict: Options for Document.write_pdf()
+        """
+        options = {}
+        if config and config.get('full_fonts'):
+            options['full_fonts'] = True
+        if config and config.get('optimize_pdf'):
+            # Compressed object streams are WeasyPrint's default; keep them explicitly
+            options.update(finisher=PdfOptimizer.finisher, uncompressed_pdf=False)
+        return options
+
+    @staticmethod
+    def linearize(pdf_path):
+        """
+        Rewrite a PDF linearized ("fast web view") for progressive display over HTTP
+
+        Requires the optional pikepdf package.
+
+        Args:
+            pdf_path (str): PDF to rewrite in place
+
+        Returns:
+            bool: True if the PDF was linearized
+        """
+        try:
+            import pikepdf
+        except ImportError:
+            print("Warning: linearize_pdf requires the pikepdf package; PDF left as written")
+            return False
+
+        temp_path = pdf_path + '.tmp'
+        try:
+            with pikepdf.open(pdf_path) as pdf:
+                pdf.save(
+                    temp_path,
+                    linearize=True,
+                    object_stream_mode=pikepdf.ObjectStreamMode.generate
+                )
+            os.replace(temp_path, pdf_path)
+        except Exception as e:
+            print(f"Warning: Could not linearize {pdf_path}: {e}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            return False
+        return True
@@ -0,0 +1,133 @@
+"""
+Per-Lesson PDF Split for Sabbath School Lessons
+
+The web edition offers each lesson, and the front and back matter, as its own
+PDF. Rather than laying the quarterly out once per lesson, this module finds
+where each section landed in the full layout from its anchor (id="lesson-N",
+"frontmatter", "backmatter") and writes the page ranges of that one rendered
+document to separate files, across worker processes where fork is available.
+"""
+
+import os
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Document and write options shared with forked workers
+_split_job = {}
+
+
+def _write_section(name, first, last, path):
+    """
+    Write one section of the document shared with a forked worker
+
+    Args:
+        name (str): Section name
+        first (int): First 1-based page of the section
+        last (int): Last 1-based page of the section
+        path (str): Path to save the section PDF
+
+    Returns:
+        str: Path to the section PDF
+    """
+    document = _split_job['document']
+    document.copy(document.pages[first - 1:last]).write_pdf(path, **_split_job['options'])
+    return path
+
+
+class PdfSplitter:
+    """Splits one rendered document into per-lesson PDFs."""
+
+    # Anchors that start a section
+    SECTION_PATTERN = re.compile(r'^(frontmatter|lesson-\d+|backmatter)$')
+
+    # Anchors that only end the section before them
+    END_ANCHORS = ('back-cover',)
+
+    @staticmethod
+    def section_ranges(anchor_pages, page_count):
+        """
+        Get the page range of each section from the pages its anchors landed on
+
+        A section runs up to the page before the next section (or the back
+        cover); the last one runs to the end of the document. The cover page
+        comes before the first section and is left out.
+
+        Args:
+            anchor_pages (dict): Anchor name -> 1-based page number (see PdfGenerator.get_anchor_pages)
+            page_count (int): Number of pages in the document
+
+        Returns:
+            list: (name, first page, last page) per section, in page order
+        """
+        starts = sorted(
+            (page, name) for name, page in anchor_pages.items()
+            if PdfSplitter.SECTION_PATTERN.match(name) or name in PdfSplitter.END_ANCHORS
+        )
+
+        sections = []
+        for index, (first, name) in enumerate(starts):
+            if name in PdfSplitter.END_ANCHORS:
+                continue
+            last = starts[index + 1][0] - 1 if index + 1 < len(starts) else page_count
+            sections.append((name, first, max(first, last)))
+        return sections
+
+    @staticmethod
+    def section_path(output_pdf, name):
+        """
+        Get the path of a section PDF
+
+        Sections go in a directory named after the full PDF, e.g.
+        output/lessons_sections/lesson-3.pdf for output/lessons.pdf.
+
+        Args:
+            output_pdf (str): Path of the full PDF
+            name (str): Section name
+
+        Returns:
+            str: Path to the section PDF
+        """
+        return os.path.join(re.sub(r'\.pdf$', '', output_pdf) + '_sections', f'{name}.pdf')
+
+    @staticmethod
+    def write_sections(document, output_pdf, anchor_pages, jobs=None, **options):
+        """
+        Write every section of a rendered document to its own PDF
+
+        Workers are forked after layout, so they share the rendered document
+        without copying or pickling it. Where fork is unavailable, or with a
+        single worker, the sections are written one after another.
+
+        Args:
+            document (Document): Rendered WeasyPrint document
+            output_pdf (str): Path of the full PDF
+            anchor_pages (dict): Anchor name -> 1-based page number
+            jobs (int, optional): Worker processes (None or 0 uses every core)
+            **options: Options passed on to Document.write_pdf()
+
+        Returns:
+            list: Paths to the section PDFs, in page order
+        """
+        sections = PdfSplitter.section_ranges(anchor_pages, len(document.pages))
+        if not sections:
+            print("Warning: No lesson anchors found; PDF not split")
+            return []
+
+        paths = [PdfSplitter.section_path(output_pdf, name) for name, _, _ in sections]
+        os.makedirs(os.path.dirname(paths[0]) or '.', exist_ok=True)
+
+        jobs = jobs if jobs and jobs > 0 else os.cpu_count() or 1
+        workers = min(jobs, len(sections))
+        _split_job.update(document=document, options=options)
+        try:
+            names, firsts, lasts = zip(*sections)
+            arguments = (names, firsts, lasts, paths)
+            if workers == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+                return list(map(_write_section, *arguments))
+
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+                return list(pool.map(_write_section, *arguments))
+        finally:
+            _split_job.clear()
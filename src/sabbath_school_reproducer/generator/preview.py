@@ -0,0 +1,142 @@
+"""
+Preview Output for Sabbath School Lessons PDF
+
+This module produces quick previews for editors: the styled HTML document with
+a screen stylesheet that lays sections out as letter-size sheets in the
+browser, and a lesson selection so only the lessons being checked are laid
+out by WeasyPrint.
+"""
+
+import os
+import re
+
+
+# Screen-only stand-in for paged media: sections become letter-size sheets
+PREVIEW_CSS = """
+@media screen {
+    html {
+        background: #8a8580;
+    }
+
+    body {
+        width: 8.5in;
+        margin: 0.5in auto;
+    }
+
+    .cover-page, .back-cover-page, .front-matter, .lesson, .back-matter, .toc-sheet {
+        box-sizing: border-box;
+        width: 8.5in;
+        min-height: 11in;
+        margin: 0 0 0.5in 0;
+        background: #ffffff;
+        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.4);
+    }
+
+    .front-matter, .lesson, .back-matter, .toc-sheet {
+        padding: 0.75in;
+    }
+
+    .cover-page, .back-cover-page {
+        height: 11in;
+        overflow: hidden;
+    }
+
+    /* Blank pages only exist in print */
+    .blank-page {
+        display: none;
+    }
+}
+"""
+
+
+class PreviewGenerator:
+    """Builds browser previews and lesson selections for quick checks."""
+
+    # One lesson number or a range, e.g. "3" or "2-4"
+    RANGE_PATTERN = re.compile(r'^\s*(\d+)\s*(?:-\s*(\d+)\s*)?$')
+
+    @staticmethod
+    def parse_lesson_selection(selection):
+        """
+        Parse a lesson selection such as "3", "2-4" or "1,3,5-6"
+
+        Args:
+            selection (str): Comma separated lesson numbers and ranges
+
+        Returns:
+            set: Selected lesson numbers
+
+        Raises:
+            ValueError: If the selection is malformed
+        """
+        numbers = set()
+        for item in selection.split(','):
+            match = PreviewGenerator.RANGE_PATTERN.match(item)
+            if not match:
+                raise ValueError(f"Invalid lesson selection: {item.strip()!r}")
+            first = int(match.group(1))
+            last = int(match.group(2) or first)
+            numbers.update(range(first, last + 1))
+        return numbers
+
+    @staticmethod
+    def select_lessons(content_data, selection):
+        """
+        Keep only the selected lessons of the processed content
+
+        Front and back matter are left out, so the preview covers just the lessons.
+
+        Args:
+            content_data (dict): Content data with lessons, frontmatter and backmatter
+            selection (str): Lesson selection (see parse_lesson_selection)
+
+        Returns:
+            dict: Content data with the selected lessons
+        """
+        numbers = PreviewGenerator.parse_lesson_selection(selection)
+
+        def lesson_number(lesson):
+            number = lesson['number'] if isinstance(lesson, dict) else lesson.number
+            return int(number) if str(number).isdigit() else None
+
+        lessons = [lesson for lesson in content_data['lessons'] if lesson_number(lesson) in numbers]
+        if not lessons:
+            print(f"Warning: No lessons match the selection {selection!r}")
+
+        return dict(content_data, lessons=lessons, frontmatter='', backmatter='')
+
+    @staticmethod
+    def create_preview_html(html_content):
+        """
+        Add the screen preview stylesheet to a generated HTML document
+
+        Args:
+            html_content (str): Complete HTML document from HtmlGenerator.generate_html()
+
+        Returns:
+            str: HTML document to open in a browser
+        """
+        # The table of contents has no container of its own; give it a sheet
+        html_content = html_content.replace('<div class="toc-title">', '<div class="toc-sheet"><div class="toc-title">', 1)
+        html_content = html_content.replace('<div class="sectionbreaknone"></div>', '<div class="sectionbreaknone"></div></div>', 1)
+        return html_content.replace('</head>', f"<style>{PREVIEW_CSS}</style></head>", 1)
+
+    @staticmethod
+    def write_preview(html_content, output_pdf):
+        """
+        Write the preview HTML next to the PDF that would be generated
+
+        Args:
+            html_content (str): Complete HTML document from HtmlGenerator.generate_html()
+            output_pdf (str): Path of the PDF for a full build
+
+        Returns:
+            str: Path to the preview HTML file
+        """
+        preview_path = re.sub(r'(_preview)?\.pdf$', '', output_pdf) + '_preview.html'
+        output_dir = os.path.dirname(preview_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(preview_path, 'w', encoding='utf-8') as f:
+            f.write(PreviewGenerator.create_preview_html(html_content))
+        return preview_path
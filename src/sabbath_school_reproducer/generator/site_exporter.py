@@ -0,0 +1,314 @@
+"""
+Static Website Export for Sabbath School Lessons
+
+The web edition is built from the same parsed lessons and lesson HTML fragments
+as the PDF, without any page layout: one page per lesson, plus an index with
+the front matter and table of contents and a back matter page. The stylesheet
+and cover are written under content-hashed names so they can be cached for
+good, and text files can be precompressed for servers that serve .gz/.br files.
+"""
+
+import os
+import re
+import gzip
+import html
+import hashlib
+
+from sabbath_school_reproducer.generator.css_styles import CSS_TEMPLATE, CssUpdater
+from sabbath_school_reproducer.generator.html_generator import HtmlGenerator
+from sabbath_school_reproducer.models import Lesson
+from sabbath_school_reproducer.utils.cache import FragmentCache
+from sabbath_school_reproducer.utils.language_utils import LanguageConfig
+
+
+# Screen styles layered over the print stylesheet, for phones first
+SITE_CSS = """
+body {
+    max-width: 42em;
+    margin: 0 auto;
+    padding: 1em;
+    font-size: 1rem;
+    line-height: 1.5;
+}
+
+img, svg {
+    max-width: 100%;
+    height: auto;
+}
+
+.site-cover {
+    display: block;
+    margin: 0 auto 1em auto;
+}
+
+.site-nav {
+    display: flex;
+    justify-content: space-between;
+    gap: 1em;
+    margin: 1em 0;
+}
+
+/* Page numbers only exist in print */
+.toc-table td:last-child {
+    display: none;
+}
+
+.toc-table {
+    width: 100%;
+}
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="{language}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{stylesheet}">
+</head>
+<body>
+{content}
+</body>
+</html>
+"""
+
+NAV_TEMPLATE = '<nav class="site-nav">{links}</nav>'
+
+
+class SiteExporter:
+    """Exports a quarter as a static website."""
+
+    # Characters of the content hash kept in asset file names
+    HASH_LENGTH = 10
+
+    # Text files that are worth precompressing
+    COMPRESSIBLE_EXTENSIONS = ('.html', '.css', '.svg')
+
+    # Links from the table of contents to lesson anchors in the PDF
+    LESSON_LINK_PATTERN = re.compile(r'href="#lesson-([^"]+)"')
+
+    @staticmethod
+    def hashed_name(name, data):
+        """
+        Get a file name that changes whenever the file content does
+
+        Args:
+            name (str): Plain file name, e.g. "styles.css"
+            data (bytes): File content
+
+        Returns:
+            str: File name with a content hash, e.g. "styles.3f2a9c1b0d.css"
+        """
+        stem, extension = os.path.splitext(name)
+        digest = hashlib.sha256(data).hexdigest()[:SiteExporter.HASH_LENGTH]
+        return f"{stem}.{digest}{extension}"
+
+    @staticmethod
+    def lesson_page(number):
+        """
+        Get the file name of a lesson page
+
+        Args:
+            number: Lesson number
+
+        Returns:
+            str: File name, e.g. "lesson-3.html"
+        """
+        return f"lesson-{number}.html"
+
+    @staticmethod
+    def get_encodings(config=None):
+        """
+        Get the precompressed encodings to write
+
+        Args:
+            config (dict, optional): Configuration dictionary (site_precompress: true, or a list such as ['gzip', 'br'])
+
+        Returns:
+            list: Encodings, from 'gzip' and 'br'
+        """
+        precompress = config.get('site_precompress') if config else None
+        if not precompress:
+            return []
+        if precompress is True:
+            return ['gzip', 'br']
+        if isinstance(precompress, str):
+            precompress = [precompress]
+        return [encoding for encoding in ('gzip', 'br') if encoding in precompress]
+
+    @staticmethod
+    def precompress(path, data, encodings):
+        """
+        Write precompressed copies of a file next to it
+
+        Brotli requires the optional brotli package.
+
+        Args:
+            path (str): Path of the file
+            data (bytes): File content
+            encodings (list): Encodings to write, from 'gzip' and 'br'
+
+        Returns:
+            list: Paths of the compressed files written
+        """
+        written = []
+        if 'gzip' in encodings:
+            # A fixed mtime keeps the .gz file the same for the same content
+            with open(path + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            written.append(path + '.gz')
+        if 'br' in encodings:
+            try:
+                import brotli
+            except ImportError:
+                print("Warning: .br files require the brotli package; only other encodings written")
+                return written
+            with open(path + '.br', 'wb') as f:
+                f.write(brotli.compress(data))
+            written.append(path + '.br')
+        return written
+
+    @staticmethod
+    def write_file(site_dir, name, data, encodings=()):
+        """
+        Write a site file, and its precompressed copies for text files
+
+        Args:
+            site_dir (str): Site directory
+            name (str): File name
+            data (bytes): File content
+            encodings (iterable): Encodings to precompress with
+
+        Returns:
+            list: Paths written
+        """
+        path = os.path.join(site_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        written = [path]
+        if encodings and name.endswith(SiteExporter.COMPRESSIBLE_EXTENSIONS):
+            written += SiteExporter.precompress(path, data, encodings)
+        return written
+
+    @staticmethod
+    def render_page(title, content, stylesheet, language_code='en'):
+        """
+        Render a complete site page
+
+        Args:
+            title (str): Page title
+            content (str): Page body HTML
+            stylesheet (str): Stylesheet file name
+            language_code (str): Language code
+
+        Returns:
+            str: HTML document
+        """
+        return PAGE_TEMPLATE.format(
+            language=language_code,
+            title=html.escape(title),
+            stylesheet=stylesheet,
+            content=content
+        )
+
+    @staticmethod
+    def render_nav(previous_page=None, next_page=None, language_code='en'):
+        """
+        Render the links between site pages
+
+        Args:
+            previous_page (str, optional): File name of the previous page
+            next_page (str, optional): File name of the next page
+            language_code (str): Language code for translations
+
+        Returns:
+            str: Navigation HTML
+        """
+        links = [
+            f'<a href="{previous_page}">{LanguageConfig.get_translation(language_code, "site.previous", "Previous")}</a>'
+            if previous_page else '<span></span>',
+            f'<a href="index.html">{LanguageConfig.get_translation(language_code, "site.contents", "Contents")}</a>',
+            f'<a href="{next_page}">{LanguageConfig.get_translation(language_code, "site.next", "Next")}</a>'
+            if next_page else '<span></span>',
+        ]
+        return NAV_TEMPLATE.format(links=''.join(links))
+
+    @staticmethod
+    def get_site_dir(config):
+        """
+        Get the directory the site is written to
+
+        Args:
+            config (dict): Configuration dictionary (site_dir, output_file)
+
+        Returns:
+            str: Site directory; next to the PDF, e.g. output/lessons_site for output/lessons.pdf, unless site_dir is set
+        """
+        return config.get('site_dir') or re.sub(r'\.pdf$', '', config['output_file']) + '_site'
+
+    @staticmethod
+    def export_site(content_data, site_dir, config=None, front_cover_svg=None):
+        """
+        Write a quarter as a static website
+
+        Args:
+            content_data (dict): Processed content with lessons, frontmatter and backmatter
+            site_dir (str): Directory to write the site to
+            config (dict, optional): Configuration dictionary (language, title, cache_dir, site_precompress)
+            front_cover_svg (str, optional): Final front cover SVG markup, shown on the index page
+
+        Returns:
+            list: Paths of the files written
+        """
+        config = config or {}
+        language_code = config.get('language', 'en')
+        title = config.get('title') or 'Sabbath School Lessons'
+        encodings = SiteExporter.get_encodings(config)
+        lessons = [Lesson.coerce(lesson) for lesson in content_data['lessons']]
+        os.makedirs(site_dir, exist_ok=True)
+        written = []
+
+        # Stylesheet and cover, under content-hashed names
+        css = CssUpdater.update_css_template(CSS_TEMPLATE, config, content_data) if config else CSS_TEMPLATE
+        css_data = (css + SITE_CSS).encode('utf-8')
+        stylesheet = SiteExporter.hashed_name('styles.css', css_data)
+        written += SiteExporter.write_file(site_dir, stylesheet, css_data, encodings)
+
+        cover_html = ''
+        if front_cover_svg:
+            cover_data = front_cover_svg.encode('utf-8')
+            cover = SiteExporter.hashed_name('cover.svg', cover_data)
+            written += SiteExporter.write_file(site_dir, cover, cover_data, encodings)
+            cover_html = f'<img class="site-cover" src="{cover}" alt="{html.escape(title)}">'
+
+        pages = [SiteExporter.lesson_page(lesson.number) for lesson in lessons]
+        backmatter = content_data.get('backmatter')
+        if backmatter:
+            pages.append('backmatter.html')
+
+        def write_page(name, page_title, content):
+            page = SiteExporter.render_page(page_title, content, stylesheet, language_code)
+            return SiteExporter.write_file(site_dir, name, page.encode('utf-8'), encodings)
+
+        # Index: cover, front matter and the table of contents linking to lesson pages
+        toc_html = HtmlGenerator.create_table_of_contents(lessons, language_code)
+        toc_html = SiteExporter.LESSON_LINK_PATTERN.sub(r'href="lesson-\1.html"', toc_html)
+        index_html = cover_html + HtmlGenerator.create_frontmatter_html(content_data.get('frontmatter')) + toc_html
+        written += write_page('index.html', title, index_html)
+
+        # One page per lesson, from the same (cached) fragments as the PDF
+        fragment_cache = FragmentCache.shared(config['cache_dir']) if config.get('cache_dir') else None
+        for index, lesson in enumerate(lessons):
+            nav = SiteExporter.render_nav(
+                pages[index - 1] if index > 0 else None,
+                pages[index + 1] if index + 1 < len(pages) else None,
+                language_code
+            )
+            lesson_html = HtmlGenerator.create_lesson_html_cached(lesson, language_code, fragment_cache)
+            written += write_page(pages[index], f"{lesson.title} - {title}", nav + lesson_html + nav)
+
+        if backmatter:
+            nav = SiteExporter.render_nav(pages[-2] if len(pages) > 1 else None, None, language_code)
+            written += write_page('backmatter.html', title, nav + HtmlGenerator.create_backmatter_html(backmatter) + nav)
+
+        return written
@@ -1,18 +1,83 @@
 """
 Dynamic SVG Updater for Sabbath School Lessons
 
-This module updates SVG files with dynamic content based on configuration.
+This module updates cover SVGs with dynamic content based on configuration.
+Each SVG is compiled once into a template whose quarter, title and
+attribution text elements are slots, and rendered covers are cached by SVG
+content and cover fields, so every edition in a batch can be customized cheaply.
 """
 
 import re
 import os
-import tempfile
-from datetime import datetime
+import html
+import hashlib
+
+from sabbath_school_reproducer.utils.cache import DiskCache
+
+
+class SvgTemplate:
+    """A cover SVG split into literal markup and replaceable text elements."""
+    
+    # Text elements that can be replaced, matched in one pass over the SVG
+    SLOT_PATTERN = re.compile(
+        r'(?P<quarter><text[^>]*>\s*(?:FIRST|SECOND|THIRD|FOURTH)\s+QUARTER,\s*\d{4}\s*</text>)'
+        r'|(?P<months><text[^>]*>\s*(?:January|April|July|October)\s+-\s+(?:March|June|September|December)\s+\d{4}\s*</text>)'
+        r'|(?P<title><text[^>]*>TOPICAL STUDIES</text>)'
+        r'|(?P<subtitle><text[^>]*>ON THE MESSAGE</text>)'
+        r'|(?P<attribution><text[^>]*>\s*Adapted from[^<]*</text>)'
+    )
+    
+    def __init__(self, svg_content):
+        """
+        Compile an SVG into a template
+        
+        Args:
+            svg_content (str): SVG markup
+        """
+        # Literal markup alternates with (slot name, original element) pairs
+        self.parts = []
+        position = 0
+        for match in self.SLOT_PATTERN.finditer(svg_content):
+            self.parts.append(svg_content[position:match.start()])
+            self.parts.append((match.lastgroup, match.group(0)))
+            position = match.end()
+        
+        # Without an attribution element, an attribution goes before the closing tag
+        closing = svg_content.rfind('</svg>')
+        if 'attribution' not in self.slots and closing >= position:
+            self.parts.append(svg_content[position:closing])
+            self.parts.append(('attribution', ''))
+            position = closing
+        self.parts.append(svg_content[position:])
+    
+    @property
+    def slots(self):
+        """Names of the slots in the template"""
+        return {part[0] for part in self.parts if isinstance(part, tuple)}
+    
+    def render(self, replacements):
+        """
+        Render the SVG, replacing slot elements
+        
+        Args:
+            replacements (dict): Slot name -> new markup; slots without a value keep their element
+            
+        Returns:
+            str: SVG markup
+        """
+        return ''.join(
+            part if isinstance(part, str) else replacements.get(part[0]) or part[1]
+            for part in self.parts
+        )
 
 
 class SvgUpdater:
     """Updates SVG files with dynamic content based on configuration."""
     
+    # Compiled templates and rendered covers, keyed by SVG content hash
+    _templates = {}
+    _rendered = {}
+    
     # Quarter mapping
     QUARTER_NAMES = {
         'q1': 'FIRST QUARTER',
@@ -41,6 +106,10 @@ class SvgUpdater:
         Returns:
             str: Quarter title
         """
+        # Lesson data read back from an existing combined file is plain markdown
+        if not isinstance(lesson_data, dict):
+            lesson_data = None
+        
         # Try to get title from lesson data's front matter
         title = None
         if lesson_data and 'front_matter' in lesson_data:
@@ -65,123 +134,122 @@ class SvgUpdater:
         return title
 
     @staticmethod
-    def update_svg_with_config(svg_path, config, lesson_data=None, is_temporary=False):
+    def get_template(svg_content):
+        """
+        Get the compiled template of an SVG, compiling it on first use
+        
+        Args:
+            svg_content (str): SVG markup
+            
+        Returns:
+            tuple: (SVG content hash, SvgTemplate)
+        """
+        svg_hash = hashlib.sha256(svg_content.encode('utf-8')).hexdigest()
+        template = SvgUpdater._templates.get(svg_hash)
+        if template is None:
+            template = SvgTemplate(svg_content)
+            SvgUpdater._templates[svg_hash] = template
+        return svg_hash, template
+    
+    @staticmethod
+    def get_cover_fields(config, lesson_data=None):
         """
-        Update SVG file with configuration data
+        Collect the text shown on a cover
+        
+        Args:
+            config (dict): Configuration dictionary
+            lesson_data (dict, optional): Optional lesson data dictionary
+            
+        Returns:
+            dict: Cover fields (year, quarter_name, month_range, title, source)
+        """
+        quarter = config['quarter']
+        title = SvgUpdater.get_quarter_title(config, lesson_data)
+        
+        # If reproduction, append source info to title
+        source = None
+        if config.get('reproduce', {}).get('year'):
+            source_quarter_name = SvgUpdater.QUARTER_NAMES.get(config['reproduce']['quarter'], 'QUARTER')
+            source = f"{source_quarter_name}, {config['reproduce']['year']}"
+            
+            # Only append if not already customized
+            if not config.get("title"):
+                title += f" (from {config['reproduce']['year']} {source_quarter_name})"
+        
+        return {
+            'year': config['year'],
+            'quarter_name': SvgUpdater.QUARTER_NAMES.get(quarter, 'QUARTER'),
+            'month_range': SvgUpdater.QUARTER_MONTHS.get(quarter, ''),
+            'title': title,
+            'source': source
+        }
+    
+    @staticmethod
+    def render_svg(svg_content, config, lesson_data=None):
+        """
+        Render a cover SVG with configuration data
+        
+        Args:
+            svg_content (str): SVG markup
+            config (dict): Configuration dictionary
+            lesson_data (dict, optional): Optional lesson data dictionary
+            
+        Returns:
+            str: Updated SVG markup
+        """
+        fields = SvgUpdater.get_cover_fields(config, lesson_data)
+        svg_hash, template = SvgUpdater.get_template(svg_content)
+        key = DiskCache.make_key(svg_hash, sorted(fields.items()))
+        rendered = SvgUpdater._rendered.get(key)
+        if rendered is not None:
+            return rendered
+        
+        text = {name: html.escape(str(value), quote=False) for name, value in fields.items() if value}
+        replacements = {
+            'quarter': f'<text x="400" y="810" font-family="Georgia, serif" font-size="22" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{text["quarter_name"]}, {text["year"]}</text>',
+            'months': f'<text x="400" y="840" font-family="Georgia, serif" font-size="18" text-anchor="middle" fill="#7d2b2b">{text.get("month_range", "")} {text["year"]}</text>',
+        }
+        
+        # Long titles run over the title and subtitle lines
+        title_parts = fields['title'].split(' ', 3)
+        if len(title_parts) > 3:
+            title_lines = (' '.join(title_parts[:3]), title_parts[3])
+        else:
+            title_lines = (fields['title'], None)
+        replacements['title'] = f'<text x="400" y="170" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{html.escape(title_lines[0].upper(), quote=False)}</text>'
+        if title_lines[1]:
+            replacements['subtitle'] = f'<text x="400" y="230" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{html.escape(title_lines[1].upper(), quote=False)}</text>'
+        
+        # Add (or replace) the source attribution if this is a reproduction
+        if fields['source']:
+            replacements['attribution'] = f'<text x="400" y="870" font-family="Georgia, serif" font-size="16" text-anchor="middle" font-style="italic" fill="#666666">Adapted from {text["source"]}</text>\n'
+        
+        rendered = template.render(replacements)
+        SvgUpdater._rendered[key] = rendered
+        return rendered
+    
+    @staticmethod
+    def update_svg_with_config(svg_path, config, lesson_data=None):
+        """
+        Update an SVG file's content with configuration data
+        
+        The file is left unchanged; the updated markup is returned.
         
         Args:
             svg_path (str): Path to SVG file
             config (dict): Configuration dictionary
             lesson_data (dict, optional): Optional lesson data dictionary
-            is_temporary (bool): Whether this is a temporary file
             
         Returns:
-            str: Path to updated SVG file
+            str or None: Updated SVG markup, or None if the file could not be read or updated
         """
-        return
         if not svg_path or not os.path.exists(svg_path):
             return None
             
         try:
             with open(svg_path, 'r', encoding='utf-8') as f:
                 svg_content = f.read()
-            
-            # Get quarter information - use the target year/quarter for display
-            year = config['year']
-            quarter = config['quarter']
-            quarter_name = SvgUpdater.QUARTER_NAMES.get(quarter, 'QUARTER')
-            month_range = SvgUpdater.QUARTER_MONTHS.get(quarter, '')
-            
-            # Get title
-            title = SvgUpdater.get_quarter_title(config, lesson_data)
-            
-            # Check if this is a reproduction
-            is_reproduction = 'reproduce' in config and config['reproduce'].get('year')
-            
-            # If reproduction, append source info to title
-            if is_reproduction:
-                source_year = config['reproduce']['year']
-                source_quarter = config['reproduce']['quarter']
-                source_quarter_name = SvgUpdater.QUARTER_NAMES.get(source_quarter, 'QUARTER')
-                
-                # Only append if not already customized
-                if not config.get("title"):
-                    title += f" (from {source_year} {source_quarter_name})"
-            
-            # Replace relevant text in SVG
-            # Update quarter info
-            svg_content = re.sub(
-                r'<text[^>]*>\s*(?:FIRST|SECOND|THIRD|FOURTH)\s+QUARTER,\s*\d{4}\s*</text>',
-                f'<text x="400" y="810" font-family="Georgia, serif" font-size="22" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{quarter_name}, {year}</text>',
-                svg_content
-            )
-            
-            # Update month range
-            svg_content = re.sub(
-                r'<text[^>]*>\s*(?:January|April|July|October)\s+-\s+(?:March|June|September|December)\s+\d{4}\s*</text>',
-                f'<text x="400" y="840" font-family="Georgia, serif" font-size="18" text-anchor="middle" fill="#7d2b2b">{month_range} {year}</text>',
-                svg_content
-            )
-            
-            # Update title if it exists in SVG
-            if title:
-                # For "TOPICAL STUDIES" or similar main title lines
-                svg_content = re.sub(
-                    r'<text[^>]*>TOPICAL STUDIES</text>',
-                    f'<text x="400" y="170" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{title.upper()}</text>',
-                    svg_content
-                )
-                
-                # For "ON THE MESSAGE" or similar subtitle lines
-                # Only if title is longer than one line, split it
-                title_parts = title.split(' ', 3)
-                if len(title_parts) > 3:
-                    first_line = ' '.join(title_parts[:3])
-                    second_line = ' '.join(title_parts[3:])
-                    
-                    # Replace first line
-                    svg_content = re.sub(
-                        r'<text[^>]*>TOPICAL STUDIES</text>',
-                        f'<text x="400" y="170" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{first_line.upper()}</text>',
-                        svg_content
-                    )
-                    
-                    # Replace second line
-                    svg_content = re.sub(
-                        r'<text[^>]*>ON THE MESSAGE</text>',
-                        f'<text x="400" y="230" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{second_line.upper()}</text>',
-                        svg_content
-                    )
-            
-            # Add source attribution if this is a reproduction
-            if is_reproduction:
-                source_year = config['reproduce']['year']
-                source_quarter = config['reproduce']['quarter']
-                source_quarter_name = SvgUpdater.QUARTER_NAMES.get(source_quarter, 'QUARTER')
-                
-                # Check if there's already a source attribution
-                attribution_pattern = r'<text[^>]*>\s*Adapted from.*\s*</text>'
-                attribution_text = f'<text x="400" y="870" font-family="Georgia, serif" font-size="16" text-anchor="middle" font-style="italic" fill="#666666">Adapted from {source_quarter_name}, {source_year}</text>'
-                
-                if re.search(attribution_pattern, svg_content):
-                    # Replace existing attribution
-                    svg_content = re.sub(attribution_pattern, attribution_text, svg_content)
-                else:
-                    # Add new attribution before closing svg tag
-                    svg_content = svg_content.replace('</svg>', f'{attribution_text}\n</svg>')
-            
-            # Write to a new file if temporary, otherwise update in place
-            if is_temporary:
-                temp_svg = tempfile.NamedTemporaryFile(suffix='.svg', delete=False)
-                temp_svg_path = temp_svg.name
-                with open(temp_svg_path, 'w', encoding='utf-8') as f:
-                    f.write(svg_content)
-                return temp_svg_path
-            else:
-                with open(svg_path, 'w', encoding='utf-8') as f:
-                    f.write(svg_content)
-                return svg_path
-                
+            return SvgUpdater.render_svg(svg_content, config, lesson_data)
         except Exception as e:
             print(f"Error updating SVG {svg_path}: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,287 @@
+"""
+Precompiled HTML Templates for Sabbath School Lessons
+
+This module holds the HTML templates for lessons, questions, sections, the
+table of contents and the default cover. Templates are compiled once per
+language with the translated labels baked in, then rendered from
+precomputed parts.
+"""
+
+import re
+
+from sabbath_school_reproducer.utils.language_utils import LanguageConfig
+
+
+QUESTION_TEMPLATE = """
+                <div class="question">
+                    <span class="question-number {num_class}">{number}.</span>
+                    <div class="question-text">
+                        {text} {scripture}
+                        {answer}
+                    </div>
+                    <div class="clearfix"></div>
+                </div>
+                """
+
+# Question markup before and after the question text
+QUESTION_HEAD, QUESTION_TAIL = QUESTION_TEMPLATE.split('{text}')
+
+SCRIPTURE_TEMPLATE = '<span class="scripture-ref">{scripture}</span>'
+
+ANSWER_TEMPLATE = '<div class="answer"><em>{answer_prefix} — {answer}</em></div>'
+
+QUESTIONS_SECTION_TEMPLATE = """
+            <div class="questions-section">
+                <div class="questions-header">{section_name}</div>
+                {questions}
+            </div>
+            """
+
+PRELIMINARY_TEMPLATE = """
+                <div class="preliminary-note">
+                    {content}
+                </div>
+                """
+
+ADDITIONAL_SECTION_TEMPLATE = """
+                <div class="additional-section">
+                    <div class="additional-header">{title}</div>
+                    <div class="additional-content">
+                        {content}
+                    </div>
+                </div>
+                """
+
+NOTES_TEMPLATE = """
+                <div class="notes-section">
+                    <div class="notes-header">{header}</div>
+                    <div class="notes-content">
+                        {content}
+                    </div>
+                </div>
+            """
+
+LESSON_TEMPLATE = """
+        <div class="lesson">
+            <div class="lesson-header">
+                <div class="corner top-left"></div>
+                <div class="corner top-right"></div>
+                <div class="corner bottom-left"></div>
+                <div class="corner bottom-right"></div>
+                <div class="lesson-circle">{number}</div>
+                <div class="lesson-title-container">
+                    <div class="lesson-title" style="font-size: {title_font_size};top: {title_top}">{title}</div>
+                    <div class="lesson-date">{date}</div>
+                </div>
+            </div>
+            {preliminary}
+            {questions}
+            {additional_sections}
+            {notes}
+        </div>
+        """
+
+TOC_ROW_TEMPLATE = """
+                <tr>
+                    <td style="width: 40px; padding: 5px;">{number}</td>
+                    <td style=""><a href="#lesson-{number}">{title}</a></td>
+                    <td style="">{date}</td>
+                    <td style="width: 40px; padding: 5px; text-align: right;"><a class="toc-page" href="#lesson-{number}"></a></td>
+                </tr>
+                """
+
+TOC_TEMPLATE = """
+        <div class="toc-title">{table_title}</div>
+        <table class="toc-table">
+            <tr class="header">
+                <td style="width: 40px; padding: 5px;">{lesson_column}</td>
+                <td style="padding: 5px;">{title_column}</td>
+                <td style="width: 100px; padding: 5px;">{date_column}</td>
+                <td style="width: 40px; padding: 5px; text-align: right;">{page_column}</td>
+            </tr>
+            {rows}
+        </table>
+        <div class="sectionbreaknone"></div>
+        """
+
+COVER_SVG_TEMPLATE = """
+            <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 1000" width="800" height="1000">
+                <rect width="800" height="1000" fill="#ffffff"/>
+                <rect x="30" y="30" width="740" height="940" stroke="#7d2b2b" stroke-width="3" fill="none"/>
+                <text x="400" y="170" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{sabbath_school_text}</text>
+                <text x="400" y="230" font-family="Georgia, serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#7d2b2b">{lessons_text}</text>
+                <text x="400" y="730" font-family="Georgia, serif" font-size="36" font-weight="bold" text-anchor="middle" fill="#5a4130">{lesson_title}</text>
+                <text x="400" y="790" font-family="Georgia, serif" font-size="24" text-anchor="middle" fill="#5a4130">{quarter_display}, {year}</text>
+                <text x="400" y="830" font-family="Georgia, serif" font-size="18" text-anchor="middle" fill="#5a4130">{quarter_months} {year}</text>
+            </svg>
+            """
+
+COVER_ATTRIBUTION_TEMPLATE = """
+                <text x="400" y="870" font-family="Georgia, serif" font-size="16" text-anchor="middle" font-style="italic" fill="#666666">
+                    {adapted_from} {source_quarter_name}, {source_year}
+                </text>
+                </svg>
+                """
+
+COVER_PAGE_TEMPLATE = """
+        <div class="cover-page">
+            {svg}
+        </div>
+        """
+
+
+# Bump whenever the rendered markup changes, to invalidate cached lesson fragments
+TEMPLATE_VERSION = 1
+
+
+class LessonTemplates:
+    """HTML templates for one language, with translated labels baked in."""
+
+    # Compiled templates per language code
+    _compiled = {}
+
+    # Question numbers with precomputed number markup
+    PRECOMPUTED_NUMBERS = 50
+
+    # Question text that already ends with punctuation
+    END_PUNCTUATION = re.compile(r'[.?!]$')
+
+    def __init__(self, language_code='en'):
+        """
+        Compile the templates for a language
+
+        Args:
+            language_code (str): Language code for translations
+        """
+        def translate(key, default):
+            return LanguageConfig.get_translation(language_code, key, default)
+
+        self.language_code = language_code
+        self.questions_header = translate('questions', 'QUESTIONS')
+        self.notes_header = translate('notes', 'NOTES')
+        self.note_header = translate('note', 'NOTE')
+
+        self.answer = self._bake(ANSWER_TEMPLATE, answer_prefix=translate('answer_prefix', 'Ans.'))
+        self.toc = self._bake(
+            TOC_TEMPLATE,
+            table_title=translate('table_of_contents', 'TABLE OF CONTENTS'),
+            lesson_column=translate('lesson_column', 'Lesson'),
+            title_column=translate('title_column', 'Title'),
+            date_column=translate('date_column', 'Date'),
+            page_column=translate('page_column', 'Page')
+        )
+        self.cover_svg = self._bake(
+            COVER_SVG_TEMPLATE,
+            sabbath_school_text=translate('sabbath_school', 'SABBATH SCHOOL'),
+            lessons_text=translate('lessons', 'LESSONS')
+        )
+        self.cover_attribution = self._bake(COVER_ATTRIBUTION_TEMPLATE, adapted_from=translate('adapted_from', 'Adapted from'))
+
+        # Number markup for the first questions of a section
+        self._question_heads = [
+            self._question_head(number) for number in range(self.PRECOMPUTED_NUMBERS + 1)
+        ]
+
+    @staticmethod
+    def _bake(template, **labels):
+        """
+        Substitute fixed labels into a template, leaving the other fields in place
+
+        Args:
+            template (str): Template with {field} placeholders
+            **labels: Label values to substitute now
+
+        Returns:
+            str: Template with only the remaining fields
+        """
+        fields = {name: '{' + name + '}' for name in re.findall(r'{(\w+)}', template)}
+        fields.update({name: value.replace('{', '{{').replace('}', '}}') for name, value in labels.items()})
+        return template.format(**fields)
+
+    @staticmethod
+    def _question_head(number):
+        """Render the markup of a question before its text"""
+        num_class = "two-digit" if number >= 10 else "one-digit"
+        return QUESTION_HEAD.format(num_class=num_class, number=number)
+
+    @staticmethod
+    def for_language(language_code='en'):
+        """
+        Get the compiled templates for a language
+
+        Args:
+            language_code (str): Language code for translations
+
+        Returns:
+            LessonTemplates: Templates for the language
+        """
+        templates = LessonTemplates._compiled.get(language_code)
+        if templates is None:
+            templates = LessonTemplates(language_code)
+            LessonTemplates._compiled[language_code] = templates
+        return templates
+
+    @staticmethod
+    def clear():
+        """Forget compiled templates (e.g. after the language files change)"""
+        LessonTemplates._compiled.clear()
+
+    def render_question(self, number, question):
+        """
+        Render one question
+
+        Args:
+            number (int): Question number within its section
+            question (Question): Question to render
+
+        Returns:
+            str: Question HTML
+        """
+        scripture_html = ""
+        if question.scripture:
+            scripture = question.scripture
+            if not scripture.endswith('.'):
+                scripture += '.'
+            scripture_html = SCRIPTURE_TEMPLATE.format(scripture=scripture)
+
+        answer_html = self.answer.format(answer=question.answer) if question.answer else ""
+
+        text = question.text
+        if text and not self.END_PUNCTUATION.search(text):
+            text += '.'
+
+        head = self._question_heads[number] if number < len(self._question_heads) else self._question_head(number)
+        return ''.join((head, text, QUESTION_TAIL.format(scripture=scripture_html, answer=answer_html)))
+
+    def render_questions_section(self, section_name, questions):
+        """
+        Render a section of questions, numbered from 1
+
+        Args:
+            section_name (str): Section header
+            questions (list): Question objects in the section
+
+        Returns:
+            str: Section HTML
+        """
+        questions_html = ''.join(
+            self.render_question(number, question) for number, question in enumerate(questions, 1)
+        )
+        return QUESTIONS_SECTION_TEMPLATE.format(section_name=section_name, questions=questions_html)
+
+    def render_toc(self, lessons):
+        """
+        Render the table of contents
+
+        Args:
+            lessons (list): Lesson objects
+
+        Returns:
+            str: Table of contents HTML
+        """
+        rows = ''.join(
+            TOC_ROW_TEMPLATE.format(number=lesson.number, title=lesson.title, date=lesson.date)
+            for lesson in lessons
+        )
+        return self.toc.format(rows=rows)
+
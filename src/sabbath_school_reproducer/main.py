@@ -17,11 +17,41 @@ from .downloader import GitHubDownloader
 from .aggregator import ContentAggregator
 from .processor import MarkdownProcessor
 from .generator.html_generator import HtmlGenerator
-from .generator.pdf_generator import PdfGenerator
 from .generator.svg_updater import SvgUpdater
+from .generator.preview import PreviewGenerator
 from .utils.debug_tools import DebugTools
 
 
+def configure_run_paths(config, config_file):
+    """
+    Set the combined markdown and PDF paths of a run
+    
+    Args:
+        config (Config): Loaded configuration; input_file and output_file are updated
+        config_file (str): Path to the YAML configuration file
+        
+    Returns:
+        str: Path of the combined markdown file
+    """
+    # Generate input filename with lesson range information
+    range_filename = GitHubDownloader.get_lesson_range_filename(config)
+    
+    # Check if file path is absolute or relative
+    if not os.path.isabs(range_filename):
+        # Make sure the filename is in the same directory as the config file
+        config_dir = os.path.dirname(config_file)
+        range_filename = os.path.join(config_dir, range_filename)
+
+    year = config.get("year")
+    quarter = config.get("quarter")
+    language = config.get("language")
+    config.config['output_file'] = f"./output/sabbath_school_lesson_{year}_{quarter}_{language}.pdf"
+    
+    # Update config with the new filename
+    config.config['input_file'] = range_filename
+    return range_filename
+
+
 def main():
     """
     Main function that orchestrates the entire process
@@ -48,6 +78,68 @@ def main():
     run_parser.add_argument('--generate-config', action='store_true', help='Generate a sample config file and exit')
     run_parser.add_argument('--quiet-deps', action='store_true', help='Silence debug messages from dependencies')
     run_parser.add_argument('-y', '--yes', action='store_true', help='Answer yes to all prompts (force overwrite)')
+    run_parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached parse results')
+    run_parser.add_argument('--jobs', type=int, help='Worker processes for parsing large inputs (0 uses every core)')
+    run_parser.add_argument('--lean', action='store_true', help='Emit minified HTML with unused CSS removed')
+    run_parser.add_argument('--split-lessons', action='store_true', help='Also write each lesson and the front and back matter as separate PDFs')
+    run_parser.add_argument('--preview', action='store_true', help='Write a browser preview of the styled HTML instead of the PDF')
+    run_parser.add_argument('--site', action='store_true', help='Export a static website of the quarter instead of the PDF')
+    run_parser.add_argument('--lessons', help='Only include these lessons, e.g. "3" or "1,4-6" (written to a _preview file)')
+    
+    # Add 'watch' subcommand to rebuild while files are edited
+    watch_parser = subparsers.add_parser('watch', help='Rebuild a lesson configuration whenever its files change')
+    watch_parser.add_argument('config_file', help='Path to YAML configuration file')
+    watch_parser.add_argument('--preview', action='store_true', help='Rebuild the browser preview instead of the PDF')
+    watch_parser.add_argument('--lessons', help='Only include these lessons, e.g. "3" or "1,4-6"')
+    watch_parser.add_argument('--lean', action='store_true', help='Emit minified HTML with unused CSS removed')
+    watch_parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached parse results')
+    watch_parser.add_argument('--interval', type=float, default=1.0, help='Seconds between checks for changed files')
+    
+    # Add 'benchmark' subcommand for offline performance measurements
+    benchmark_parser = subparsers.add_parser('benchmark', help='Run offline performance benchmarks')
+    benchmark_parser.add_argument('target', choices=['download', 'parse', 'render'], help='Pipeline stage to benchmark')
+    benchmark_parser.add_argument('--lessons-root', help='Local lessons tree to serve (a sample tree is built if omitted)')
+    benchmark_parser.add_argument('--year', type=int, default=1905, help='Year of the quarter to download')
+    benchmark_parser.add_argument('--quarter', default='q2', help='Quarter of the quarter to download')
+    benchmark_parser.add_argument('--language', default='en', help='Language of the quarter to download')
+    benchmark_parser.add_argument('--latency', type=float, default=0.0, help='Simulated latency per request in seconds')
+    benchmark_parser.add_argument('--bandwidth', type=int, help='Simulated bandwidth in bytes per second')
+    benchmark_parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+    benchmark_parser.add_argument('--repeat', type=int, default=1, help='Number of full quarter downloads, or timed runs per corpus size')
+    benchmark_parser.add_argument('--lessons', default='1,13,130,520', help='Comma separated corpus sizes for parse/render benchmarks')
+    benchmark_parser.add_argument('--layout', choices=['modern', '1895'], default='modern', help='Lesson layout of the synthetic corpus')
+    benchmark_parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic corpus')
+    benchmark_parser.add_argument('--jobs', type=int, default=1, help='Worker processes for the parse benchmark (0 uses every core)')
+    
+    # Add 'corpus' subcommand to write synthetic lesson files
+    corpus_parser = subparsers.add_parser('corpus', help='Write a synthetic combined lesson file')
+    corpus_parser.add_argument('output', help='Path of the combined markdown file to write')
+    corpus_parser.add_argument('--lessons', type=int, default=13, help='Number of lessons')
+    corpus_parser.add_argument('--questions', type=int, default=12, help='Questions per lesson')
+    corpus_parser.add_argument('--notes', type=int, default=3, help='Notes per lesson')
+    corpus_parser.add_argument('--note-length', type=int, default=60, help='Approximate words per note')
+    corpus_parser.add_argument('--sections', type=int, default=1, help='Additional sections per lesson')
+    corpus_parser.add_argument('--tables', action='store_true', help='Include a table in each lesson')
+    corpus_parser.add_argument('--layout', choices=['modern', '1895'], default='modern', help='Lesson layout')
+    corpus_parser.add_argument('--language', default='en', help='Language of structural terms and dates')
+    corpus_parser.add_argument('--seed', type=int, default=0, help='Seed of the synthetic corpus')
+    
+    # Add 'index' subcommand to build the lesson search index
+    index_parser = subparsers.add_parser('index', help='Add downloaded lessons to the search index')
+    index_parser.add_argument('paths', nargs='+', help='Combined lesson files or directories to index')
+    index_parser.add_argument('--index', help='Path to the index database')
+    index_parser.add_argument('--year', type=int, help='Source year (inferred from each path if omitted)')
+    index_parser.add_argument('--quarter', help='Source quarter (inferred from each path if omitted)')
+    index_parser.add_argument('--language', help='Source language (inferred from each path if omitted)')
+    index_parser.add_argument('--jobs', type=int, default=1, help='Worker processes for parsing (0 uses every core)')
+    
+    # Add 'search' subcommand to query the lesson search index
+    search_parser = subparsers.add_parser('search', help='Search indexed lessons')
+    search_parser.add_argument('query', nargs='+', help='Words or FTS5 query to search for')
+    search_parser.add_argument('--index', help='Path to the index database')
+    search_parser.add_argument('--language', help='Only show lessons in this language')
+    search_parser.add_argument('--limit', type=int, default=20, help='Maximum number of results')
+    search_parser.add_argument('--scripture', action='store_true', help='Find questions citing the passage given as query (e.g. "Ex. 25:8")')
     
     # Add shared arguments to the main parser for backward compatibility
     parser.add_argument('--debug', action='store_true', help='Enable debug mode with verbose logging')
@@ -55,6 +147,13 @@ def main():
     parser.add_argument('--generate-config', action='store_true', help='Generate a sample config file and exit')
     parser.add_argument('--quiet-deps', action='store_true', help='Silence debug messages from dependencies')
     parser.add_argument('-y', '--yes', action='store_true', help='Answer yes to all prompts (force overwrite)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached parse results')
+    parser.add_argument('--jobs', type=int, help='Worker processes for parsing large inputs (0 uses every core)')
+    parser.add_argument('--lean', action='store_true', help='Emit minified HTML with unused CSS removed')
+    parser.add_argument('--split-lessons', action='store_true', help='Also write each lesson and the front and back matter as separate PDFs')
+    parser.add_argument('--preview', action='store_true', help='Write a browser preview of the styled HTML instead of the PDF')
+    parser.add_argument('--site', action='store_true', help='Export a static website of the quarter instead of the PDF')
+    parser.add_argument('--lessons', help='Only include these lessons, e.g. "3" or "1,4-6" (written to a _preview file)')
     
     # Parse the arguments
     args = parser.parse_args()
@@ -81,6 +180,65 @@ def main():
         print(f"Sample configuration file generated at: {config_path}")
         return 0
     
+    # Handle benchmark command
+    if args.command == 'benchmark':
+        from .utils.benchmark import Benchmark
+        if args.target == 'download':
+            results = Benchmark.benchmark_download(
+                lessons_root=args.lessons_root, year=args.year, quarter=args.quarter,
+                language=args.language, latency=args.latency, bandwidth=args.bandwidth,
+                error_rate=args.error_rate, repeat=args.repeat
+            )
+        else:
+            lesson_counts = [int(count) for count in args.lessons.split(',') if count.strip()]
+            corpus_options = {'seed': args.seed, 'language': args.language, 'layout': args.layout}
+            if args.target == 'parse':
+                results = Benchmark.benchmark_parse(lesson_counts, args.repeat, args.jobs, **corpus_options)
+            else:
+                results = Benchmark.benchmark_render(lesson_counts, args.repeat, **corpus_options)
+        print(Benchmark.format_report(args.target, results))
+        return 0
+    
+    # Handle corpus command
+    if args.command == 'corpus':
+        from .utils.corpus_generator import CorpusGenerator
+        generator = CorpusGenerator(
+            seed=args.seed, language=args.language, layout=args.layout,
+            questions_per_lesson=args.questions, notes_count=args.notes,
+            note_length=args.note_length, additional_sections=args.sections, tables=args.tables
+        )
+        generator.write_combined(args.output, args.lessons)
+        print(f"Wrote {args.lessons} synthetic lessons to {args.output}")
+        return 0
+    
+    # Handle index command
+    if args.command == 'index':
+        from .search_index import LessonIndex
+        with LessonIndex(args.index) as index:
+            counts = index.update(args.paths, year=args.year, quarter=args.quarter,
+                                  language=args.language, jobs=args.jobs)
+        print(f"Indexed {counts['lessons']} lessons from {counts['indexed']} sources "
+              f"({counts['unchanged']} unchanged, {counts['removed']} removed)")
+        return 0
+    
+    # Handle search command
+    if args.command == 'search':
+        from .search_index import LessonIndex
+        with LessonIndex(args.index) as index:
+            if args.scripture:
+                hits = index.find_passage(' '.join(args.query), limit=args.limit, language=args.language)
+            else:
+                hits = index.search(' '.join(args.query), limit=args.limit, language=args.language)
+        print(LessonIndex.format_hits(hits))
+        return 0
+    
+    # Handle watch command
+    if args.command == 'watch':
+        from .watch import WatchSession
+        session = WatchSession(args.config_file, preview=args.preview, lessons=args.lessons,
+                               lean=args.lean, use_cache=not args.no_cache)
+        return session.run(args.interval)
+    
     # Check if a valid command or config file is provided
     if args.command != 'run' and not hasattr(args, 'config_file'):
         parser.print_help()
@@ -116,23 +274,19 @@ def main():
             
         print(f"Loading configuration from {config_file}...")
         config = Config(config_file)
+        range_filename = configure_run_paths(config, config_file)
         
-        # Generate input filename with lesson range information
-        range_filename = GitHubDownloader.get_lesson_range_filename(config)
+        # Disable the parse cache when requested
+        if args.no_cache:
+            config.config['cache_dir'] = None
         
-        # Check if file path is absolute or relative
-        if not os.path.isabs(range_filename):
-            # Make sure the filename is in the same directory as the config file
-            config_dir = os.path.dirname(args.config_file)
-            range_filename = os.path.join(config_dir, range_filename)
-
-        year = config.get("year")
-        quarter = config.get("quarter")
-        language = config.get("language")
-        config.config['output_file'] = f"./output/sabbath_school_lesson_{year}_{quarter}_{language}.pdf"
-        
-        # Update config with the new filename
-        config.config['input_file'] = range_filename
+        # Parse in parallel when requested
+        if args.jobs is not None:
+            config.config['jobs'] = args.jobs
+        if args.lean:
+            config.config['lean_html'] = True
+        if args.split_lessons:
+            config.config['split_lessons'] = True
         
         # Print reproduction settings if configured
         if 'reproduce' in config.config and config.config['reproduce'].get('year'):
@@ -175,6 +329,16 @@ def main():
                 lesson_data = file.read()
 
         
+        # Keep the search index current with every quarter that is used
+        if config.get('search_index'):
+            from .search_index import LessonIndex
+            source_year = config.config['reproduce'].get('year') or config['year']
+            source_quarter = config.config['reproduce'].get('quarter') or config['quarter']
+            index_path = None if config['search_index'] is True else config['search_index']
+            with LessonIndex(index_path) as index:
+                if index.add_file(markdown_path, source_year, source_quarter, config['language']) is not None:
+                    print(f"Added {source_year} {source_quarter} to search index {index.path}")
+        
         # Generate debug HTML if requested
         if args.debug_html_only:
             debug_html_path = config['output_file'].replace('.pdf', '_debug.html')
@@ -186,31 +350,53 @@ def main():
         print("Processing markdown content...")
         content_data = MarkdownProcessor.process_markdown_file(markdown_path, config.config)
         
-        # Update SVG files with dynamic content if available
+        # Lay out only the chosen lessons; the full build's output is left alone
+        if args.lessons:
+            content_data = PreviewGenerator.select_lessons(content_data, args.lessons)
+            config.config['output_file'] = config['output_file'].replace('.pdf', '_preview.pdf')
+            print(f"Preview of lessons {args.lessons}: {len(content_data['lessons'])} lessons")
+        
+        # Update SVG covers with dynamic content if available (in memory; the files are left as is)
         front_cover_path = config.get('front_cover_svg')
         back_cover_path = config.get('back_cover_svg')
+        front_cover_svg = None
+        back_cover_svg = None
         
         if front_cover_path:
-            updated_front_cover = SvgUpdater.update_svg_with_config(front_cover_path, config.config, lesson_data, is_temporary=True)
-            if updated_front_cover:
-                front_cover_path = updated_front_cover
+            front_cover_svg = SvgUpdater.update_svg_with_config(front_cover_path, config.config, lesson_data)
+            if front_cover_svg:
                 print(f"Updated front cover SVG with dynamic content")
         
         if back_cover_path:
-            updated_back_cover = SvgUpdater.update_svg_with_config(back_cover_path, config.config, lesson_data, is_temporary=True)
-            if updated_back_cover:
-                back_cover_path = updated_back_cover
+            back_cover_svg = SvgUpdater.update_svg_with_config(back_cover_path, config.config, lesson_data)
+            if back_cover_svg:
                 print(f"Updated back cover SVG with dynamic content")
         
+        # Website export: lesson pages from the parsed lessons, without PDF layout
+        if args.site:
+            from .generator.site_exporter import SiteExporter
+            site_dir = SiteExporter.get_site_dir(config.config)
+            written = SiteExporter.export_site(content_data, site_dir, config.config, front_cover_svg)
+            print(f"Website exported to: {site_dir} ({len(written)} files)")
+            return 0
+        
         # Generate HTML
         print("Generating HTML...")
         html_content = HtmlGenerator.generate_html(
             content_data,
             front_cover_svg_path=front_cover_path,
             back_cover_svg_path=back_cover_path,
-            config=config.config
+            config=config.config,
+            front_cover_svg=front_cover_svg,
+            back_cover_svg=back_cover_svg
         )
         
+        # Preview mode: show the styled HTML in a browser, without WeasyPrint
+        if args.preview:
+            preview_path = PreviewGenerator.write_preview(html_content, config['output_file'])
+            print(f"Preview HTML saved to: {preview_path}")
+            return 0
+        
         # Save debug HTML
         debug_html_path = config['output_file'].replace('.pdf', '_debug.html')
         with open(debug_html_path, 'w', encoding='utf-8') as f:
@@ -219,6 +405,7 @@ def main():
         
         # Generate PDF
         print("Generating PDF...")
+        from .generator.pdf_generator import PdfGenerator
         PdfGenerator.generate_pdf(html_content, config['output_file'], config.config)
         print(f"PDF generation complete: {config['output_file']}")
         
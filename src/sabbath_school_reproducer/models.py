@@ -0,0 +1,215 @@
+"""
+Lesson Model for Sabbath School Lessons
+
+This module defines compact, slot-based types for parsed lessons. They keep
+dictionary-style access so code written against the earlier plain-dict
+lessons keeps working.
+"""
+
+
+class Record:
+    """Base class for slot-based records with dictionary-compatible access."""
+
+    __slots__ = ()
+
+    # Default values for each slot; lists are copied per instance
+    FIELDS = {}
+
+    # Fields left out of to_dict() and membership tests while unset (None)
+    OPTIONAL_FIELDS = ()
+
+    # Fields holding lists of nested records: field name -> record class name
+    NESTED_FIELDS = {}
+
+    def __init__(self, **values):
+        for field, default in self.FIELDS.items():
+            if isinstance(default, list):
+                default = list(default)
+            setattr(self, field, values.pop(field, default))
+        if values:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(values)}")
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a record from a plain dictionary
+
+        Args:
+            data (dict): Dictionary with record fields; unknown keys are ignored
+
+        Returns:
+            Record: New record
+        """
+        values = {}
+        for field in cls.FIELDS:
+            if field not in data:
+                continue
+            value = data[field]
+            nested = cls.NESTED_FIELDS.get(field)
+            if nested and value is not None:
+                nested_cls = _RECORD_TYPES[nested]
+                value = [nested_cls.coerce(item) for item in value]
+            values[field] = value
+        return cls(**values)
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Return the value as a record of this type, converting dictionaries
+
+        Args:
+            value (Record or dict): Record or plain dictionary
+
+        Returns:
+            Record: The record itself, or a new record built from the dictionary
+        """
+        if isinstance(value, cls):
+            return value
+        return cls.from_dict(value)
+
+    def to_dict(self):
+        """
+        Convert the record and its nested records to plain dictionaries
+
+        Returns:
+            dict: Plain dictionary representation
+        """
+        result = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is None and field in self.OPTIONAL_FIELDS:
+                continue
+            if field in self.NESTED_FIELDS and value is not None:
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            result[field] = value
+        return result
+
+    def keys(self):
+        """Field names that are set, like dict.keys()"""
+        return [field for field in self.FIELDS if field in self]
+
+    def values(self):
+        """Field values that are set, like dict.values()"""
+        return [getattr(self, field) for field in self.keys()]
+
+    def items(self):
+        """Field name/value pairs that are set, like dict.items()"""
+        return [(field, getattr(self, field)) for field in self.keys()]
+
+    def get(self, key, default=None):
+        """Get a field value with a default, like dict.get()"""
+        if key in self:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        if key not in self.FIELDS:
+            return False
+        return key not in self.OPTIONAL_FIELDS or getattr(self, key) is not None
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Reference(Record):
+    """A normalized scripture reference (a verse range, or a whole chapter)."""
+
+    __slots__ = ('book', 'chapter', 'verse_start', 'verse_end')
+
+    FIELDS = {
+        'book': '',
+        'chapter': None,
+        'verse_start': None,
+        'verse_end': None
+    }
+
+
+class Question(Record):
+    """A single lesson question with its scripture reference."""
+
+    __slots__ = ('text', 'scripture', 'section', 'answer', 'references')
+
+    FIELDS = {
+        'text': '',
+        'scripture': '',
+        'section': None,
+        'answer': None,
+        'references': None
+    }
+
+    # references stays unset until ScriptureParser has annotated the question
+    OPTIONAL_FIELDS = ('answer', 'references')
+
+    NESTED_FIELDS = {
+        'references': 'Reference'
+    }
+
+
+class Section(Record):
+    """An additional titled section of a lesson (e.g. READING)."""
+
+    __slots__ = ('title', 'content')
+
+    FIELDS = {
+        'title': '',
+        'content': ''
+    }
+
+
+class Lesson(Record):
+    """A parsed lesson with its questions, notes and additional sections."""
+
+    __slots__ = ('number', 'date', 'title', 'preliminary_note', 'questions',
+                 'question_headers', 'notes', 'additional_sections', 'original_date')
+
+    FIELDS = {
+        'number': '',
+        'date': '',
+        'title': '',
+        'preliminary_note': '',
+        'questions': [],
+        'question_headers': [],
+        'notes': '',
+        'additional_sections': [],
+        'original_date': None
+    }
+
+    OPTIONAL_FIELDS = ('original_date',)
+
+    NESTED_FIELDS = {
+        'questions': 'Question',
+        'additional_sections': 'Section'
+    }
+
+
+_RECORD_TYPES = {
+    'Reference': Reference,
+    'Question': Question,
+    'Section': Section,
+    'Lesson': Lesson
+}
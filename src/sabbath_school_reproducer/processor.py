@@ -6,60 +6,91 @@ Markdown Processor for Sabbath School Lessons
 This module processes markdown files, extracting lesson content, front matter, and back matter.
 """
 
+import os
 import re
+import math
+import itertools
 import markdown
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
+from .models import Lesson, Question, Section
+from .scripture import ScriptureParser
+from .utils.cache import DiskCache
 from .utils.language_utils import LanguageConfig
+from .utils.markdown_lists import MarkdownLists
+from .utils.schedule import LessonSchedule
 
 
 class MarkdownProcessor:
     """Processes markdown files to extract structured content."""
     
+    # File section markers written by ContentAggregator
+    FILE_HEADER_PATTERN = re.compile(r'^# File: ([^\n]+)$')
+    FILE_SEPARATOR_PATTERN = re.compile(r'^#-+\s*$')
+    
+    # Cache of compiled lesson patterns per language
+    _pattern_cache = {}
+    
+    # Bump whenever parser output changes, to invalidate cached parse results
+    PARSER_VERSION = 2
+    
+    # Below this many lesson blocks, parsing serially beats starting a process pool
+    PARALLEL_THRESHOLD = 32
+    
+    # Chunks handed to each worker, so uneven blocks still balance across the pool
+    CHUNKS_PER_WORKER = 4
+    
+    # Lesson layouts with a specialized parser; anything else uses the generic parser
+    LESSON_FORMATS = ('modern', '1895')
+    
+    # Line patterns shared by the specialized parsers
+    SECTION_HEADER_PATTERN = re.compile(r'^#{2,3}\s+(.*?)$')
+    NUMBERED_LINE_PATTERN = re.compile(r'^\s*\d+\.\s+')
+    TITLE_HEADER_PATTERN = re.compile(r'^##\s+(.*?)$')
+    HEADER_DATE_PATTERN = re.compile(r'[—–-]\s*([A-Za-z]+ \d+, \d{4})')
+    HEADER_TITLE_PATTERN = re.compile(r'[-–—]\s*(.*?)$')
+    
+    # Line kinds assigned by _classify_lines
+    BLANK, TEXT, HEADER, NUMBERED = range(4)
+    
     @staticmethod
     def adjust_dates(lessons, config):
         """
         Adjust lesson dates based on the quarter_start_date in config
         
         Args:
-            lessons (list): List of lesson dictionaries
+            lessons (list): List of Lesson objects (or lesson dictionaries)
             config (dict): Configuration dictionary with reproduction settings
             
         Returns:
-            list: Updated list of lesson dictionaries with adjusted dates
+            list: Updated list of Lesson objects with adjusted dates
         """
         if not config or 'reproduce' not in config or not config['reproduce'].get('quarter_start_date'):
             return lessons  # No date adjustment needed
         
         try:
-            # Parse the quarter start date
-            from datetime import datetime, timedelta
-            quarter_start = datetime.strptime(config['reproduce']['quarter_start_date'], '%Y-%m-%d')
-            
-            # Set new lesson numbers if needed
-            start_lesson = config['reproduce'].get('start_lesson', 1)
-            
             # Get language code
             language_code = config.get('language', 'en')
             
+            # Weekly dates for the whole quarter, formatted for the language in one batch
+            schedule = LessonSchedule.build(config['reproduce']['quarter_start_date'], len(lessons), language_code)
+            
+            # Work on Lesson objects, converting any plain dictionaries
+            lessons = [Lesson.coerce(lesson) for lesson in lessons]
+            
             # Sort lessons by their original number
-            lessons.sort(key=lambda l: int(l.get('number', 0)))
+            lessons.sort(key=lambda l: int(l.number or 0))
             
             # Apply new dates and lesson numbers
-            for i, lesson in enumerate(lessons):
+            for i, (lesson, (_, formatted_date)) in enumerate(zip(lessons, schedule)):
                 # Store original date for reference if needed
-                if lesson.get('date'):
-                    lesson['original_date'] = lesson['date']
+                if lesson.date:
+                    lesson.original_date = lesson.date
                 
                 # Set the new lesson number (1-based)
                 new_lesson_number = i + 1
-                lesson['number'] = str(new_lesson_number)
-                
-                # Calculate new date (one week apart)
-                lesson_date = quarter_start + timedelta(days=7 * i)
-                
-                # Format the date based on language
-                new_date = LanguageConfig.format_date(lesson_date, language_code)
-                lesson['date'] = new_date
+                lesson.number = str(new_lesson_number)
+                lesson.date = formatted_date
             
             return lessons
                 
@@ -157,308 +188,946 @@ class MarkdownProcessor:
         return '\n'.join(result)
 
     @staticmethod
-    def parse_lessons(markdown_content, language_code='en'):
+    def _get_lesson_patterns(language_code='en'):
         """
-        Parse the markdown content to extract lessons using a line-by-line approach
+        Get the language-specific terms and compiled patterns used by the lesson parser
         
         Args:
-            markdown_content (str): Markdown content containing lessons
             language_code (str): Language code for translations
             
         Returns:
-            list: List of lesson dictionaries
+            dict: Terms and compiled regular expressions for the language
         """
-        # Add paragraph and line spacing
-        markdown_content = MarkdownProcessor.add_new_lines_to_markdown(markdown_content)
+        if language_code in MarkdownProcessor._pattern_cache:
+            return MarkdownProcessor._pattern_cache[language_code]
         
         # Get language-specific terms
         lesson_term = LanguageConfig.get_translation(language_code, 'lesson', 'LESSON')
         notes_term = LanguageConfig.get_translation(language_code, 'notes', 'NOTES')
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
-        print(notes_term)
         note_term = LanguageConfig.get_translation(language_code, 'note', 'NOTE')
         questions_term = LanguageConfig.get_translation(language_code, 'questions', 'QUESTIONS')
         
-        # # Create case-insensitive patterns for language-specific terms
-        # lesson_pattern = re.compile(r'^#\s*' + re.escape(lesson_term) + r'\s+\d+', re.IGNORECASE)
-        # notes_pattern = re.compile(r'^#{2,3}\s+(' + re.escape(notes_term) + r'|' + re.escape(note_term) + r')$', re.IGNORECASE)
-        # questions_pattern = re.compile(r'^#{2,3}\s+' + re.escape(questions_term) + r'$', re.IGNORECASE)
+        date_formats = LanguageConfig.get_date_formats(language_code)
         
-        # # Split the content by lesson headers
-        # lesson_blocks = re.split(r'(?=' + lesson_pattern.pattern + r')', markdown_content, flags=re.MULTILINE)
-        lesson_pattern = re.compile(r'^#\s*' + re.escape(lesson_term) + r'\s+\d+', re.IGNORECASE | re.MULTILINE)
-        notes_pattern = re.compile(r'^#{2,3}\s+(' + re.escape(notes_term) + r'|' + re.escape(note_term) + r')$', re.IGNORECASE | re.MULTILINE)
-        questions_pattern = re.compile(r'^#{2,3}\s+' + re.escape(questions_term) + r'$', re.IGNORECASE | re.MULTILINE)
-
-        # Split the content by lesson headers - IMPORTANT: Use the re.MULTILINE flag here too!
-        lesson_blocks = re.split(r'(?=^#\s*' + re.escape(lesson_term) + r'\s+\d+)', markdown_content, flags=re.MULTILINE | re.IGNORECASE)
-
+        patterns = {
+            'lesson_term': lesson_term,
+            'questions_term': questions_term,
+            'lesson': re.compile(r'^#\s*' + re.escape(lesson_term) + r'\s+\d+', re.IGNORECASE | re.MULTILINE),
+            'number': re.compile(r'#\s*(?:' + re.escape(lesson_term) + r')\s+(\d+)', re.IGNORECASE),
+            'notes': re.compile(r'^#{2,3}\s+(' + re.escape(notes_term) + r'|' + re.escape(note_term) + r')$', re.IGNORECASE | re.MULTILINE),
+            'questions': re.compile(r'^#{2,3}\s+' + re.escape(questions_term) + r'$', re.IGNORECASE | re.MULTILINE),
+            'dates': [re.compile(pattern) for pattern in date_formats],
+            'italic_dates': [re.compile(r'^\*(' + pattern[1:-1] + r')\*$') for pattern in date_formats]
+        }
+        MarkdownProcessor._pattern_cache[language_code] = patterns
+        return patterns
+    
+    @staticmethod
+    def split_lesson_blocks(lines, language_code='en'):
+        """
+        Split lines of lesson markdown into lesson blocks at each lesson header
+        
+        Blocks are yielded as soon as the next header (or the end of input) is
+        reached, so only one lesson is held in memory at a time.
         
-        # Remove any empty blocks
-        lesson_blocks = [block.strip() for block in lesson_blocks if block.strip()]
+        Args:
+            lines (iterable): Lines of lesson markdown, without line endings
+            language_code (str): Language code for translations
+            
+        Yields:
+            str: Markdown for one lesson block
+        """
+        lesson_pattern = MarkdownProcessor._get_lesson_patterns(language_code)['lesson']
+        block_lines = []
+        
+        for line in lines:
+            if block_lines and lesson_pattern.match(line):
+                block = '\n'.join(block_lines).strip()
+                if block:
+                    yield block
+                block_lines = []
+            block_lines.append(line)
+        
+        block = '\n'.join(block_lines).strip()
+        if block:
+            yield block
+    
+    @staticmethod
+    def parse_lessons(markdown_content, language_code='en', report=None):
+        """
+        Parse the markdown content to extract lessons using a line-by-line approach
+        
+        The layout is detected once for the whole content, and every lesson is
+        parsed with the specialized parser for that layout when there is one.
+        
+        Args:
+            markdown_content (str): Markdown content containing lessons
+            language_code (str): Language code for translations
+            report (dict, optional): Receives the detected 'format' and a count of
+                lessons per parser used
+            
+        Returns:
+            list: List of Lesson objects
+        """
+        blocks = list(MarkdownProcessor.split_lesson_blocks(markdown_content.split('\n'), language_code))
+        lesson_format = MarkdownProcessor.detect_lesson_format(blocks, language_code) or 'generic'
+        if report is not None:
+            report['format'] = lesson_format
+        return [
+            MarkdownProcessor.parse_lesson_block_as(block, language_code, lesson_format, report)
+            for block in blocks
+        ]
+    
+    @staticmethod
+    def parse_lessons_parallel(markdown_content, language_code='en', jobs=None, chunksize=None, report=None):
+        """
+        Parse the markdown content to extract lessons across a process pool
+        
+        Args:
+            markdown_content (str): Markdown content containing lessons
+            language_code (str): Language code for translations
+            jobs (int, optional): Worker processes (None or 0 uses every core)
+            chunksize (int, optional): Blocks sent to a worker at a time
+            report (dict, optional): Receives the detected format and parser counts
+            
+        Returns:
+            list: List of Lesson objects, in source order
+        """
+        blocks = list(MarkdownProcessor.split_lesson_blocks(markdown_content.split('\n'), language_code))
+        return MarkdownProcessor.parse_blocks(blocks, language_code, jobs, chunksize, report)
+    
+    @staticmethod
+    def parse_blocks(blocks, language_code='en', jobs=None, chunksize=None, report=None):
+        """
+        Parse lesson blocks, in parallel once there are enough of them
+        
+        Args:
+            blocks (list): Lesson blocks from split_lesson_blocks()
+            language_code (str): Language code for translations
+            jobs (int, optional): Worker processes (None or 0 uses every core)
+            chunksize (int, optional): Blocks sent to a worker at a time
+            report (dict, optional): Receives the detected format and parser counts
+            
+        Returns:
+            list: List of Lesson objects, in block order
+        """
+        lesson_format = MarkdownProcessor.detect_lesson_format(blocks, language_code) or 'generic'
+        if report is None:
+            report = {}
+        report['format'] = lesson_format
+        
+        workers = MarkdownProcessor.get_worker_count(jobs)
+        if workers == 1 or len(blocks) < MarkdownProcessor.PARALLEL_THRESHOLD:
+            return [
+                MarkdownProcessor.parse_lesson_block_as(block, language_code, lesson_format, report)
+                for block in blocks
+            ]
+        
+        if not chunksize:
+            chunksize = max(1, math.ceil(len(blocks) / (workers * MarkdownProcessor.CHUNKS_PER_WORKER)))
+        
+        # map() returns results in submission order, so reassembly is deterministic
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                _parse_lesson_block, blocks, itertools.repeat(language_code, len(blocks)),
+                itertools.repeat(lesson_format, len(blocks)), chunksize=chunksize
+            ))
         
         lessons = []
+        for lesson, parser in results:
+            report[parser] = report.get(parser, 0) + 1
+            lessons.append(lesson)
+        return lessons
+    
+    @staticmethod
+    def parse_files_parallel(markdown_files, language_code='en', jobs=None):
+        """
+        Parse several lesson files (e.g. a whole archive of quarters) across a process pool
         
-        for block in lesson_blocks:
-            lines = block.split('\n')
-            # Initialize lesson structure
-            lesson = {
-                'number': '',
-                'date': '',
-                'title': '',
-                'preliminary_note': '',
-                'questions': [],
-                'question_headers': [],
-                'notes': '',
-                'additional_sections': []
-            }
-            
-            # Process the lesson header (first line)
-            if lines and re.match(lesson_pattern, lines[0]):
-                header_line = lines[0]
-                
-                # Extract lesson number
-                number_match = re.search(r'#\s*(?:' + re.escape(lesson_term) + r')\s+(\d+)', header_line, re.IGNORECASE)
-                if number_match:
-                    lesson['number'] = number_match.group(1)
-                
-                # Check for date in em-dash format
-                em_dash_date_match = re.search(r'[—–-]\s*([A-Za-z]+ \d+, \d{4})', header_line)
-                if em_dash_date_match:
-                    lesson['date'] = em_dash_date_match.group(1)
-                else:
-                    # Check for title after dash
-                    title_match = re.search(r'[-–—]\s*(.*?)$', header_line)
+        Args:
+            markdown_files (list): Paths to combined markdown files or week file directories
+            language_code (str): Language code for translations
+            jobs (int, optional): Worker processes (None or 0 uses every core)
+            
+        Returns:
+            list: One dict per file with 'lessons', 'frontmatter' and 'backmatter', in input order
+        """
+        markdown_files = list(markdown_files)
+        workers = min(MarkdownProcessor.get_worker_count(jobs), max(1, len(markdown_files)))
+        if workers == 1:
+            return [_parse_markdown_file(path, language_code) for path in markdown_files]
+        
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                _parse_markdown_file, markdown_files,
+                itertools.repeat(language_code, len(markdown_files))
+            ))
+    
+    @staticmethod
+    def get_worker_count(jobs=None):
+        """
+        Resolve a requested job count to a number of worker processes
+        
+        Args:
+            jobs (int, optional): Requested workers (None or 0 uses every core)
+            
+        Returns:
+            int: Number of workers, at least 1
+        """
+        if not jobs or jobs < 0:
+            return os.cpu_count() or 1
+        return jobs
+    
+    @staticmethod
+    def iter_lessons(source, language_code='en', matter=None, report=None):
+        """
+        Incrementally read lessons and yield each one as soon as its block is complete
+        
+        The layout is detected from the first lesson; later lessons that do not
+        fit it (and any text before the first lesson) are parsed by the generic parser.
+        
+        Args:
+            source (str or iterable): Path to a combined markdown file, path to a
+                directory of week files, or an iterable of combined file lines
+            language_code (str): Language code for translations
+            matter (dict, optional): Receives 'frontmatter' and 'backmatter' content
+            report (dict, optional): Receives the detected format and parser counts
+            
+        Yields:
+            Lesson: Parsed lesson
+        """
+        if report is None:
+            report = {}
+        lesson_format = None
+        lines = MarkdownProcessor._iter_lesson_lines(source, matter)
+        for block in MarkdownProcessor.split_lesson_blocks(lines, language_code):
+            if lesson_format is None:
+                lesson_format = MarkdownProcessor.detect_lesson_format([block], language_code)
+                if lesson_format:
+                    report['format'] = lesson_format
+            yield MarkdownProcessor.parse_lesson_block_as(block, language_code, lesson_format, report)
+    
+    @staticmethod
+    def _iter_lesson_lines(source, matter=None):
+        """
+        Yield the lesson lines of a combined file, directory or line iterable
+        
+        Args:
+            source (str or iterable): Combined file path, directory path or lines
+            matter (dict, optional): Receives 'frontmatter' and 'backmatter' content
+            
+        Yields:
+            str: Line of lesson markdown without its line ending
+        """
+        if isinstance(source, str) and os.path.isdir(source):
+            for filename in sorted(os.listdir(source)):
+                kind = MarkdownProcessor._section_kind(filename)
+                if not filename.endswith('.md') or not kind:
+                    continue
+                with open(os.path.join(source, filename), 'r', encoding='utf-8') as f:
+                    if kind == 'lessons':
+                        for line in f:
+                            yield line.rstrip('\n')
+                        # Keep week files apart, as the combined file does
+                        yield ''
+                    elif matter is not None:
+                        matter[kind] = f.read().strip()
+        elif isinstance(source, str):
+            with open(source, 'r', encoding='utf-8') as f:
+                for line in MarkdownProcessor._iter_combined_lines(f, matter):
+                    yield line
+        else:
+            for line in MarkdownProcessor._iter_combined_lines(source, matter):
+                yield line
+    
+    @staticmethod
+    def _section_kind(filename):
+        """
+        Classify a file section by its file name
+        
+        Args:
+            filename (str): Name of the file section
+            
+        Returns:
+            str or None: 'frontmatter', 'backmatter', 'lessons', or None if unknown
+        """
+        filename = filename.strip().lower()
+        
+        if 'front-matter' in filename:
+            return 'frontmatter'
+        elif 'back-matter' in filename:
+            return 'backmatter'
+        elif 'week-' in filename or 'lesson-' in filename:
+            return 'lessons'
+        return None
+    
+    @staticmethod
+    def _iter_combined_lines(lines, matter=None):
+        """
+        Yield the lesson lines of a combined markdown file, section by section
+        
+        Args:
+            lines (iterable): Lines of the combined file
+            matter (dict, optional): Receives 'frontmatter' and 'backmatter' content
+            
+        Yields:
+            str: Line of lesson markdown without its line ending
+        """
+        kind = None
+        started = False
+        matter_lines = []
+        
+        for line in lines:
+            line = line.rstrip('\n')
+            header_match = MarkdownProcessor.FILE_HEADER_PATTERN.match(line)
+            
+            if header_match:
+                # Close the previous section
+                if kind == 'lessons':
+                    yield ''
+                elif kind and matter is not None:
+                    matter[kind] = '\n'.join(matter_lines).strip()
+                kind = MarkdownProcessor._section_kind(header_match.group(1))
+                started = False
+                matter_lines = []
+                continue
+            
+            if not kind:
+                continue
+            
+            if not started:
+                # Skip the separator line and blank lines after the header
+                if not line.strip() or MarkdownProcessor.FILE_SEPARATOR_PATTERN.match(line):
+                    continue
+                started = True
+            
+            if kind == 'lessons':
+                yield line
+            elif matter is not None:
+                matter_lines.append(line)
+        
+        if kind and kind != 'lessons' and matter is not None:
+            matter[kind] = '\n'.join(matter_lines).strip()
+    
+    @staticmethod
+    def parse_lesson_block(block, language_code='en'):
+        """
+        Parse the markdown of a single lesson block
+        
+        Args:
+            block (str): Markdown for one lesson, starting at its header
+            language_code (str): Language code for translations
+            
+        Returns:
+            Lesson: Parsed lesson
+        """
+        # Add paragraph and line spacing
+        block = MarkdownProcessor.add_new_lines_to_markdown(block)
+        
+        patterns = MarkdownProcessor._get_lesson_patterns(language_code)
+        lesson_term = patterns['lesson_term']
+        questions_term = patterns['questions_term']
+        lesson_pattern = patterns['lesson']
+        notes_pattern = patterns['notes']
+        questions_pattern = patterns['questions']
+        
+        lines = block.split('\n')
+        # Initialize lesson structure
+        lesson = Lesson()
+        
+        # Process the lesson header (first line)
+        if lines and re.match(lesson_pattern, lines[0]):
+            header_line = lines[0]
+            
+            # Extract lesson number
+            number_match = re.search(r'#\s*(?:' + re.escape(lesson_term) + r')\s+(\d+)', header_line, re.IGNORECASE)
+            if number_match:
+                lesson.number = number_match.group(1)
+            
+            # Check for date in em-dash format
+            em_dash_date_match = re.search(r'[—–-]\s*([A-Za-z]+ \d+, \d{4})', header_line)
+            if em_dash_date_match:
+                lesson.date = em_dash_date_match.group(1)
+            else:
+                # Check for title after dash
+                title_match = re.search(r'[-–—]\s*(.*?)$', header_line)
+                if title_match:
+                    lesson.title = title_match.group(1).strip()
+        
+        # Process the rest of the lines
+        line_index = 1  # Start from the second line
+        preliminary_lines = []
+        current_section = None
+        current_question_section = None
+        question_list = []
+        
+        # Flag to track if we've seen any section after questions
+        seen_non_question_section = False
+        
+        # Look for the title in level 2 headers
+        if not lesson.title and line_index < len(lines):
+            for i in range(line_index, min(line_index + 10, len(lines))):
+                if i < len(lines) and re.match(r'^##\s+', lines[i]):
+                    title_match = re.search(r'^##\s+(.*?)$', lines[i])
                     if title_match:
-                        lesson['title'] = title_match.group(1).strip()
-            
-            # Process the rest of the lines
-            line_index = 1  # Start from the second line
-            preliminary_lines = []
-            current_section = None
-            current_question_section = None
-            question_list = []
-            
-            # Flag to track if we've seen any section after questions
-            seen_non_question_section = False
-            
-            # Look for the title in level 2 headers
-            if not lesson['title'] and line_index < len(lines):
-                for i in range(line_index, min(line_index + 10, len(lines))):
-                    if i < len(lines) and re.match(r'^##\s+', lines[i]):
-                        title_match = re.search(r'^##\s+(.*?)$', lines[i])
-                        if title_match:
-                            lesson['title'] = title_match.group(1).strip()
+                        lesson.title = title_match.group(1).strip()
+                        line_index = i + 1
+                        break
+        
+        # Look for date on its own line
+        if not lesson.date and line_index < len(lines):
+            for i in range(line_index, min(line_index + 5, len(lines))):
+                if i < len(lines):
+                    # Use language-specific date patterns
+                    for pattern in LanguageConfig.get_date_formats(language_code):
+                        date_match = re.search(pattern, lines[i].strip())
+                        if date_match:
+                            lesson.date = date_match.group(1)
+                            line_index = i + 1
+                            break
+                    
+                    # Also check for italicized date
+                    for pattern in LanguageConfig.get_date_formats(language_code):
+                        italics_pattern = r'^\*(' + pattern[1:-1] + r')\*$'
+                        italics_date_match = re.search(italics_pattern, lines[i].strip())
+                        if italics_date_match:
+                            lesson.date = italics_date_match.group(1)
                             line_index = i + 1
                             break
+        
+        # Find where content actually starts
+        while line_index < len(lines) and not lines[line_index].strip():
+            line_index += 1
+        
+        # Collect preliminary content - but we need to look ahead to see if it's followed by questions
+        has_preliminary = False
+        preliminary_start_index = line_index
+        preliminary_end_index = line_index
+        
+        # Scan ahead to find patterns
+        for i in range(line_index, len(lines)):
+            line = lines[i]
+            # If we find a numbered list, this is likely where questions start
+            if re.match(r'^\s*\d+\.\s+', line):
+                # If there was content between line_index and i, it might be preliminary
+                if i > line_index:
+                    # Check if the non-blank line right before this is a section header
+                    # If it is, don't include the header in preliminary
+                    question_start_index = i
+                    header_index = None
+                    
+                    for j in range(i-1, max(0, line_index-1), -1):
+                        if j >= 0 and lines[j].strip():
+                            if re.match(r'^#{2,3}\s+', lines[j]):
+                                # Found a header right before questions
+                                header_index = j
+                            break
+                    if header_index is not None:
+                        # If a header was found, preliminary ends before that header
+                        if header_index > line_index:
+                            has_preliminary = True
+                            preliminary_end_index = header_index
+                    else:
+                        # No header found before questions, everything up to questions is preliminary
+                        has_preliminary = True
+                        preliminary_end_index = i
+                break
+        
+        # Collect the preliminary content if we found some
+        if has_preliminary:
+            for i in range(preliminary_start_index, preliminary_end_index):
+                preliminary_lines.append(lines[i])
+            line_index = preliminary_end_index
+        
+        # Save preliminary matter
+        lesson.preliminary_note = '\n'.join(preliminary_lines).strip()
+        # Process sections (questions, notes, and additional)
+        section_buffer = []
+        current_question_text = ""
+        in_question = False
+        
+        while line_index < len(lines):
+            line = lines[line_index]
             
-            # Look for date on its own line
-            if not lesson['date'] and line_index < len(lines):
-                for i in range(line_index, min(line_index + 5, len(lines))):
-                    if i < len(lines):
-                        # Use language-specific date patterns
-                        for pattern in LanguageConfig.get_date_formats(language_code):
-                            date_match = re.search(pattern, lines[i].strip())
-                            if date_match:
-                                lesson['date'] = date_match.group(1)
-                                line_index = i + 1
-                                break
-                        
-                        # Also check for italicized date
-                        for pattern in LanguageConfig.get_date_formats(language_code):
-                            italics_pattern = r'^\*(' + pattern[1:-1] + r')\*$'
-                            italics_date_match = re.search(italics_pattern, lines[i].strip())
-                            if italics_date_match:
-                                lesson['date'] = italics_date_match.group(1)
-                                line_index = i + 1
-                                break
+            # Check if this line is a section header
+            header_match = re.match(r'^#{2,3}\s+(.*?)$', line)
             
-            # Find where content actually starts
-            while line_index < len(lines) and not lines[line_index].strip():
-                line_index += 1
-            
-            # Collect preliminary content - but we need to look ahead to see if it's followed by questions
-            has_preliminary = False
-            preliminary_start_index = line_index
-            preliminary_end_index = line_index
-            
-            # Scan ahead to find patterns
-            for i in range(line_index, len(lines)):
-                line = lines[i]
-                # If we find a numbered list, this is likely where questions start
-                if re.match(r'^\s*\d+\.\s+', line):
-                    # If there was content between line_index and i, it might be preliminary
-                    if i > line_index:
-                        # Check if the non-blank line right before this is a section header
-                        # If it is, don't include the header in preliminary
-                        question_start_index = i
-                        header_index = None
-                        
-                        for j in range(i-1, max(0, line_index-1), -1):
-                            if j >= 0 and lines[j].strip():
-                                if re.match(r'^#{2,3}\s+', lines[j]):
-                                    # Found a header right before questions
-                                    header_index = j
+            if header_match:
+                # If we were collecting a question, save it
+                if in_question and current_question_text and not seen_non_question_section:
+                    question_obj = MarkdownProcessor._parse_question(current_question_text, current_question_section or questions_term, language_code)
+                    question_list.append(question_obj)
+                    current_question_text = ""
+                    in_question = False
+                
+                # Save the previous section if we have one
+                if current_section:
+                    # Check if this is notes section using language-specific pattern
+                    if re.match(notes_pattern, f"## {current_section}"):
+                        fixed_notes = MarkdownProcessor._fix_notes_numbering(section_buffer)
+                        lesson.notes = '\n'.join(fixed_notes).strip()
+                    elif current_section != 'questions':
+                        # This is an additional section
+                        lesson.additional_sections.append(Section(
+                            title=current_section,
+                            content='\n'.join(section_buffer).strip()
+                        ))
+                        # Once we've seen an additional section, no more questions
+                        seen_non_question_section = True
+                    
+                    # Clear the buffer for the new section
+                    section_buffer = []
+                
+                header_text = header_match.group(1).strip()
+                
+                # Look ahead to see if the next section is questions (has numbered list)
+                is_question_section = False
+                if not seen_non_question_section:  # Only check for question sections if we haven't seen non-question sections
+                    for i in range(line_index + 1, min(line_index + 5, len(lines))):
+                        if i < len(lines):
+                            numbered_list_match = re.match(r'^\s*\d+\.\s+', lines[i])
+                            if numbered_list_match:
+                                is_question_section = True
+                                break
+                            elif lines[i].strip() and not re.match(r'^\s*$', lines[i]):
+                                # If we encounter non-empty, non-numbered list content, it's not a question section
                                 break
-                        if header_index is not None:
-                            # If a header was found, preliminary ends before that header
-                            if header_index > line_index:
-                                has_preliminary = True
-                                preliminary_end_index = header_index
-                        else:
-                            # No header found before questions, everything up to questions is preliminary
-                            has_preliminary = True
-                            preliminary_end_index = i
-                    break
-            
-            # Collect the preliminary content if we found some
-            if has_preliminary:
-                for i in range(preliminary_start_index, preliminary_end_index):
-                    preliminary_lines.append(lines[i])
-                line_index = preliminary_end_index
-            
-            # Save preliminary matter
-            lesson['preliminary_note'] = '\n'.join(preliminary_lines).strip()
-            # Process sections (questions, notes, and additional)
-            section_buffer = []
-            current_question_text = ""
-            in_question = False
-            
-            while line_index < len(lines):
-                line = lines[line_index]
                 
-                # Check if this line is a section header
-                header_match = re.match(r'^#{2,3}\s+(.*?)$', line)
+                # Determine the type of the new section
+                if re.match(notes_pattern, line):
+                    current_section = header_text
+                    current_question_section = None
+                    seen_non_question_section = True
+                elif (is_question_section or re.match(questions_pattern, line)) and not seen_non_question_section:
+                    # This is a questions section (only if we haven't seen non-question sections yet)
+                    current_section = 'questions'
+                    
+                    # Track the question section header
+                    current_question_section = header_text
+                    if current_question_section not in lesson.question_headers:
+                        lesson.question_headers.append(current_question_section)
+                else:
+                    # This is an additional section
+                    current_section = header_text
+                    current_question_section = None
+                    seen_non_question_section = True
+            
+            elif re.match(r'^\s*\d+\.\s+', line):
+                # This is a numbered list item, which could be a question or a note
                 
-                if header_match:
+                # If this is immediately after the NOTES header, it's a note
+                if current_section and re.match(notes_pattern, f"## {current_section}"):
+                    section_buffer.append(line)
+                elif not seen_non_question_section:
+                    # This is a question (only if we haven't seen non-question sections yet)
+                    
                     # If we were collecting a question, save it
-                    if in_question and current_question_text and not seen_non_question_section:
+                    if in_question and current_question_text:
                         question_obj = MarkdownProcessor._parse_question(current_question_text, current_question_section or questions_term, language_code)
                         question_list.append(question_obj)
-                        current_question_text = ""
-                        in_question = False
                     
-                    # Save the previous section if we have one
-                    if current_section:
-                        # Check if this is notes section using language-specific pattern
-                        if re.match(notes_pattern, f"## {current_section}"):
-                            fixed_notes = MarkdownProcessor._fix_notes_numbering(section_buffer)
-                            lesson['notes'] = '\n'.join(fixed_notes).strip()
-                        elif current_section != 'questions':
-                            # This is an additional section
-                            lesson['additional_sections'].append({
-                                'title': current_section,
-                                'content': '\n'.join(section_buffer).strip()
-                            })
-                            # Once we've seen an additional section, no more questions
-                            seen_non_question_section = True
-                        
-                        # Clear the buffer for the new section
-                        section_buffer = []
+                    # Start collecting a new question
+                    in_question = True
+                    current_question_text = line
                     
-                    header_text = header_match.group(1).strip()
-                    
-                    # Look ahead to see if the next section is questions (has numbered list)
-                    is_question_section = False
-                    if not seen_non_question_section:  # Only check for question sections if we haven't seen non-question sections
-                        for i in range(line_index + 1, min(line_index + 5, len(lines))):
-                            if i < len(lines):
-                                numbered_list_match = re.match(r'^\s*\d+\.\s+', lines[i])
-                                if numbered_list_match:
-                                    is_question_section = True
-                                    break
-                                elif lines[i].strip() and not re.match(r'^\s*$', lines[i]):
-                                    # If we encounter non-empty, non-numbered list content, it's not a question section
-                                    break
-                    
-                    # Determine the type of the new section
-                    if re.match(notes_pattern, line):
-                        current_section = header_text
-                        current_question_section = None
-                        seen_non_question_section = True
-                    elif (is_question_section or re.match(questions_pattern, line)) and not seen_non_question_section:
-                        # This is a questions section (only if we haven't seen non-question sections yet)
+                    # If this is the first question and we don't have a section yet, use default
+                    if not current_section or current_section != 'questions':
                         current_section = 'questions'
-                        
-                        # Track the question section header
-                        current_question_section = header_text
-                        if current_question_section not in lesson['question_headers']:
-                            lesson['question_headers'].append(current_question_section)
-                    else:
-                        # This is an additional section
-                        current_section = header_text
-                        current_question_section = None
+                        if questions_term not in lesson.question_headers:
+                            current_question_section = questions_term
+                            lesson.question_headers.append(current_question_section)
+                else:
+                    # This is numbered content in another section
+                    section_buffer.append(line)
+            
+            elif in_question and not seen_non_question_section:
+                # Continue collecting the current question
+                current_question_text += '\n' + line
+            
+            elif current_section:
+                # Collecting content for the current section
+                section_buffer.append(line)
+            
+            line_index += 1
+        
+        # Save any final question
+        if in_question and current_question_text and not seen_non_question_section:
+            question_obj = MarkdownProcessor._parse_question(current_question_text, current_question_section or questions_term, language_code)
+            question_list.append(question_obj)
+        
+        # Save the final section if there is one
+        if current_section:
+            if re.match(notes_pattern, f"## {current_section}"):
+                fixed_notes = MarkdownProcessor._fix_notes_numbering(section_buffer)
+                lesson.notes = '\n'.join(fixed_notes).strip()
+            elif current_section != 'questions':
+                # This is an additional section
+                lesson.additional_sections.append(Section(
+                    title=current_section,
+                    content='\n'.join(section_buffer).strip()
+                ))
+        
+        # Normalize scripture references once, resolving "Verse N" against earlier questions
+        ScriptureParser.annotate_questions(question_list)
+        
+        # Add all questions to the lesson
+        lesson.questions = question_list
+        return lesson
+        
+    @staticmethod
+    def detect_lesson_format(blocks, language_code='en'):
+        """
+        Classify the layout of a quarter from the header lines of its lessons
+        
+        Args:
+            blocks (iterable): Lesson blocks from split_lesson_blocks()
+            language_code (str): Language code for translations
+            
+        Returns:
+            str or None: 'modern' ("# LESSON 1 - TITLE"), '1895' ("# LESSON 1 — January 5, 1895"),
+                'generic' when the lessons are mixed or unrecognized, or None if there
+                are no lessons (text before the first lesson header is ignored)
+        """
+        lesson_pattern = MarkdownProcessor._get_lesson_patterns(language_code)['lesson']
+        formats = set()
+        
+        for block in blocks:
+            header = block.split('\n', 1)[0]
+            if not lesson_pattern.match(header):
+                continue
+            if MarkdownProcessor.HEADER_DATE_PATTERN.search(header):
+                formats.add('1895')
+            elif MarkdownProcessor.HEADER_TITLE_PATTERN.search(header):
+                formats.add('modern')
+            else:
+                return 'generic'
+            if len(formats) > 1:
+                return 'generic'
+        
+        return formats.pop() if formats else None
+    
+    @staticmethod
+    def parse_lesson_block_as(block, language_code='en', lesson_format='generic', report=None):
+        """
+        Parse a lesson block with the specialized parser for its layout
+        
+        Blocks the specialized parser does not fully recognize fall back to
+        the generic parser.
+        
+        Args:
+            block (str): Markdown for one lesson, starting at its header
+            language_code (str): Language code for translations
+            lesson_format (str): Layout from detect_lesson_format() ('generic' or None
+                always uses the generic parser)
+            report (dict, optional): Receives a count of blocks per parser used
+            
+        Returns:
+            Lesson: Parsed lesson
+        """
+        lesson = None
+        if lesson_format == 'modern':
+            lesson = MarkdownProcessor._parse_modern_block(block, language_code)
+        elif lesson_format == '1895':
+            lesson = MarkdownProcessor._parse_1895_block(block, language_code)
+        
+        parser = lesson_format
+        if lesson is None:
+            lesson = MarkdownProcessor.parse_lesson_block(block, language_code)
+            parser = 'generic'
+        
+        if report is not None:
+            report[parser] = report.get(parser, 0) + 1
+        return lesson
+    
+    @staticmethod
+    def format_parse_report(report):
+        """
+        Describe which parsers handled a run of lessons
+        
+        Args:
+            report (dict): Report filled by the parse functions
+            
+        Returns:
+            str: Human readable summary
+        """
+        counts = ', '.join(
+            f"{report[parser]} {parser}"
+            for parser in MarkdownProcessor.LESSON_FORMATS + ('generic',)
+            if report.get(parser)
+        )
+        return f"Lesson format: {report.get('format', 'generic')} (parsed: {counts or 'none'})"
+    
+    @staticmethod
+    def _parse_modern_block(block, language_code='en'):
+        """
+        Parse a lesson in the modern layout: "# LESSON 1 - TITLE" followed by a date line
+        
+        Args:
+            block (str): Markdown for one lesson, starting at its header
+            language_code (str): Language code for translations
+            
+        Returns:
+            Lesson or None: Parsed lesson, or None if the block is not in this layout
+        """
+        block = MarkdownProcessor.add_new_lines_to_markdown(block)
+        patterns = MarkdownProcessor._get_lesson_patterns(language_code)
+        lines = block.split('\n')
+        header = lines[0]
+        
+        if not patterns['lesson'].match(header) or MarkdownProcessor.HEADER_DATE_PATTERN.search(header):
+            return None
+        title_match = MarkdownProcessor.HEADER_TITLE_PATTERN.search(header)
+        if not title_match or not title_match.group(1).strip():
+            return None
+        
+        lesson = Lesson(title=title_match.group(1).strip())
+        number_match = patterns['number'].search(header)
+        if number_match:
+            lesson.number = number_match.group(1)
+        
+        # Date on its own line (plain or italic); as in the generic parser,
+        # the last date within the five lines after the header wins
+        line_index = 1
+        for i in range(1, min(6, len(lines))):
+            text = lines[i].strip()
+            if not text:
+                continue
+            for pattern in patterns['dates']:
+                date_match = pattern.search(text)
+                if date_match:
+                    lesson.date = date_match.group(1)
+                    line_index = i + 1
+                    break
+            for pattern in patterns['italic_dates']:
+                date_match = pattern.search(text)
+                if date_match:
+                    lesson.date = date_match.group(1)
+                    line_index = i + 1
+                    break
+        
+        return MarkdownProcessor._parse_lesson_body(lesson, lines, line_index, language_code)
+    
+    @staticmethod
+    def _parse_1895_block(block, language_code='en'):
+        """
+        Parse a lesson in the 1895 layout: "# LESSON 2 — January 12, 1895" followed by "## TITLE"
+        
+        Args:
+            block (str): Markdown for one lesson, starting at its header
+            language_code (str): Language code for translations
+            
+        Returns:
+            Lesson or None: Parsed lesson, or None if the block is not in this layout
+        """
+        block = MarkdownProcessor.add_new_lines_to_markdown(block)
+        patterns = MarkdownProcessor._get_lesson_patterns(language_code)
+        lines = block.split('\n')
+        header = lines[0]
+        
+        if not patterns['lesson'].match(header):
+            return None
+        date_match = MarkdownProcessor.HEADER_DATE_PATTERN.search(header)
+        if not date_match:
+            return None
+        
+        lesson = Lesson(date=date_match.group(1))
+        number_match = patterns['number'].search(header)
+        if number_match:
+            lesson.number = number_match.group(1)
+        
+        # The title must be the first line after the header
+        title_index = 1
+        while title_index < min(11, len(lines)) and not lines[title_index].strip():
+            title_index += 1
+        if title_index >= min(11, len(lines)):
+            return None
+        title_match = MarkdownProcessor.TITLE_HEADER_PATTERN.match(lines[title_index])
+        if not title_match:
+            return None
+        lesson.title = title_match.group(1).strip()
+        
+        return MarkdownProcessor._parse_lesson_body(lesson, lines, title_index + 1, language_code)
+    
+    @staticmethod
+    def _classify_lines(lines):
+        """
+        Classify each line once, so the section parser needs no look-ahead regexes
+        
+        Args:
+            lines (list): Lesson lines
+            
+        Returns:
+            tuple: (list of line kinds, dict of line index -> section header text)
+        """
+        kinds = []
+        headers = {}
+        for index, line in enumerate(lines):
+            header_match = MarkdownProcessor.SECTION_HEADER_PATTERN.match(line)
+            if header_match:
+                kinds.append(MarkdownProcessor.HEADER)
+                headers[index] = header_match.group(1).strip()
+            elif MarkdownProcessor.NUMBERED_LINE_PATTERN.match(line):
+                kinds.append(MarkdownProcessor.NUMBERED)
+            elif line.strip():
+                kinds.append(MarkdownProcessor.TEXT)
+            else:
+                kinds.append(MarkdownProcessor.BLANK)
+        return kinds, headers
+    
+    @staticmethod
+    def _parse_lesson_body(lesson, lines, line_index, language_code='en'):
+        """
+        Parse the preliminary note, questions, notes and additional sections of a lesson
+        
+        This follows the section rules of parse_lesson_block() exactly, working from
+        a single classification of the lines instead of repeated look-ahead scans.
+        
+        Args:
+            lesson (Lesson): Lesson with its header fields already set
+            lines (list): Lesson lines (after add_new_lines_to_markdown)
+            line_index (int): Index of the first line after the header fields
+            language_code (str): Language code for translations
+            
+        Returns:
+            Lesson: The completed lesson
+        """
+        BLANK, HEADER, NUMBERED = MarkdownProcessor.BLANK, MarkdownProcessor.HEADER, MarkdownProcessor.NUMBERED
+        patterns = MarkdownProcessor._get_lesson_patterns(language_code)
+        questions_term = patterns['questions_term']
+        notes_pattern = patterns['notes']
+        questions_pattern = patterns['questions']
+        kinds, headers = MarkdownProcessor._classify_lines(lines)
+        line_count = len(lines)
+        
+        # Find where content actually starts
+        while line_index < line_count and kinds[line_index] == BLANK:
+            line_index += 1
+        
+        # Preliminary content runs up to the first question, or to the header just before it
+        first_numbered = next((i for i in range(line_index, line_count) if kinds[i] == NUMBERED), None)
+        if first_numbered is not None and first_numbered > line_index:
+            previous = first_numbered - 1
+            while kinds[previous] == BLANK:
+                previous -= 1
+            if kinds[previous] != HEADER:
+                lesson.preliminary_note = '\n'.join(lines[line_index:first_numbered]).strip()
+                line_index = first_numbered
+            elif previous > line_index:
+                lesson.preliminary_note = '\n'.join(lines[line_index:previous]).strip()
+                line_index = previous
+        
+        # Notes detection for a section title, as the generic parser checks it
+        notes_titles = {}
+        
+        def is_notes_title(title):
+            if title not in notes_titles:
+                notes_titles[title] = bool(notes_pattern.match(f"## {title}"))
+            return notes_titles[title]
+        
+        question_list = []
+        section_buffer = []
+        current_section = None
+        current_question_section = None
+        current_question_text = ""
+        in_question = False
+        seen_non_question_section = False
+        
+        while line_index < line_count:
+            line = lines[line_index]
+            kind = kinds[line_index]
+            
+            if kind == HEADER:
+                # If we were collecting a question, save it
+                if in_question and current_question_text and not seen_non_question_section:
+                    question_list.append(MarkdownProcessor._parse_question(
+                        current_question_text, current_question_section or questions_term, language_code))
+                    current_question_text = ""
+                    in_question = False
+                
+                # Save the previous section if we have one
+                if current_section:
+                    if is_notes_title(current_section):
+                        lesson.notes = '\n'.join(MarkdownProcessor._fix_notes_numbering(section_buffer)).strip()
+                    elif current_section != 'questions':
+                        lesson.additional_sections.append(Section(
+                            title=current_section,
+                            content='\n'.join(section_buffer).strip()
+                        ))
                         seen_non_question_section = True
+                    section_buffer = []
                 
-                elif re.match(r'^\s*\d+\.\s+', line):
-                    # This is a numbered list item, which could be a question or a note
-                    
-                    # If this is immediately after the NOTES header, it's a note
-                    if current_section and re.match(notes_pattern, f"## {current_section}"):
-                        section_buffer.append(line)
-                    elif not seen_non_question_section:
-                        # This is a question (only if we haven't seen non-question sections yet)
-                        
-                        # If we were collecting a question, save it
-                        if in_question and current_question_text:
-                            question_obj = MarkdownProcessor._parse_question(current_question_text, current_question_section or questions_term, language_code)
-                            question_list.append(question_obj)
-                        
-                        # Start collecting a new question
-                        in_question = True
-                        current_question_text = line
-                        
-                        # If this is the first question and we don't have a section yet, use default
-                        if not current_section or current_section != 'questions':
-                            current_section = 'questions'
-                            if questions_term not in lesson['question_headers']:
-                                current_question_section = questions_term
-                                lesson['question_headers'].append(current_question_section)
-                    else:
-                        # This is numbered content in another section
-                        section_buffer.append(line)
+                header_text = headers[line_index]
                 
-                elif in_question and not seen_non_question_section:
-                    # Continue collecting the current question
-                    current_question_text += '\n' + line
+                # A header is a question section if the first non-blank line within the next four is numbered
+                is_question_section = False
+                if not seen_non_question_section:
+                    for i in range(line_index + 1, min(line_index + 5, line_count)):
+                        if kinds[i] != BLANK:
+                            is_question_section = kinds[i] == NUMBERED
+                            break
                 
-                elif current_section:
-                    # Collecting content for the current section
+                if notes_pattern.match(line):
+                    current_section = header_text
+                    current_question_section = None
+                    seen_non_question_section = True
+                elif (is_question_section or questions_pattern.match(line)) and not seen_non_question_section:
+                    current_section = 'questions'
+                    current_question_section = header_text
+                    if current_question_section not in lesson.question_headers:
+                        lesson.question_headers.append(current_question_section)
+                else:
+                    current_section = header_text
+                    current_question_section = None
+                    seen_non_question_section = True
+            
+            elif kind == NUMBERED:
+                if current_section and is_notes_title(current_section):
+                    section_buffer.append(line)
+                elif not seen_non_question_section:
+                    if in_question and current_question_text:
+                        question_list.append(MarkdownProcessor._parse_question(
+                            current_question_text, current_question_section or questions_term, language_code))
+                    in_question = True
+                    current_question_text = line
+                    
+                    # If this is the first question and we don't have a section yet, use default
+                    if current_section != 'questions':
+                        current_section = 'questions'
+                        if questions_term not in lesson.question_headers:
+                            current_question_section = questions_term
+                            lesson.question_headers.append(current_question_section)
+                else:
                     section_buffer.append(line)
-                
-                line_index += 1
-            
-            # Save any final question
-            if in_question and current_question_text and not seen_non_question_section:
-                question_obj = MarkdownProcessor._parse_question(current_question_text, current_question_section or questions_term, language_code)
-                question_list.append(question_obj)
-            
-            # Save the final section if there is one
-            if current_section:
-                if re.match(notes_pattern, f"## {current_section}"):
-                    fixed_notes = MarkdownProcessor._fix_notes_numbering(section_buffer)
-                    lesson['notes'] = '\n'.join(fixed_notes).strip()
-                elif current_section != 'questions':
-                    # This is an additional section
-                    lesson['additional_sections'].append({
-                        'title': current_section,
-                        'content': '\n'.join(section_buffer).strip()
-                    })
             
-            # Add all questions to the lesson
-            lesson['questions'] = question_list
+            elif in_question and not seen_non_question_section:
+                current_question_text += '\n' + line
             
-            # Add the lesson to the list
-            lessons.append(lesson)
+            elif current_section:
+                section_buffer.append(line)
+            
+            line_index += 1
         
-        return lessons
+        # Save any final question
+        if in_question and current_question_text and not seen_non_question_section:
+            question_list.append(MarkdownProcessor._parse_question(
+                current_question_text, current_question_section or questions_term, language_code))
+        
+        # Save the final section if there is one
+        if current_section:
+            if is_notes_title(current_section):
+                lesson.notes = '\n'.join(MarkdownProcessor._fix_notes_numbering(section_buffer)).strip()
+            elif current_section != 'questions':
+                lesson.additional_sections.append(Section(
+                    title=current_section,
+                    content='\n'.join(section_buffer).strip()
+                ))
         
+        # Normalize scripture references once, resolving "Verse N" against earlier questions
+        ScriptureParser.annotate_questions(question_list)
+        
+        lesson.questions = question_list
+        return lesson
+    
     @staticmethod
     def _fix_notes_numbering(lines):
         """
@@ -470,39 +1139,7 @@ class MarkdownProcessor:
         Returns:
             list: Fixed lines with correct numbering
         """
-        fixed_lines = []
-        expected_number = 1
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            num_match = re.match(r'^\s*(\d+)\.\s+', line)
-            
-            if num_match:
-                # Found a numbered item
-                current_number = int(num_match.group(1))
-                
-                # If the number is 1 but we expect a higher number
-                # and this isn't the first numbered item
-                if current_number == 1 and expected_number > 1:
-                    # Look ahead to see if the next numbered item is 2
-                    for j in range(i+1, len(lines)):
-                        next_match = re.match(r'^\s*(\d+)\.\s+', lines[j])
-                        if next_match:
-                            next_number = int(next_match.group(1))
-                            # If next is 2, this confirms it's a restart
-                            if next_number == 2:
-                                # Fix this number
-                                line = re.sub(r'^\s*\d+\.', f'{expected_number}.', line)
-                            break
-                
-                # Update expected number for next item
-                expected_number = int(num_match.group(1)) + 1
-            
-            fixed_lines.append(line)
-            i += 1
-        
-        return fixed_lines
+        return MarkdownLists.renumber_restarts(lines)
         
     @staticmethod
     def _parse_question(question_text, section_name=None, language_code='en'):
@@ -515,7 +1152,7 @@ class MarkdownProcessor:
             language_code (str): Language code for translations
             
         Returns:
-            dict: A dictionary with 'text', 'answer', 'scripture', and 'section' keys
+            Question: A question with 'text', 'scripture', and 'section' fields
         """
         # Remove the question number
         num_match = re.match(r'^\s*\d+\.\s+', question_text)
@@ -538,11 +1175,11 @@ class MarkdownProcessor:
             if answer_part.startswith('—') or answer_part.startswith('-') or answer_part.startswith('–'):
                 answer_part = answer_part[1:].strip()
         
-        return {
-            'text': question_part,
-            'scripture': answer_part,
-            'section': section_name
-        }
+        return Question(
+            text=question_part,
+            scripture=answer_part,
+            section=section_name
+        )
     
 
     @staticmethod
@@ -555,7 +1192,7 @@ class MarkdownProcessor:
             language_code (str): Language code for translations
             
         Returns:
-            list: List of question dictionaries
+            list: List of Question objects
         """
         question_list = []
         lines = markdown_content.split('\n')
@@ -586,8 +1223,32 @@ class MarkdownProcessor:
             question_obj = MarkdownProcessor._parse_question(current_question_text, None, language_code)
             question_list.append(question_obj)
         
+        ScriptureParser.annotate_questions(question_list)
         return question_list
         
+    @staticmethod
+    def parse_cache_key(markdown_file, language_code='en'):
+        """
+        Build the cache key for the parsed content of a markdown file
+        
+        The key covers everything the parse depends on: the source content,
+        the language, its translation file and the parser version.
+        
+        Args:
+            markdown_file (str): Path to the markdown file
+            language_code (str): Language code for translations
+            
+        Returns:
+            str: Cache key
+        """
+        return DiskCache.make_key(
+            'parsed-lessons',
+            DiskCache.hash_file(markdown_file),
+            language_code,
+            DiskCache.hash_file(LanguageConfig.get_language_file_path(language_code)),
+            MarkdownProcessor.PARSER_VERSION
+        )
+    
     @staticmethod
     def process_markdown_file(markdown_file, config=None):
         """
@@ -603,15 +1264,41 @@ class MarkdownProcessor:
         # Get language code from config
         language_code = config.get('language', 'en') if config else 'en'
         
-        # Read the markdown file
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Reuse an earlier parse of the same source if one is cached
+        cache = None
+        cache_key = None
+        cached = None
+        if config and config.get('cache_dir'):
+            cache = DiskCache(config['cache_dir'], 'parsed')
+            cache_key = MarkdownProcessor.parse_cache_key(markdown_file, language_code)
+            cached = cache.load(cache_key)
         
-        # Extract file sections first
-        lessons_content, frontmatter_content, backmatter_content = MarkdownProcessor.parse_file_sections(content)
-        
-        # Parse lessons from the lessons content (pass language code)
-        lessons = MarkdownProcessor.parse_lessons(lessons_content, language_code)
+        if cached:
+            print(f"Using cached parse of {markdown_file}")
+            lessons = [Lesson.from_dict(lesson) for lesson in cached['lessons']]
+            frontmatter_content = cached['frontmatter']
+            backmatter_content = cached['backmatter']
+        else:
+            matter = {}
+            report = {}
+            jobs = config.get('jobs', 1) if config else 1
+            if jobs == 1:
+                # Stream lessons from the file section by section (pass language code)
+                lessons = list(MarkdownProcessor.iter_lessons(markdown_file, language_code, matter, report))
+            else:
+                lines = MarkdownProcessor._iter_lesson_lines(markdown_file, matter)
+                blocks = list(MarkdownProcessor.split_lesson_blocks(lines, language_code))
+                lessons = MarkdownProcessor.parse_blocks(blocks, language_code, jobs, report=report)
+            print(MarkdownProcessor.format_parse_report(report))
+            frontmatter_content = matter.get('frontmatter', '')
+            backmatter_content = matter.get('backmatter', '')
+            
+            if cache:
+                cache.store(cache_key, {
+                    'lessons': [lesson.to_dict() for lesson in lessons],
+                    'frontmatter': frontmatter_content,
+                    'backmatter': backmatter_content
+                })
         
         # Apply date adjustments if reproduction settings exist
         if config and 'reproduce' in config:
@@ -620,10 +1307,10 @@ class MarkdownProcessor:
         # Log debugging information
         print(f"Found {len(lessons)} lessons")
         for lesson in lessons:
-            print(f"Lesson {lesson['number']}: {lesson['title']} ({lesson['date']})")
-            print(f"Questions: {len(lesson['questions'])}")
-            print(f"Notes: {'Yes' if lesson['notes'] else 'No'}")
-            print(f"Preliminary: {'Yes' if lesson['preliminary_note'] else 'No'}")
+            print(f"Lesson {lesson.number}: {lesson.title} ({lesson.date})")
+            print(f"Questions: {len(lesson.questions)}")
+            print(f"Notes: {'Yes' if lesson.notes else 'No'}")
+            print(f"Preliminary: {'Yes' if lesson.preliminary_note else 'No'}")
         
         # Log frontmatter and backmatter status
         print(f"Frontmatter present: {'Yes' if frontmatter_content else 'No'}")
@@ -634,4 +1321,22 @@ class MarkdownProcessor:
             'metadata': {},
             'frontmatter': frontmatter_content,
             'backmatter': backmatter_content
-        }
\ No newline at end of file
+        }
+
+
+def _parse_lesson_block(block, language_code, lesson_format='generic'):
+    """Process pool worker: parse one lesson block, returning the lesson and the parser used"""
+    report = {}
+    lesson = MarkdownProcessor.parse_lesson_block_as(block, language_code, lesson_format, report)
+    return lesson, next(iter(report))
+
+
+def _parse_markdown_file(markdown_file, language_code):
+    """Process pool worker: parse one lesson file with its front and back matter"""
+    matter = {}
+    lessons = list(MarkdownProcessor.iter_lessons(markdown_file, language_code, matter))
+    return {
+        'lessons': lessons,
+        'frontmatter': matter.get('frontmatter', ''),
+        'backmatter': matter.get('backmatter', '')
+    }
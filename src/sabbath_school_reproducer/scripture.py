@@ -0,0 +1,242 @@
+"""
+Scripture References for Sabbath School Lessons
+
+This module extracts normalized scripture references (book, chapter and
+verse ranges) from the reference text that follows each lesson question.
+"""
+
+import re
+
+from .models import Reference
+
+
+class ScriptureParser:
+    """Parses scripture reference text into Reference records."""
+
+    # Canonical book names and the abbreviations used in the lessons
+    BOOKS = {
+        'Genesis': ['Gen', 'Ge', 'Gn'],
+        'Exodus': ['Ex', 'Exod', 'Exo'],
+        'Leviticus': ['Lev', 'Le', 'Lv'],
+        'Numbers': ['Num', 'Nu', 'Nm', 'Numb'],
+        'Deuteronomy': ['Deut', 'De', 'Dt'],
+        'Joshua': ['Josh', 'Jos'],
+        'Judges': ['Judg', 'Jdg'],
+        'Ruth': ['Ru'],
+        '1 Samuel': ['1 Sam', '1 Sa'],
+        '2 Samuel': ['2 Sam', '2 Sa'],
+        '1 Kings': ['1 Kgs', '1 Ki'],
+        '2 Kings': ['2 Kgs', '2 Ki'],
+        '1 Chronicles': ['1 Chron', '1 Chr', '1 Ch'],
+        '2 Chronicles': ['2 Chron', '2 Chr', '2 Ch'],
+        'Ezra': ['Ezr'],
+        'Nehemiah': ['Neh', 'Ne'],
+        'Esther': ['Esth', 'Est'],
+        'Job': ['Jb'],
+        'Psalms': ['Ps', 'Psa', 'Psalm', 'Pss'],
+        'Proverbs': ['Prov', 'Pro', 'Pr'],
+        'Ecclesiastes': ['Eccl', 'Eccles', 'Ecc', 'Ec'],
+        'Song of Solomon': ['Song', 'Song of Songs', 'Cant', 'SS'],
+        'Isaiah': ['Isa', 'Is'],
+        'Jeremiah': ['Jer', 'Je'],
+        'Lamentations': ['Lam', 'La'],
+        'Ezekiel': ['Eze', 'Ezek', 'Ez'],
+        'Daniel': ['Dan', 'Da', 'Dn'],
+        'Hosea': ['Hos', 'Ho'],
+        'Joel': ['Jl'],
+        'Amos': ['Am'],
+        'Obadiah': ['Obad', 'Ob'],
+        'Jonah': ['Jon'],
+        'Micah': ['Mic', 'Mi'],
+        'Nahum': ['Nah', 'Na'],
+        'Habakkuk': ['Hab'],
+        'Zephaniah': ['Zeph', 'Zep'],
+        'Haggai': ['Hag'],
+        'Zechariah': ['Zech', 'Zec'],
+        'Malachi': ['Mal'],
+        'Matthew': ['Matt', 'Mat', 'Mt'],
+        'Mark': ['Mk', 'Mr'],
+        'Luke': ['Lk', 'Lu'],
+        'John': ['Jn', 'Jno'],
+        'Acts': ['Ac'],
+        'Romans': ['Rom', 'Ro'],
+        '1 Corinthians': ['1 Cor', '1 Co'],
+        '2 Corinthians': ['2 Cor', '2 Co'],
+        'Galatians': ['Gal', 'Ga'],
+        'Ephesians': ['Eph', 'Ephes'],
+        'Philippians': ['Phil', 'Php'],
+        'Colossians': ['Col'],
+        '1 Thessalonians': ['1 Thess', '1 Thes', '1 Th'],
+        '2 Thessalonians': ['2 Thess', '2 Thes', '2 Th'],
+        '1 Timothy': ['1 Tim', '1 Ti'],
+        '2 Timothy': ['2 Tim', '2 Ti'],
+        'Titus': ['Tit'],
+        'Philemon': ['Philem', 'Phm'],
+        'Hebrews': ['Heb'],
+        'James': ['Jas', 'Jam'],
+        '1 Peter': ['1 Pet', '1 Pe'],
+        '2 Peter': ['2 Pet', '2 Pe'],
+        '1 John': ['1 Jn', '1 Jno'],
+        '2 John': ['2 Jn', '2 Jno'],
+        '3 John': ['3 Jn', '3 Jno'],
+        'Jude': [],
+        'Revelation': ['Rev', 'Re', 'Rv', 'Apoc'],
+    }
+
+    # A verse, or a range of verses
+    VERSE_RANGE = r'\d+[a-c]?(?:\s*[-–]\s*\d+[a-c]?)?'
+
+    # Comma separated verse ranges, allowing notes like "(margin)" between them;
+    # a number followed by ':' starts a new chapter reference instead
+    VERSE_LIST = (rf'{VERSE_RANGE}(?:(?:\s*\([^)]*\))?\s*,\s*(?!\d+\s*:)'
+                  rf'{VERSE_RANGE})*')
+
+    REFERENCE_PATTERN = re.compile(rf"""
+        \b(?:Verses?|Vss?\.|Vs?\.)\s*(?P<relative>{VERSE_LIST})
+      | (?P<book>(?:[1-3]|I{{1,3}})\s*[A-Z][a-z]+\.?|Song\s+of\s+(?:Solomon|Songs)|[A-Z][a-z]+\.?)
+        \s*(?P<chapter>\d+)(?:\s*:\s*(?P<verses>{VERSE_LIST}))?
+      | (?<=[;,])\s*(?P<next_chapter>\d+)\s*:\s*(?P<next_verses>{VERSE_LIST})
+    """, re.VERBOSE)
+
+    _book_lookup = None
+
+    @staticmethod
+    def _get_book_lookup():
+        """
+        Get the mapping of normalized book names and abbreviations to canonical names
+
+        Returns:
+            dict: Normalized name -> canonical book name
+        """
+        if ScriptureParser._book_lookup is None:
+            lookup = {}
+            for book, abbreviations in ScriptureParser.BOOKS.items():
+                for name in [book] + abbreviations:
+                    lookup.setdefault(ScriptureParser._normalize_book(name), book)
+            ScriptureParser._book_lookup = lookup
+        return ScriptureParser._book_lookup
+
+    @staticmethod
+    def _normalize_book(name):
+        """
+        Normalize a book name for lookup
+
+        Args:
+            name (str): Book name as written (e.g., "1 Thess." or "II Cor")
+
+        Returns:
+            str: Lowercase name without periods, with a numeric prefix
+        """
+        name = re.sub(r'\s+', ' ', name.replace('.', '')).strip().lower()
+        roman = re.match(r'^(i{1,3}) (?=[a-z])', name)
+        if roman:
+            name = f"{len(roman.group(1))} {name[roman.end():]}"
+        return re.sub(r'^([1-3]) ?', r'\1 ', name)
+
+    @staticmethod
+    def lookup_book(name):
+        """
+        Get the canonical name of a book
+
+        Args:
+            name (str): Book name or abbreviation
+
+        Returns:
+            str or None: Canonical book name, or None if not a known book
+        """
+        return ScriptureParser._get_book_lookup().get(ScriptureParser._normalize_book(name))
+
+    @staticmethod
+    def parse(text, context=None):
+        """
+        Extract the scripture references from a piece of text
+
+        Relative references such as "Verse 18" and chapter references after a
+        semicolon ("Gen. 1:26; 2:7") take their book (and chapter) from the
+        reference before them.
+
+        Args:
+            text (str): Reference text (e.g., "Ex. 25:1, 8; Heb. 9:2. Note 1.")
+            context (Reference, optional): Previous reference, for leading relative references
+
+        Returns:
+            list: List of Reference objects
+        """
+        references = []
+        previous = context
+        for match in ScriptureParser.REFERENCE_PATTERN.finditer(text or ''):
+            if match.group('relative'):
+                if previous is None:
+                    continue
+                book, chapter, verses = previous.book, previous.chapter, match.group('relative')
+            elif match.group('book'):
+                book = ScriptureParser.lookup_book(match.group('book'))
+                if book is None:
+                    continue
+                chapter, verses = match.group('chapter'), match.group('verses')
+            else:
+                if previous is None:
+                    continue
+                book, chapter, verses = previous.book, match.group('next_chapter'), match.group('next_verses')
+
+            for verse_start, verse_end in ScriptureParser.parse_verses(verses):
+                previous = Reference(book=book, chapter=int(chapter),
+                                     verse_start=verse_start, verse_end=verse_end)
+                references.append(previous)
+        return references
+
+    @staticmethod
+    def parse_verses(verses):
+        """
+        Split a verse list into ranges
+
+        Args:
+            verses (str or None): Verse list (e.g., "1-3, 8"); None for a whole chapter
+
+        Returns:
+            list: (start, end) tuples; [(None, None)] for a whole chapter
+        """
+        if not verses:
+            return [(None, None)]
+
+        ranges = []
+        for item in re.findall(ScriptureParser.VERSE_RANGE, verses):
+            numbers = [int(number) for number in re.findall(r'\d+', item)]
+            start, end = numbers[0], numbers[-1]
+            ranges.append((start, max(start, end)))
+        return ranges
+
+    @staticmethod
+    def annotate_questions(questions, context=None):
+        """
+        Set the references of each question, resolving relative references in order
+
+        Args:
+            questions (list): Question objects, in lesson order
+            context (Reference, optional): Reference preceding the first question
+
+        Returns:
+            Reference or None: Last reference seen, for annotating following questions
+        """
+        for question in questions:
+            question.references = ScriptureParser.parse(question.scripture, context)
+            if question.references:
+                context = question.references[-1]
+        return context
+
+    @staticmethod
+    def format_reference(reference):
+        """
+        Format a reference for display
+
+        Args:
+            reference (Reference): Reference to format
+
+        Returns:
+            str: Reference such as "Exodus 25:1-8" or "Psalms 23"
+        """
+        if reference.verse_start is None:
+            return f"{reference.book} {reference.chapter}"
+        if reference.verse_end and reference.verse_end != reference.verse_start:
+            return f"{reference.book} {reference.chapter}:{reference.verse_start}-{reference.verse_end}"
+        return f"{reference.book} {reference.chapter}:{reference.verse_start}"
@@ -0,0 +1,471 @@
+"""
+Lesson Search Index for Sabbath School Lessons
+
+This module keeps a local SQLite FTS5 index of parsed lessons, so the
+archive of downloaded quarters can be searched when choosing which
+historical quarter to reproduce.
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+from .config import DEFAULT_CACHE_DIR
+from .models import Reference
+from .processor import MarkdownProcessor
+from .scripture import ScriptureParser
+from .utils.cache import DiskCache
+
+
+class LessonIndex:
+    """Full-text index of parsed lessons stored in a SQLite database."""
+
+    # Default location of the index database
+    DEFAULT_PATH = os.path.join(DEFAULT_CACHE_DIR, "lessons-index.sqlite")
+
+    # Bump whenever the schema or the indexed fields change
+    SCHEMA_VERSION = 2
+
+    # Lessons tree layout: .../DECADE/YEAR/QUARTER/LANGUAGE
+    TREE_PATTERN = re.compile(r'(?:^|[\\/])(\d{4})[\\/](q[1-4])[\\/]([a-z]{2,3})[\\/]?$')
+
+    # Combined files written by the run command
+    COMBINED_PATTERN = re.compile(r'combined_lessons_(\d{4})_(q[1-4])_([a-z]{2,3})_')
+
+    def __init__(self, path=None):
+        """
+        Open (and create if needed) an index database
+
+        Args:
+            path (str, optional): Database path (defaults to DEFAULT_PATH)
+        """
+        self.path = os.path.expanduser(path or self.DEFAULT_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+    def create_schema(self):
+        """Create the index tables, rebuilding them if the schema version changed"""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        with self.connection:
+            if version != self.SCHEMA_VERSION:
+                self.connection.executescript("""
+                    DROP TABLE IF EXISTS sources;
+                    DROP TABLE IF EXISTS lessons;
+                    DROP TABLE IF EXISTS lesson_text;
+                    DROP TABLE IF EXISTS refs;
+                """)
+            self.connection.executescript(f"""
+                CREATE TABLE IF NOT EXISTS sources (
+                    path TEXT PRIMARY KEY,
+                    hash TEXT NOT NULL,
+                    year INTEGER,
+                    quarter TEXT,
+                    language TEXT,
+                    indexed_at TEXT
+                );
+                CREATE TABLE IF NOT EXISTS lessons (
+                    id INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL REFERENCES sources(path),
+                    year INTEGER,
+                    quarter TEXT,
+                    language TEXT,
+                    lesson INTEGER,
+                    title TEXT,
+                    date TEXT
+                );
+                CREATE INDEX IF NOT EXISTS lessons_source ON lessons(source);
+                CREATE TABLE IF NOT EXISTS refs (
+                    lesson_id INTEGER NOT NULL REFERENCES lessons(id),
+                    question INTEGER NOT NULL,
+                    book TEXT NOT NULL,
+                    chapter INTEGER NOT NULL,
+                    verse_start INTEGER,
+                    verse_end INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS refs_passage ON refs(book, chapter, verse_start);
+                CREATE INDEX IF NOT EXISTS refs_lesson ON refs(lesson_id);
+                CREATE VIRTUAL TABLE IF NOT EXISTS lesson_text USING fts5(
+                    title, date, questions, scripture, notes,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+            """)
+
+    @staticmethod
+    def infer_source(path):
+        """
+        Work out the year, quarter and language of a lesson file from its path
+
+        Args:
+            path (str): Lessons tree directory (DECADE/YEAR/QUARTER/LANGUAGE) or
+                combined markdown file written by the run command
+
+        Returns:
+            dict: 'year', 'quarter' and 'language' (None where unknown)
+        """
+        normalized = os.path.abspath(path)
+        match = LessonIndex.TREE_PATTERN.search(normalized)
+        if not match:
+            match = LessonIndex.COMBINED_PATTERN.search(os.path.basename(normalized))
+        if not match:
+            return {'year': None, 'quarter': None, 'language': None}
+        return {'year': int(match.group(1)), 'quarter': match.group(2), 'language': match.group(3)}
+
+    @staticmethod
+    def find_sources(paths):
+        """
+        Expand paths into indexable sources
+
+        Combined markdown files are indexed as they are; directories are searched
+        for combined files and for quarter directories of a lessons tree.
+
+        Args:
+            paths (list): Files and directories
+
+        Returns:
+            list: Source paths, sorted
+        """
+        sources = set()
+        for path in paths:
+            if os.path.isfile(path):
+                sources.add(os.path.abspath(path))
+                continue
+            for directory, _, filenames in os.walk(path):
+                if LessonIndex.TREE_PATTERN.search(os.path.abspath(directory)):
+                    if any(name.startswith('week-') for name in filenames):
+                        sources.add(os.path.abspath(directory))
+                    continue
+                for filename in filenames:
+                    if filename.startswith('combined_lessons_') and filename.endswith('.md'):
+                        sources.add(os.path.abspath(os.path.join(directory, filename)))
+        return sorted(sources)
+
+    @staticmethod
+    def hash_source(path):
+        """
+        Hash a source file, or every markdown file of a quarter directory
+
+        Args:
+            path (str): Source path
+
+        Returns:
+            str or None: Hex digest, or None if the source does not exist
+        """
+        if not os.path.isdir(path):
+            return DiskCache.hash_file(path)
+
+        parts = []
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith('.md'):
+                parts.append((filename, DiskCache.hash_file(os.path.join(path, filename))))
+        return DiskCache.make_key(*parts)
+
+    def is_current(self, path, source_hash):
+        """
+        Check whether a source is already indexed with the given content hash
+
+        Args:
+            path (str): Source path
+            source_hash (str): Current content hash
+
+        Returns:
+            bool: True if the indexed copy is up to date
+        """
+        row = self.connection.execute("SELECT hash FROM sources WHERE path = ?", (path,)).fetchone()
+        return row is not None and row[0] == source_hash
+
+    def add_lessons(self, path, lessons, source_hash, year=None, quarter=None, language=None):
+        """
+        Replace the indexed lessons of a source
+
+        Args:
+            path (str): Source path
+            lessons (list): Parsed Lesson objects
+            source_hash (str): Content hash of the source
+            year (int, optional): Source year
+            quarter (str, optional): Source quarter
+            language (str, optional): Source language
+
+        Returns:
+            int: Number of lessons indexed
+        """
+        with self.connection:
+            self._delete_source(path)
+            self.connection.execute(
+                "INSERT INTO sources (path, hash, year, quarter, language, indexed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (path, source_hash, year, quarter, language, datetime.now().isoformat(timespec='seconds'))
+            )
+            for lesson in lessons:
+                cursor = self.connection.execute(
+                    "INSERT INTO lessons (source, year, quarter, language, lesson, title, date) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (path, year, quarter, language, self._lesson_number(lesson.number), lesson.title, lesson.date)
+                )
+                self.connection.execute(
+                    "INSERT INTO lesson_text (rowid, title, date, questions, scripture, notes) VALUES (?, ?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, *self.lesson_fields(lesson))
+                )
+                self.connection.executemany(
+                    "INSERT INTO refs (lesson_id, question, book, chapter, verse_start, verse_end) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(cursor.lastrowid, *row) for row in self.reference_rows(lesson)]
+                )
+        return len(lessons)
+
+    def add_file(self, path, year=None, quarter=None, language=None):
+        """
+        Index one source if it is new or has changed since it was indexed
+
+        Args:
+            path (str): Combined markdown file or quarter directory
+            year (int, optional): Source year (inferred from the path if omitted)
+            quarter (str, optional): Source quarter (inferred from the path if omitted)
+            language (str, optional): Source language (inferred from the path if omitted)
+
+        Returns:
+            int or None: Number of lessons indexed, or None if the source was unchanged
+        """
+        path = os.path.abspath(path)
+        source_hash = self.hash_source(path)
+        if self.is_current(path, source_hash):
+            return None
+
+        source = self._source_info(path, year, quarter, language)
+        lessons = list(MarkdownProcessor.iter_lessons(path, source['language'] or 'en'))
+        return self.add_lessons(path, lessons, source_hash, **source)
+
+    def update(self, paths, year=None, quarter=None, language=None, jobs=1):
+        """
+        Incrementally index every source found under the given paths
+
+        Only sources whose content changed since the last update are parsed,
+        and indexed sources that no longer exist are dropped.
+
+        Args:
+            paths (list): Files and directories to index
+            year (int, optional): Source year (inferred from each path if omitted)
+            quarter (str, optional): Source quarter (inferred from each path if omitted)
+            language (str, optional): Source language (inferred from each path if omitted)
+            jobs (int): Worker processes for parsing changed sources
+
+        Returns:
+            dict: Counts of 'indexed' and 'unchanged' sources, 'removed' sources and 'lessons'
+        """
+        changed = []
+        unchanged = 0
+        for path in self.find_sources(paths):
+            source_hash = self.hash_source(path)
+            if self.is_current(path, source_hash):
+                unchanged += 1
+            else:
+                changed.append((path, source_hash, self._source_info(path, year, quarter, language)))
+
+        # Parse changed sources per language, spreading files over the pool
+        lesson_count = 0
+        for source_language in sorted({source['language'] or 'en' for _, _, source in changed}):
+            batch = [entry for entry in changed if (entry[2]['language'] or 'en') == source_language]
+            results = MarkdownProcessor.parse_files_parallel([entry[0] for entry in batch], source_language, jobs)
+            for (path, source_hash, source), result in zip(batch, results):
+                lesson_count += self.add_lessons(path, result['lessons'], source_hash, **source)
+
+        return {
+            'indexed': len(changed),
+            'unchanged': unchanged,
+            'removed': self.remove_missing(),
+            'lessons': lesson_count
+        }
+
+    def remove_missing(self):
+        """
+        Drop indexed sources whose files no longer exist
+
+        Returns:
+            int: Number of sources removed
+        """
+        missing = [path for (path,) in self.connection.execute("SELECT path FROM sources")
+                   if not os.path.exists(path)]
+        with self.connection:
+            for path in missing:
+                self._delete_source(path)
+        return len(missing)
+
+    def search(self, query, limit=20, language=None):
+        """
+        Search the indexed lessons
+
+        Args:
+            query (str): FTS5 query; plain words are matched if it is not valid FTS5 syntax
+            limit (int): Maximum number of hits
+            language (str, optional): Only return lessons in this language
+
+        Returns:
+            list: Hit dicts with year, quarter, language, lesson, title, date, snippet and source
+        """
+        try:
+            return self._search(query, limit, language)
+        except sqlite3.OperationalError:
+            # Quote each word so punctuation such as "1:26" is not read as query syntax
+            terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+            if not terms:
+                return []
+            return self._search(' '.join(terms), limit, language)
+
+    def _search(self, query, limit, language):
+        """Run a search query against the FTS5 table"""
+        sql = """
+            SELECT lessons.year, lessons.quarter, lessons.language, lessons.lesson,
+                   lessons.title, lessons.date, lessons.source,
+                   snippet(lesson_text, -1, '[', ']', '...', 12)
+            FROM lesson_text
+            JOIN lessons ON lessons.id = lesson_text.rowid
+            WHERE lesson_text MATCH ?
+        """
+        params = [query]
+        if language:
+            sql += " AND lessons.language = ?"
+            params.append(language)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        keys = ('year', 'quarter', 'language', 'lesson', 'title', 'date', 'source', 'snippet')
+        return [dict(zip(keys, row)) for row in self.connection.execute(sql, params)]
+
+    def find_passage(self, passage, limit=50, language=None):
+        """
+        Find the questions citing a scripture passage
+
+        Args:
+            passage (str): Passage such as "Ex. 25:8", "Exodus 25:1-9" or "Ps. 23"
+            limit (int): Maximum number of hits
+            language (str, optional): Only return lessons in this language
+
+        Returns:
+            list: Hit dicts with year, quarter, language, lesson, title, date, source,
+                question and the cited reference
+        """
+        hits = []
+        for reference in ScriptureParser.parse(passage):
+            sql = """
+                SELECT lessons.year, lessons.quarter, lessons.language, lessons.lesson,
+                       lessons.title, lessons.date, lessons.source,
+                       refs.question, refs.book, refs.chapter, refs.verse_start, refs.verse_end
+                FROM refs
+                JOIN lessons ON lessons.id = refs.lesson_id
+                WHERE refs.book = ? AND refs.chapter = ?
+            """
+            params = [reference.book, reference.chapter]
+            if reference.verse_start is not None:
+                # Overlapping verse ranges; a whole-chapter citation covers every verse
+                sql += " AND (refs.verse_start IS NULL OR (refs.verse_start <= ? AND refs.verse_end >= ?))"
+                params.extend([reference.verse_end, reference.verse_start])
+            if language:
+                sql += " AND lessons.language = ?"
+                params.append(language)
+            sql += " ORDER BY lessons.year, lessons.quarter, lessons.lesson, refs.question LIMIT ?"
+            params.append(limit)
+
+            for row in self.connection.execute(sql, params):
+                cited = Reference(book=row[8], chapter=row[9], verse_start=row[10], verse_end=row[11])
+                hits.append({
+                    'year': row[0], 'quarter': row[1], 'language': row[2], 'lesson': row[3],
+                    'title': row[4], 'date': row[5], 'source': row[6], 'question': row[7],
+                    'snippet': f"Question {row[7]}: {ScriptureParser.format_reference(cited)}"
+                })
+        return hits[:limit]
+
+    @staticmethod
+    def reference_rows(lesson):
+        """
+        Get the scripture reference rows of a lesson
+
+        Args:
+            lesson (Lesson): Parsed lesson
+
+        Returns:
+            list: (question number, book, chapter, verse_start, verse_end) tuples
+        """
+        rows = []
+        for number, question in enumerate(lesson.questions, 1):
+            for reference in question.references or []:
+                rows.append((number, reference.book, reference.chapter,
+                             reference.verse_start, reference.verse_end))
+        return rows
+
+    @staticmethod
+    def lesson_fields(lesson):
+        """
+        Get the searchable text of a lesson
+
+        Args:
+            lesson (Lesson): Parsed lesson
+
+        Returns:
+            tuple: (title, date, questions, scripture, notes)
+        """
+        questions = '\n'.join(question.text for question in lesson.questions)
+        scripture = '\n'.join(question.scripture for question in lesson.questions if question.scripture)
+        notes = [lesson.preliminary_note, lesson.notes]
+        notes.extend(section.content for section in lesson.additional_sections)
+        return (lesson.title, lesson.date, questions, scripture, '\n\n'.join(note for note in notes if note))
+
+    @staticmethod
+    def format_hits(hits):
+        """
+        Format search hits for printing
+
+        Args:
+            hits (list): Hits from search()
+
+        Returns:
+            str: Human readable hit list
+        """
+        if not hits:
+            return "No matching lessons found"
+
+        lines = []
+        for hit in hits:
+            where = f"{hit['year'] or '?'} {hit['quarter'] or '?'} lesson {hit['lesson']}"
+            lines.append(f"{where} [{hit['language'] or '?'}]: {hit['title']} ({hit['date']})")
+            lines.append(f"    {hit['snippet']}")
+        return '\n'.join(lines)
+
+    def _source_info(self, path, year, quarter, language):
+        """Combine explicit source metadata with values inferred from the path"""
+        # Explicit values win: combined files are named after the target edition
+        source = self.infer_source(path)
+        return {
+            'year': year or source['year'],
+            'quarter': quarter or source['quarter'],
+            'language': language or source['language']
+        }
+
+    def _delete_source(self, path):
+        """Delete a source and its lessons (caller holds the transaction)"""
+        self.connection.execute(
+            "DELETE FROM lesson_text WHERE rowid IN (SELECT id FROM lessons WHERE source = ?)", (path,)
+        )
+        self.connection.execute(
+            "DELETE FROM refs WHERE lesson_id IN (SELECT id FROM lessons WHERE source = ?)", (path,)
+        )
+        self.connection.execute("DELETE FROM lessons WHERE source = ?", (path,))
+        self.connection.execute("DELETE FROM sources WHERE path = ?", (path,))
+
+    @staticmethod
+    def _lesson_number(number):
+        """Convert a lesson number to an integer where possible"""
+        try:
+            return int(number)
+        except (TypeError, ValueError):
+            return None
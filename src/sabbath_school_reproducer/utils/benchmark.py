@@ -0,0 +1,260 @@
+"""
+Benchmarks for Sabbath School Lesson Downloader
+
+This module measures pipeline performance offline, driving the real
+components against local stand-ins for remote services.
+"""
+
+import io
+import math
+import time
+import tempfile
+import contextlib
+from datetime import date
+
+from ..downloader import GitHubDownloader
+from ..processor import MarkdownProcessor
+from .corpus_generator import CorpusGenerator
+from .lesson_server import LessonServer
+
+
+class TimedDownloader(GitHubDownloader):
+    """GitHubDownloader that records the latency of every request."""
+
+    def __init__(self, github_paths, config=None):
+        super().__init__(github_paths, config)
+        self.latencies = []
+
+    def download_json(self, url):
+        start = time.perf_counter()
+        try:
+            return super().download_json(url)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    def download_markdown(self, url):
+        start = time.perf_counter()
+        try:
+            return super().download_markdown(url)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+
+class Benchmark:
+    """Runs and reports pipeline benchmarks."""
+
+    @staticmethod
+    def percentile(values, percent):
+        """
+        Get a nearest-rank percentile
+
+        Args:
+            values (list): Measured values
+            percent (float): Percentile between 0 and 100
+
+        Returns:
+            float: The percentile value, or 0.0 for no values
+        """
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        rank = max(1, math.ceil(percent / 100.0 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    @staticmethod
+    def sample_lessons(lesson_count=13, questions_per_lesson=12):
+        """
+        Build simple lesson files for a benchmark tree
+
+        Args:
+            lesson_count (int): Number of weeks
+            questions_per_lesson (int): Questions in each week
+
+        Returns:
+            dict: Mapping of week ID to lesson dict for LessonServer.build_lessons_tree
+        """
+        lessons = {}
+        for number in range(1, lesson_count + 1):
+            questions = "\n".join(
+                f"{q}. What does verse {q} of this passage teach? Gen. {number}:{q}."
+                for q in range(1, questions_per_lesson + 1)
+            )
+            lessons[f"week-{number:02d}"] = {
+                'title': f"Sample Lesson {number}",
+                'date': f"2025-04-{number:02d}",
+                'content': f"# Lesson {number} - Sample Lesson {number}\n\n## Questions\n\n{questions}\n"
+            }
+        return lessons
+
+    @staticmethod
+    def benchmark_download(lessons_root=None, year=1905, quarter='q2', language='en',
+                           latency=0.0, bandwidth=None, error_rate=0.0, repeat=1, seed=0):
+        """
+        Drive GitHubDownloader against a local lesson server
+
+        Args:
+            lessons_root (str, optional): Existing lessons tree; a sample tree is built if omitted
+            year (int): Year of the quarter to download
+            quarter (str): Quarter code
+            language (str): Language code
+            latency (float): Simulated per-request latency in seconds
+            bandwidth (int, optional): Simulated bandwidth in bytes per second
+            error_rate (float): Fraction of requests failing with 503
+            repeat (int): Number of full quarter downloads
+            seed (int): Seed for the error simulation
+
+        Returns:
+            dict: Request count, status counts, wall time, requests/sec and p50/p99 latency
+        """
+        with contextlib.ExitStack() as stack:
+            if not lessons_root:
+                lessons_root = stack.enter_context(tempfile.TemporaryDirectory())
+                # A realistic quarter, so transfer sizes match real week files
+                lesson_data = CorpusGenerator(start_date=date(int(year), 1, 5)).generate_lesson_data(13)
+                LessonServer.build_lessons_tree(
+                    lessons_root, year, quarter, language, lesson_data['lessons'],
+                    front_matter=lesson_data['front_matter'], back_matter=lesson_data['back_matter']
+                )
+
+            server = stack.enter_context(LessonServer(
+                lessons_root, latency=latency, bandwidth=bandwidth,
+                error_rate=error_rate, seed=seed
+            ))
+
+            year = int(year)
+            base_url = f"{server.base_url}/{year // 10 * 10}s/{year}/{quarter}/{language}"
+            github_paths = {
+                'base_url': base_url,
+                'contents_url': f"{base_url}/contents.json",
+                'front_matter_url': f"{base_url}/front-matter.md",
+                'back_matter_url': f"{base_url}/back-matter.md"
+            }
+
+            latencies = []
+            failed_runs = 0
+            start = time.perf_counter()
+            for _ in range(repeat):
+                downloader = TimedDownloader(github_paths)
+                # The downloader reports progress on stdout; keep benchmark output clean
+                with contextlib.redirect_stdout(io.StringIO()):
+                    try:
+                        downloader.download_lesson_data()
+                    except Exception:
+                        failed_runs += 1
+                latencies.extend(downloader.latencies)
+            wall_time = time.perf_counter() - start
+
+            return {
+                'requests': len(latencies),
+                'status_counts': dict(server.status_counts),
+                'failed_runs': failed_runs,
+                'wall_time': wall_time,
+                'requests_per_sec': len(latencies) / wall_time if wall_time else 0.0,
+                'p50_latency': Benchmark.percentile(latencies, 50),
+                'p99_latency': Benchmark.percentile(latencies, 99)
+            }
+
+    @staticmethod
+    def _sweep(lesson_counts, repeat, corpus_options, measure, prepare=None):
+        """
+        Time a measurement over corpora of increasing size
+
+        Args:
+            lesson_counts (list): Corpus sizes in lessons
+            repeat (int): Timed runs per size (the fastest run is reported)
+            corpus_options (dict): CorpusGenerator keyword arguments
+            measure (callable): Timed work, called with the prepared input
+            prepare (callable, optional): Untimed setup turning the combined markdown into
+                the input for measure
+
+        Returns:
+            dict: Per-size results keyed like 'lessons_13_time' and 'lessons_13_per_sec'
+        """
+        generator = CorpusGenerator(**corpus_options)
+        results = {}
+        for lesson_count in lesson_counts:
+            content = generator.generate_combined(lesson_count)
+            timings = []
+            # Parsing and rendering log progress on stdout; keep benchmark output clean
+            with contextlib.redirect_stdout(io.StringIO()):
+                data = prepare(content) if prepare else content
+                for _ in range(max(1, repeat)):
+                    start = time.perf_counter()
+                    measure(data)
+                    timings.append(time.perf_counter() - start)
+            best = min(timings)
+            results[f'lessons_{lesson_count}_time'] = best
+            results[f'lessons_{lesson_count}_per_sec'] = lesson_count / best if best else 0.0
+        return results
+
+    @staticmethod
+    def benchmark_parse(lesson_counts=(1, 13, 130, 520), repeat=3, jobs=1, **corpus_options):
+        """
+        Time parsing of synthetic combined files, from one lesson to a ten-year compilation
+
+        Args:
+            lesson_counts (list): Corpus sizes in lessons
+            repeat (int): Timed runs per size
+            jobs (int): Worker processes for parsing
+            **corpus_options: CorpusGenerator options (seed, language, layout, ...)
+
+        Returns:
+            dict: Parse time and lessons/sec per size
+        """
+        language = corpus_options.get('language', 'en')
+
+        def measure(content):
+            lessons_content, _, _ = MarkdownProcessor.parse_file_sections(content)
+            MarkdownProcessor.parse_lessons_parallel(lessons_content, language, jobs=jobs)
+
+        return Benchmark._sweep(lesson_counts, repeat, corpus_options, measure)
+
+    @staticmethod
+    def benchmark_render(lesson_counts=(1, 13, 130, 520), repeat=3, **corpus_options):
+        """
+        Time HTML rendering of parsed synthetic lessons (lesson pages and table of contents)
+
+        Args:
+            lesson_counts (list): Corpus sizes in lessons
+            repeat (int): Timed runs per size
+            **corpus_options: CorpusGenerator options (seed, language, layout, ...)
+
+        Returns:
+            dict: Render time and lessons/sec per size
+        """
+        from ..generator.html_generator import HtmlGenerator
+
+        language = corpus_options.get('language', 'en')
+
+        def prepare(content):
+            lessons_content, _, _ = MarkdownProcessor.parse_file_sections(content)
+            return MarkdownProcessor.parse_lessons(lessons_content, language)
+
+        def measure(lessons):
+            HtmlGenerator.create_table_of_contents(lessons, language)
+            for lesson in lessons:
+                HtmlGenerator.create_lesson_html(lesson, language)
+
+        return Benchmark._sweep(lesson_counts, repeat, corpus_options, measure, prepare)
+
+    @staticmethod
+    def format_report(name, results):
+        """
+        Format benchmark results for printing
+
+        Args:
+            name (str): Benchmark name
+            results (dict): Results from a benchmark function
+
+        Returns:
+            str: Human readable report
+        """
+        lines = [f"Benchmark: {name}"]
+        for key, value in results.items():
+            if isinstance(value, float):
+                if key.endswith('latency') or key.endswith('time'):
+                    value = f"{value * 1000:.2f} ms"
+                else:
+                    value = f"{value:.2f}"
+            lines.append(f"  {key.replace('_', ' ')}: {value}")
+        return '\n'.join(lines)
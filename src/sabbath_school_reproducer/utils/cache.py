@@ -0,0 +1,240 @@
+"""
+Disk Cache for Sabbath School Lesson Downloader
+
+This module stores intermediate pipeline results on disk, keyed by content
+hashes, so unchanged inputs can skip work on later runs. Rendered fragments
+also get an in-memory LRU tier in front of the disk.
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+from collections import OrderedDict
+
+
+class DiskCache:
+    """Stores pickled values in a namespaced cache directory."""
+
+    def __init__(self, cache_dir, namespace):
+        """
+        Initialize a cache namespace
+
+        Args:
+            cache_dir (str): Root cache directory
+            namespace (str): Subdirectory for this kind of cached data
+        """
+        self.directory = os.path.join(cache_dir, namespace)
+
+    def path_for(self, key, suffix='.pickle'):
+        """
+        Get the file path for a cache key
+
+        Args:
+            key (str): Cache key (a hex digest)
+            suffix (str): File suffix
+
+        Returns:
+            str: Path of the cache entry
+        """
+        return os.path.join(self.directory, key + suffix)
+
+    def load(self, key):
+        """
+        Load a cached value
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            object or None: Cached value, or None on a miss or unreadable entry
+        """
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def store(self, key, value):
+        """
+        Store a value in the cache
+
+        Args:
+            key (str): Cache key
+            value (object): Picklable value
+
+        Returns:
+            str or None: Path of the cache entry, or None if it could not be written
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return self.store_bytes(key, data, '.pickle')
+
+    def load_bytes(self, key, suffix):
+        """
+        Load raw cached bytes
+
+        Args:
+            key (str): Cache key
+            suffix (str): File suffix
+
+        Returns:
+            bytes or None: Cached data, or None on a miss
+        """
+        path = self.path_for(key, suffix)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def store_bytes(self, key, data, suffix):
+        """
+        Atomically write raw bytes to the cache
+
+        Args:
+            key (str): Cache key
+            data (bytes): Data to store
+            suffix (str): File suffix
+
+        Returns:
+            str or None: Path of the cache entry, or None if it could not be written
+        """
+        path = self.path_for(key, suffix)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+            return path
+        except OSError as e:
+            print(f"Warning: Could not write cache entry {path}: {e}")
+            return None
+
+    @staticmethod
+    def hash_file(path, chunk_size=1024 * 1024):
+        """
+        Compute the SHA-256 of a file without reading it all into memory
+
+        Args:
+            path (str): File path
+            chunk_size (int): Bytes read per step
+
+        Returns:
+            str or None: Hex digest, or None if the file does not exist
+        """
+        if not path or not os.path.exists(path):
+            return None
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Combine key parts into a single cache key
+
+        Args:
+            *parts: Values identifying the cached data
+
+        Returns:
+            str: Hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+
+class FragmentCache:
+    """Two-tier cache of rendered text fragments: an in-memory LRU backed by a DiskCache."""
+
+    # Shared caches per cache directory, so every edition in a process reuses the memory tier
+    _shared = {}
+
+    def __init__(self, cache_dir=None, namespace='fragments', max_entries=512):
+        """
+        Initialize a fragment cache
+
+        Args:
+            cache_dir (str, optional): Root cache directory for the disk tier; memory only if None
+            namespace (str): Subdirectory for the disk tier
+            max_entries (int): Fragments kept in memory before the least recently used is evicted
+        """
+        self.memory = OrderedDict()
+        self.max_entries = max_entries
+        self.disk = DiskCache(cache_dir, namespace) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def shared(cache_dir=None, namespace='fragments'):
+        """
+        Get the process-wide fragment cache for a directory
+
+        Args:
+            cache_dir (str, optional): Root cache directory for the disk tier
+            namespace (str): Subdirectory for the disk tier
+
+        Returns:
+            FragmentCache: Shared cache
+        """
+        key = (cache_dir, namespace)
+        if key not in FragmentCache._shared:
+            FragmentCache._shared[key] = FragmentCache(cache_dir, namespace)
+        return FragmentCache._shared[key]
+
+    def get(self, key):
+        """
+        Look up a fragment, promoting disk hits into memory
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            str or None: Cached fragment, or None on a miss
+        """
+        fragment = self.memory.get(key)
+        if fragment is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+        if self.disk:
+            data = self.disk.load_bytes(key, '.html')
+            if data is not None:
+                fragment = data.decode('utf-8')
+                self._remember(key, fragment)
+                self.hits += 1
+                return fragment
+
+        self.misses += 1
+        return None
+
+    def put(self, key, fragment):
+        """
+        Store a fragment in both tiers
+
+        Args:
+            key (str): Cache key
+            fragment (str): Rendered fragment
+        """
+        self._remember(key, fragment)
+        if self.disk:
+            self.disk.store_bytes(key, fragment.encode('utf-8'), '.html')
+
+    def _remember(self, key, fragment):
+        """Add a fragment to the memory tier, evicting the least recently used"""
+        self.memory[key] = fragment
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
@@ -0,0 +1,316 @@
+"""
+Synthetic Lesson Corpus for Sabbath School Lessons
+
+This module generates deterministic, realistic lesson markdown in the
+combined ``# File:`` format written by ContentAggregator, for parser and
+renderer benchmarks of any size.
+"""
+
+import random
+from datetime import date, timedelta
+
+from ..aggregator import ContentAggregator
+from .language_utils import LanguageConfig
+
+
+class CorpusGenerator:
+    """Generates synthetic quarters of lessons in the modern or 1895 layout."""
+
+    LAYOUTS = ('modern', '1895')
+
+    # Book abbreviations as printed in the lessons, with their chapter counts
+    BOOKS = [
+        ('Gen.', 50), ('Ex.', 40), ('Lev.', 27), ('Num.', 36), ('Deut.', 34),
+        ('Josh.', 24), ('1 Sam.', 31), ('1 Kings', 22), ('Ps.', 150), ('Prov.', 31),
+        ('Eccl.', 12), ('Isa.', 66), ('Jer.', 52), ('Eze.', 48), ('Dan.', 12),
+        ('Hos.', 14), ('Mal.', 4), ('Matt.', 28), ('Mark', 16), ('Luke', 24),
+        ('John', 21), ('Acts', 28), ('Rom.', 16), ('1 Cor.', 16), ('2 Cor.', 13),
+        ('Gal.', 6), ('Eph.', 6), ('Heb.', 13), ('James', 5), ('1 Peter', 5), ('Rev.', 22),
+    ]
+
+    SUBJECTS = [
+        'sanctuary', 'covenant', 'sabbath', 'law', 'priesthood', 'offering', 'tabernacle',
+        'prophecy', 'resurrection', 'judgment', 'atonement', 'creation', 'faith', 'promise',
+        'kingdom', 'temple', 'altar', 'ark', 'gospel', 'church', 'spirit', 'word', 'light',
+    ]
+
+    WORDS = [
+        'the', 'of', 'and', 'to', 'in', 'that', 'his', 'was', 'which', 'he', 'with', 'for',
+        'people', 'Lord', 'God', 'shall', 'unto', 'all', 'they', 'their', 'by', 'this',
+        'work', 'truth', 'heaven', 'earth', 'glory', 'service', 'record', 'instruction',
+        'servants', 'nation', 'house', 'wilderness', 'Israel', 'Moses', 'offerings', 'given',
+        'written', 'example', 'counsel', 'obedience', 'blessing', 'promise', 'fulfilled',
+    ]
+
+    QUESTION_STARTS = [
+        'What is said of', 'Who gave instruction concerning', 'How was', 'Why was',
+        'Where do we read of', 'What was the purpose of', 'Of what did', 'When was',
+        'What does the Scripture teach about', 'How are we to understand',
+    ]
+
+    def __init__(self, seed=0, language='en', layout='modern', questions_per_lesson=12,
+                 notes_count=3, note_length=60, additional_sections=1, tables=False,
+                 start_date=date(1895, 1, 5)):
+        """
+        Initialize a generator
+
+        Args:
+            seed (int): Seed; the same seed and settings always produce the same corpus
+            language (str): Language code, used for structural terms and month names
+            layout (str): 'modern' (title in header, date line) or '1895' (date in header,
+                question sections under ### headers)
+            questions_per_lesson (int): Questions in each lesson
+            notes_count (int): Numbered notes in each lesson
+            note_length (int): Approximate words per note
+            additional_sections (int): Extra sections (e.g. READING) per lesson
+            tables (bool): Include a markdown table in each lesson
+            start_date (date): Date of the first lesson; lessons are a week apart
+        """
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}. Choose from {', '.join(self.LAYOUTS)}")
+
+        self.seed = seed
+        self.language = language
+        self.layout = layout
+        self.questions_per_lesson = questions_per_lesson
+        self.notes_count = notes_count
+        self.note_length = note_length
+        self.additional_sections = additional_sections
+        self.tables = tables
+        self.start_date = start_date
+
+        self.terms = {
+            key: LanguageConfig.get_translation(language, key, default)
+            for key, default in (('lesson', 'LESSON'), ('questions', 'QUESTIONS'), ('notes', 'NOTES'))
+        }
+        self.month_names = LanguageConfig.get_month_names(language)
+
+    def _random(self, *parts):
+        """Get a random generator seeded by the corpus seed and the given parts"""
+        return random.Random('-'.join(str(part) for part in (self.seed, self.layout, *parts)))
+
+    def format_date(self, value):
+        """
+        Format a lesson date the way the lessons print it
+
+        Args:
+            value (date): Date to format
+
+        Returns:
+            str: Date such as "January 12, 1895"
+        """
+        return f"{self.month_names[value.month - 1]} {value.day}, {value.year}"
+
+    def lesson_date(self, number):
+        """
+        Get the date of a lesson
+
+        Args:
+            number (int): Lesson number, starting at 1
+
+        Returns:
+            date: Lesson date
+        """
+        return self.start_date + timedelta(weeks=number - 1)
+
+    def lesson_title(self, number):
+        """
+        Get the title of a lesson
+
+        Args:
+            number (int): Lesson number, starting at 1
+
+        Returns:
+            str: Lesson title
+        """
+        rng = self._random('title', number)
+        return ' '.join(rng.choice(self.SUBJECTS) for _ in range(rng.randint(1, 3))).upper()
+
+    def sentence(self, rng, words):
+        """Build a sentence of about the given number of words"""
+        text = ' '.join(rng.choice(self.WORDS) for _ in range(max(1, words)))
+        return text[0].upper() + text[1:] + '.'
+
+    def reference(self, rng):
+        """Build a book, chapter and verse reference"""
+        book, chapters = rng.choice(self.BOOKS)
+        chapter = rng.randint(1, chapters)
+        verse = rng.randint(1, 30)
+        style = rng.random()
+        if style < 0.2:
+            return f"{book} {chapter}:{verse}-{verse + rng.randint(1, 6)}."
+        if style < 0.35:
+            return f"{book} {chapter}:{verse}, {verse + rng.randint(1, 4)}."
+        return f"{book} {chapter}:{verse}."
+
+    def question(self, rng, number, note_count):
+        """
+        Build one numbered question with its reference
+
+        Args:
+            rng (random.Random): Random generator for the lesson
+            number (int): Question number
+            note_count (int): Notes in the lesson, for "Note N" pointers
+
+        Returns:
+            str: Question line
+        """
+        words = ' '.join(rng.choice(self.WORDS) for _ in range(rng.randint(3, 9)))
+        text = f"{rng.choice(self.QUESTION_STARTS)} {rng.choice(self.SUBJECTS)} {words}?"
+        style = rng.random()
+        if number == 1 or style < 0.45:
+            reference = self.reference(rng)
+        elif style < 0.7:
+            reference = f"Verse {rng.randint(1, 40)}."
+        elif style < 0.85:
+            start = rng.randint(1, 35)
+            reference = f"Verses {start}, {start + rng.randint(1, 5)}."
+        else:
+            reference = f"{self.reference(rng)[:-1]}; {self.reference(rng)}"
+        if note_count and rng.random() < 0.15:
+            reference += f" Note {rng.randint(1, note_count)}."
+        return f"{number}. {text} {reference}"
+
+    def table(self, rng):
+        """Build a small markdown table"""
+        rows = ["| Item | Measure | Reference |", "| --- | --- | --- |"]
+        for _ in range(rng.randint(3, 6)):
+            rows.append(f"| {rng.choice(self.SUBJECTS).title()} | {rng.randint(1, 60)} cubits | {self.reference(rng)[:-1]} |")
+        return '\n'.join(rows)
+
+    def generate_lesson(self, number):
+        """
+        Generate the markdown of one lesson
+
+        Args:
+            number (int): Lesson number, starting at 1
+
+        Returns:
+            str: Lesson markdown, as found in a week file
+        """
+        rng = self._random('lesson', number)
+        title = self.lesson_title(number)
+        lesson_date = self.format_date(self.lesson_date(number))
+        notes_term = self.terms['notes']
+
+        parts = []
+        if self.layout == '1895':
+            parts.append(f"# {self.terms['lesson']} {number} — {lesson_date}")
+            parts.append(f"## {title}")
+        else:
+            parts.append(f"# {self.terms['lesson']} {number} - {title}")
+            parts.append(f"*{lesson_date}*")
+            parts.append(f"**{rng.choice(self.SUBJECTS).title()} and {rng.choice(self.SUBJECTS).title()}**\n"
+                         f"*({self.reference(rng)[:-1]})*")
+
+        # Questions, split into titled sections in the 1895 layout
+        questions = [self.question(rng, q, self.notes_count) for q in range(1, self.questions_per_lesson + 1)]
+        if self.layout == '1895' and questions:
+            section_count = max(1, min(3, len(questions) // 6))
+            section_size = -(-len(questions) // section_count)
+            for start in range(0, len(questions), section_size):
+                header = ' '.join(rng.choice(self.SUBJECTS) for _ in range(2)).upper()
+                parts.append(f"### {header}")
+                parts.append('\n'.join(questions[start:start + section_size]))
+        elif questions:
+            parts.append('\n\n'.join(questions))
+
+        heading = '###' if self.layout == '1895' else '##'
+        for index in range(self.additional_sections):
+            section_title = 'READING' if index == 0 else f"{rng.choice(self.SUBJECTS).upper()} STUDY"
+            parts.append(f"{heading} {section_title}")
+            parts.append(f"\"{rng.choice(self.SUBJECTS).title()} and {rng.choice(self.SUBJECTS).title()},\" pp. "
+                         f"{rng.randint(1, 400)}, {rng.randint(1, 400)}.")
+
+        if self.tables:
+            parts.append(f"{heading} CHART")
+            parts.append(self.table(rng))
+
+        if self.notes_count:
+            parts.append(f"{heading} {notes_term}")
+            notes = []
+            for note in range(1, self.notes_count + 1):
+                words = max(5, int(rng.gauss(self.note_length, self.note_length / 4)))
+                body = ' '.join(self.sentence(rng, rng.randint(6, 18)) for _ in range(max(1, words // 12)))
+                notes.append(f"{note}. {body} {self.reference(rng)}")
+            parts.append('\n\n'.join(notes))
+
+        return '\n\n'.join(parts) + '\n'
+
+    def generate_lessons(self, lesson_count):
+        """
+        Generate week files for a run of lessons
+
+        Args:
+            lesson_count (int): Number of lessons (e.g. 13 for a quarter, 520 for ten years)
+
+        Returns:
+            dict: Week ID -> dict with 'title', 'date' and 'content', as produced by
+                GitHubDownloader.download_lesson_data (and used by LessonServer)
+        """
+        width = max(2, len(str(lesson_count)))
+        lessons = {}
+        for number in range(1, lesson_count + 1):
+            lessons[f"week-{number:0{width}d}"] = {
+                'title': self.lesson_title(number),
+                'date': self.lesson_date(number).isoformat(),
+                'content': self.generate_lesson(number)
+            }
+        return lessons
+
+    def generate_lesson_data(self, lesson_count):
+        """
+        Generate lesson data in the shape returned by the downloader
+
+        Args:
+            lesson_count (int): Number of lessons
+
+        Returns:
+            dict: 'front_matter', 'back_matter' and 'lessons'
+        """
+        rng = self._random('matter')
+        return {
+            'front_matter': f"# Sabbath School Lessons\n\n{self.sentence(rng, 40)}\n",
+            'back_matter': f"# Lesson Helps\n\n* {self.sentence(rng, 12)}\n* {self.sentence(rng, 12)}\n",
+            'lessons': self.generate_lessons(lesson_count)
+        }
+
+    def generate_combined(self, lesson_count):
+        """
+        Generate a combined markdown file in the ContentAggregator format
+
+        Args:
+            lesson_count (int): Number of lessons
+
+        Returns:
+            str: Combined markdown content
+        """
+        lesson_data = self.generate_lesson_data(lesson_count)
+
+        # Same layout as ContentAggregator.combine_lesson_content, minus its timestamp
+        combined_content = [
+            "# Combined file generated by CorpusGenerator",
+            "# Source files: synthetic lesson corpus\n\n",
+            ContentAggregator.create_file_section("front-matter.md", lesson_data['front_matter'])
+        ]
+        for week_id in sorted(lesson_data['lessons']):
+            content = lesson_data['lessons'][week_id]['content']
+            combined_content.append(ContentAggregator.create_file_section(f"{week_id}.md", content))
+        combined_content.append(ContentAggregator.create_file_section("back-matter.md", lesson_data['back_matter']))
+
+        return '\n'.join(combined_content)
+
+    def write_combined(self, output_path, lesson_count):
+        """
+        Write a combined markdown file
+
+        Args:
+            output_path (str): Path of the file to write
+            lesson_count (int): Number of lessons
+
+        Returns:
+            str: Path to the written file
+        """
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.generate_combined(lesson_count))
+        return output_path
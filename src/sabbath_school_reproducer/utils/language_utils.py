@@ -113,8 +113,7 @@ class LanguageConfig:
             language_code = 'en'
         
         # Load language file if config provided
-        file_path = None
-        file_path = f"languages/{language_code}.yaml"
+        file_path = LanguageConfig.get_language_file_path(language_code)
         # if config and 'language_config_path' in config:
         #     file_path = config['language_config_path']
         
@@ -135,6 +134,23 @@ class LanguageConfig:
         # Direct key access
         return translations.get(key, default)
     
+    @staticmethod
+    def get_language_file_path(language_code):
+        """
+        Get the path of the translation file used for a language
+        
+        Args:
+            language_code (str): Language code
+            
+        Returns:
+            str: Path to the language YAML file
+        """
+        # Default to English if language not supported
+        if language_code not in LanguageConfig.SUPPORTED_LANGUAGES:
+            language_code = 'en'
+        
+        return f"languages/{language_code}.yaml"
+    
     @staticmethod
     def get_date_formats(language_code, config=None):
         """
@@ -0,0 +1,312 @@
+"""
+Local Lesson Server for Sabbath School Lessons
+
+This module provides a local HTTP stand-in for the SabbathSchool/lessons
+GitHub repository, so downloads can be exercised and benchmarked offline.
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, unquote
+
+
+class LessonRequestHandler(BaseHTTPRequestHandler):
+    """Serves files from the lessons tree with simulated network conditions."""
+
+    # Size of each chunk written when bandwidth is throttled
+    CHUNK_SIZE = 16 * 1024
+
+    def log_message(self, format, *args):
+        """Silence the default per-request logging"""
+        pass
+
+    def do_GET(self):
+        """Handle a GET request for a file in the lessons tree"""
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        """Handle a HEAD request for a file in the lessons tree"""
+        self._handle(send_body=False)
+
+    def _handle(self, send_body):
+        """
+        Resolve the requested file and send it, a 304 or an error
+
+        Args:
+            send_body (bool): Whether to write the response body
+        """
+        server = self.server
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.should_fail():
+            self._send_status(503)
+            return
+
+        file_path = server.resolve_path(urlsplit(self.path).path)
+        if not file_path:
+            self._send_status(404)
+            return
+
+        body, etag, mtime = server.read_file(file_path)
+        last_modified = formatdate(mtime, usegmt=True)
+
+        if self._is_not_modified(etag, mtime):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            self.end_headers()
+            server.record(304)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', server.guess_type(file_path))
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+
+        # Count before writing so the client never sees an unrecorded response
+        server.record(200)
+        if send_body:
+            self._write_body(body)
+
+    def _is_not_modified(self, etag, mtime):
+        """
+        Check the conditional request headers against the file state
+
+        Args:
+            etag (str): Current entity tag of the file
+            mtime (float): Modification time of the file
+
+        Returns:
+            bool: True if the client copy is still current
+        """
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return etag in tags or '*' in tags
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+
+        return False
+
+    def _write_body(self, body):
+        """
+        Write the response body, throttled to the configured bandwidth
+
+        Args:
+            body (bytes): Response body
+        """
+        bandwidth = self.server.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+
+        for start in range(0, len(body), self.CHUNK_SIZE):
+            chunk = body[start:start + self.CHUNK_SIZE]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / bandwidth)
+
+    def _send_status(self, status):
+        """
+        Send an empty response with the given status code
+
+        Args:
+            status (int): HTTP status code
+        """
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        self.server.record(status)
+
+
+class LessonServer(ThreadingHTTPServer):
+    """Local HTTP server laid out like the SabbathSchool/lessons repository."""
+
+    daemon_threads = True
+
+    CONTENT_TYPES = {
+        '.json': 'application/json; charset=utf-8',
+        '.md': 'text/plain; charset=utf-8',
+        '.svg': 'image/svg+xml',
+    }
+
+    def __init__(self, root, host='127.0.0.1', port=0, latency=0.0, bandwidth=None,
+                 error_rate=0.0, seed=None):
+        """
+        Initialize the server over a lessons tree
+
+        Args:
+            root (str): Directory laid out as DECADE/YEAR/QUARTER/LANGUAGE/...
+            host (str): Interface to bind to
+            port (int): Port to bind to (0 picks a free port)
+            latency (float): Seconds to wait before answering each request
+            bandwidth (int, optional): Maximum bytes per second for response bodies
+            error_rate (float): Fraction of requests answered with 503
+            seed (int, optional): Seed for the error simulation
+        """
+        super().__init__((host, port), LessonRequestHandler)
+        self.root = os.path.realpath(root)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.status_counts = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """Base URL to use as ``lessons_base_url`` in the configuration"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self):
+        """Total number of requests answered so far"""
+        with self._lock:
+            return sum(self.status_counts.values())
+
+    def start(self):
+        """
+        Start serving in a background thread
+
+        Returns:
+            LessonServer: The running server
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        if self._thread:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def should_fail(self):
+        """
+        Decide whether the current request gets a simulated error
+
+        Returns:
+            bool: True if the request should fail
+        """
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def record(self, status):
+        """
+        Count a response by status code
+
+        Args:
+            status (int): HTTP status code sent
+        """
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def resolve_path(self, url_path):
+        """
+        Map a request path to a file inside the lessons tree
+
+        Args:
+            url_path (str): Path component of the request URL
+
+        Returns:
+            str or None: Absolute file path, or None if missing or outside the tree
+        """
+        relative = unquote(url_path).lstrip('/')
+        file_path = os.path.realpath(os.path.join(self.root, relative))
+        if not file_path.startswith(self.root + os.sep) or not os.path.isfile(file_path):
+            return None
+        return file_path
+
+    def read_file(self, file_path):
+        """
+        Read a file along with its entity tag and modification time
+
+        Args:
+            file_path (str): Absolute file path
+
+        Returns:
+            tuple: (body bytes, quoted ETag, mtime)
+        """
+        with open(file_path, 'rb') as f:
+            body = f.read()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        return body, etag, os.path.getmtime(file_path)
+
+    def guess_type(self, file_path):
+        """
+        Get the content type for a file
+
+        Args:
+            file_path (str): File path
+
+        Returns:
+            str: Content type header value
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        return self.CONTENT_TYPES.get(extension, 'application/octet-stream')
+
+    @staticmethod
+    def build_lessons_tree(root, year, quarter, language, lessons, front_matter="", back_matter=""):
+        """
+        Write a quarter into a directory laid out like SabbathSchool/lessons
+
+        Args:
+            root (str): Root directory of the tree
+            year (int): Year of the quarter
+            quarter (str): Quarter code (e.g., q1)
+            language (str): Language code
+            lessons (dict): Mapping of week ID to dict with 'title', 'date' and 'content'
+            front_matter (str): Front matter markdown
+            back_matter (str): Back matter markdown
+
+        Returns:
+            str: Path to the quarter's language directory
+        """
+        year = int(year)
+        quarter_dir = os.path.join(root, f"{year // 10 * 10}s", str(year), quarter, language)
+        os.makedirs(quarter_dir, exist_ok=True)
+
+        contents = {}
+        for week_id, lesson in lessons.items():
+            contents[week_id] = {'title': lesson.get('title', ''), 'date': lesson.get('date', '')}
+            with open(os.path.join(quarter_dir, f"{week_id}.md"), 'w', encoding='utf-8') as f:
+                f.write(lesson.get('content', ''))
+
+        with open(os.path.join(quarter_dir, "contents.json"), 'w', encoding='utf-8') as f:
+            json.dump(contents, f, indent=2)
+
+        if front_matter:
+            with open(os.path.join(quarter_dir, "front-matter.md"), 'w', encoding='utf-8') as f:
+                f.write(front_matter)
+        if back_matter:
+            with open(os.path.join(quarter_dir, "back-matter.md"), 'w', encoding='utf-8') as f:
+                f.write(back_matter)
+
+        return quarter_dir
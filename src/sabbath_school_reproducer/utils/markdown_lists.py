@@ -0,0 +1,81 @@
+"""
+Markdown List Utilities for Sabbath School Lessons
+
+This module normalizes numbered lists in lesson markdown (notes sections in
+particular) with a single scan over the lines.
+"""
+
+import re
+
+
+class MarkdownLists:
+    """Helpers for numbered markdown lists."""
+
+    # A numbered list item line, e.g. "3. Text"
+    NUMBERED_ITEM = re.compile(r'^\s*(\d+)\.\s+')
+
+    # The number prefix replaced when renumbering an item
+    NUMBER_PREFIX = re.compile(r'^\s*\d+\.')
+
+    @staticmethod
+    def numbered_items(lines):
+        """
+        Find the numbered list items in a list of lines
+
+        Args:
+            lines (list): Markdown lines
+
+        Returns:
+            list: (line index, item number) tuples, in line order
+        """
+        items = []
+        for index, line in enumerate(lines):
+            match = MarkdownLists.NUMBERED_ITEM.match(line)
+            if match:
+                items.append((index, int(match.group(1))))
+        return items
+
+    @staticmethod
+    def renumber_restarts(lines):
+        """
+        Continue numbering where a list restarts at 1 in the middle of a section
+
+        A "1." after higher numbers is treated as a restart (and renumbered) only
+        when the next numbered item is 2, so a genuine new list is left alone.
+
+        Args:
+            lines (list): Markdown lines
+
+        Returns:
+            list: Lines with restarted items renumbered
+        """
+        items = MarkdownLists.numbered_items(lines)
+        fixed_lines = list(lines)
+        expected_number = 1
+        for position, (index, number) in enumerate(items):
+            if number == 1 and expected_number > 1:
+                # The next numbered item is simply the next entry in items
+                if position + 1 < len(items) and items[position + 1][1] == 2:
+                    fixed_lines[index] = MarkdownLists.NUMBER_PREFIX.sub(f'{expected_number}.', lines[index], count=1)
+            expected_number = number + 1
+
+        return fixed_lines
+
+    @staticmethod
+    def indent_continuations(lines):
+        """
+        Indent every line that is not a numbered item, if any numbered item exists,
+        so paragraphs stay inside their list item when rendered
+
+        Args:
+            lines (list): Markdown lines
+
+        Returns:
+            list: Lines with continuation lines indented
+        """
+        items = MarkdownLists.numbered_items(lines)
+        if not items:
+            return list(lines)
+
+        numbered = {index for index, _ in items}
+        return [line if index in numbered else "\t" + line for index, line in enumerate(lines)]
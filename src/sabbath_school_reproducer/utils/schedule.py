@@ -0,0 +1,91 @@
+"""
+Lesson Schedules for Sabbath School Lessons
+
+This module computes the weekly dates of a quarter, with their localized date
+strings, in one batch per start date, lesson count and language. Schedules are
+cached, so editions sharing a start date and language reuse the same result.
+"""
+
+import functools
+from datetime import date, datetime, timedelta
+
+from .language_utils import LanguageConfig
+
+
+class LessonSchedule:
+    """Builds and caches weekly lesson schedules."""
+
+    # Distinct (start date, lesson count, language) schedules kept in memory
+    CACHE_SIZE = 256
+
+    @staticmethod
+    def _to_date(start_date):
+        """
+        Normalize a start date
+
+        Args:
+            start_date (str, date or datetime): Date, or a string in YYYY-MM-DD format
+
+        Returns:
+            date: The start date
+        """
+        if isinstance(start_date, datetime):
+            return start_date.date()
+        if isinstance(start_date, date):
+            return start_date
+        return datetime.strptime(start_date, '%Y-%m-%d').date()
+
+    @staticmethod
+    def build(start_date, lesson_count, language_code='en'):
+        """
+        Get the dates of a run of weekly lessons
+
+        Args:
+            start_date (str, date or datetime): Date of the first lesson (YYYY-MM-DD if a string)
+            lesson_count (int): Number of lessons
+            language_code (str): Language code used to format the dates
+
+        Returns:
+            tuple: (date, formatted date) pairs, one per lesson, a week apart
+        """
+        return _build_schedule(LessonSchedule._to_date(start_date), lesson_count, language_code)
+
+    @staticmethod
+    def build_matrix(editions):
+        """
+        Compute the schedules for a batch of editions at once
+
+        Editions that share a start date, lesson count and language share one
+        schedule, which is computed only once.
+
+        Args:
+            editions (iterable): (start date, lesson count, language code) tuples
+
+        Returns:
+            dict: (start date, lesson count, language code) -> schedule from build()
+        """
+        schedules = {}
+        for start_date, lesson_count, language_code in editions:
+            key = (LessonSchedule._to_date(start_date), lesson_count, language_code)
+            if key not in schedules:
+                schedules[key] = _build_schedule(*key)
+        return schedules
+
+    @staticmethod
+    def clear_cache():
+        """Forget cached schedules (e.g. after the language files change)"""
+        _build_schedule.cache_clear()
+
+
+@functools.lru_cache(maxsize=LessonSchedule.CACHE_SIZE)
+def _build_schedule(start_date, lesson_count, language_code):
+    """Compute a schedule; cached per (start date, lesson count, language)"""
+    # Load the month names and date template once for the whole schedule
+    month_names = LanguageConfig.get_month_names(language_code)
+    template = LanguageConfig.load_language_file(language_code).get('date_format_template', '{month} {day}, {year}')
+
+    dates = [start_date + timedelta(weeks=week) for week in range(lesson_count)]
+    return tuple(
+        (lesson_date, template.format(month=month_names[lesson_date.month - 1], day=lesson_date.day, year=lesson_date.year))
+        for lesson_date in dates
+    )
@@ -0,0 +1,290 @@
+"""
+Watch Mode for Sabbath School Lessons
+
+This module keeps a build warm between edits. It polls the configuration,
+color theme, language files, cover SVGs and combined markdown, and reruns
+only the stages a change affects; parsed lessons, rendered lesson HTML and
+fonts stay in memory between builds.
+"""
+
+import os
+import glob
+import time
+
+from .config import Config
+from .processor import MarkdownProcessor
+from .generator.html_generator import HtmlGenerator
+from .generator.preview import PreviewGenerator
+from .generator.svg_updater import SvgUpdater
+from .generator.templates import LessonTemplates
+from .utils.language_utils import LanguageConfig
+from .utils.schedule import LessonSchedule
+
+
+class FileWatcher:
+    """Detects file changes by polling modification times and sizes."""
+
+    def __init__(self, paths=()):
+        """
+        Initialize a watcher
+
+        Args:
+            paths (iterable): Files to watch
+        """
+        self.signatures = {}
+        self.watch(paths)
+
+    @staticmethod
+    def signature(path):
+        """
+        Get the state of a file that changes when it is edited
+
+        Args:
+            path (str): File path
+
+        Returns:
+            tuple or None: (modification time in ns, size), or None if the file does not exist
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def watch(self, paths):
+        """
+        Start watching files, keeping the state of files already watched
+
+        Args:
+            paths (iterable): Files to watch
+        """
+        for path in paths:
+            if path not in self.signatures:
+                self.signatures[path] = self.signature(path)
+
+    def changed(self):
+        """
+        Get the watched files that changed since the last check
+
+        Returns:
+            list: Paths of changed, created or deleted files
+        """
+        changed = []
+        for path, old in self.signatures.items():
+            new = self.signature(path)
+            if new != old:
+                self.signatures[path] = new
+                changed.append(path)
+        return changed
+
+
+class WatchSession:
+    """Rebuilds one lesson configuration whenever its input files change."""
+
+    # Pipeline stages, in the order they run
+    STAGES = ('config', 'language', 'parse', 'html', 'output')
+
+    # First stage to rerun for each kind of watched file
+    FIRST_STAGE = {
+        'config': 'config',
+        'language': 'language',
+        'source': 'parse',
+        'theme': 'html',
+        'cover': 'html',
+    }
+
+    def __init__(self, config_file, preview=False, lessons=None, lean=False, use_cache=True):
+        """
+        Initialize a watch session
+
+        Args:
+            config_file (str): Path to YAML configuration file
+            preview (bool): Write the browser preview instead of the PDF
+            lessons (str, optional): Lesson selection (see PreviewGenerator.parse_lesson_selection)
+            lean (bool): Emit minified HTML with unused CSS removed
+            use_cache (bool): Read and write cached parse results and lesson HTML
+        """
+        self.config_file = config_file
+        self.preview = preview
+        self.lessons = lessons
+        self.lean = lean
+        self.use_cache = use_cache
+
+        self.config = None
+        self.content_data = None
+        self.html_content = None
+        self.watcher = FileWatcher()
+
+        # Stages that failed or were not reached, rerun with the next build
+        self.pending = set()
+
+    def watched_files(self):
+        """
+        Get the files the build depends on
+
+        Returns:
+            dict: File path -> kind ('config', 'language', 'source', 'theme' or 'cover')
+        """
+        files = {self.config_file: 'config'}
+        for path in glob.glob(os.path.join('languages', '*.yaml')):
+            files[path] = 'language'
+        if self.config:
+            files[self.config['input_file']] = 'source'
+            if self.config.get('color_theme_path'):
+                files[self.config['color_theme_path']] = 'theme'
+            for key in ('front_cover_svg', 'back_cover_svg'):
+                if self.config.get(key):
+                    files[self.config[key]] = 'cover'
+        return files
+
+    @staticmethod
+    def stages_for(kinds):
+        """
+        Get the stages to rerun after files of the given kinds changed
+
+        Args:
+            kinds (iterable): Kinds of changed files (see watched_files)
+
+        Returns:
+            list: Stage names in pipeline order
+        """
+        first = min((WatchSession.STAGES.index(WatchSession.FIRST_STAGE[kind]) for kind in kinds), default=None)
+        return [] if first is None else list(WatchSession.STAGES[first:])
+
+    def load_config(self):
+        """Load the configuration and apply the session options"""
+        from .main import configure_run_paths
+
+        config = Config(self.config_file)
+        configure_run_paths(config, self.config_file)
+        if not self.use_cache:
+            config.config['cache_dir'] = None
+        if self.lean:
+            config.config['lean_html'] = True
+        if self.lessons:
+            config.config['output_file'] = config['output_file'].replace('.pdf', '_preview.pdf')
+        self.config = config
+
+    @staticmethod
+    def clear_language_caches():
+        """Forget translations and everything derived from them"""
+        LanguageConfig._language_cache.clear()
+        MarkdownProcessor._pattern_cache.clear()
+        LessonTemplates.clear()
+        LessonSchedule.clear_cache()
+
+    def parse(self):
+        """Parse the combined markdown file"""
+        markdown_path = self.config['input_file']
+        if not os.path.exists(markdown_path):
+            raise FileNotFoundError(f"{markdown_path} does not exist; run the configuration once to download it")
+
+        content_data = MarkdownProcessor.process_markdown_file(markdown_path, self.config.config)
+        if self.lessons:
+            content_data = PreviewGenerator.select_lessons(content_data, self.lessons)
+        self.content_data = content_data
+
+    def render_html(self):
+        """Generate the HTML document, with updated covers"""
+        covers = {}
+        for key in ('front_cover_svg', 'back_cover_svg'):
+            path = self.config.get(key)
+            covers[key] = SvgUpdater.update_svg_with_config(path, self.config.config) if path else None
+
+        self.html_content = HtmlGenerator.generate_html(
+            self.content_data,
+            front_cover_svg_path=self.config.get('front_cover_svg'),
+            back_cover_svg_path=self.config.get('back_cover_svg'),
+            config=self.config.config,
+            front_cover_svg=covers['front_cover_svg'],
+            back_cover_svg=covers['back_cover_svg']
+        )
+
+    def write_output(self):
+        """Write the preview HTML or the PDF"""
+        if self.preview:
+            preview_path = PreviewGenerator.write_preview(self.html_content, self.config['output_file'])
+            print(f"Preview HTML saved to: {preview_path}")
+        else:
+            from .generator.pdf_generator import PdfGenerator
+            PdfGenerator.generate_pdf(self.html_content, self.config['output_file'], self.config.config)
+
+    def build(self, stages):
+        """
+        Run pipeline stages in order
+
+        A failing stage is reported rather than raised, and it is retried
+        (with every later stage) on the next build.
+
+        Args:
+            stages (iterable): Stage names to run
+
+        Returns:
+            bool: True if every stage succeeded
+        """
+        actions = {
+            'config': self.load_config,
+            'language': self.clear_language_caches,
+            'parse': self.parse,
+            'html': self.render_html,
+            'output': self.write_output,
+        }
+        stages = set(stages) | self.pending
+        self.pending = set()
+        ordered = [stage for stage in self.STAGES if stage in stages]
+
+        start = time.perf_counter()
+        for index, stage in enumerate(ordered):
+            try:
+                actions[stage]()
+            except Exception as e:
+                print(f"Error in {stage} stage: {e}")
+                self.pending = set(ordered[index:])
+                return False
+        print(f"Rebuilt {', '.join(ordered)} in {time.perf_counter() - start:.2f}s")
+        return True
+
+    def check(self):
+        """
+        Rebuild the stages affected by files changed since the last check
+
+        Returns:
+            list: Stages that were run
+        """
+        files = self.watched_files()
+        self.watcher.watch(files)
+        changed = [path for path in self.watcher.changed() if path in files]
+        if not changed:
+            return []
+
+        print(f"Changed: {', '.join(changed)}")
+        stages = self.stages_for(files[path] for path in changed)
+        self.build(stages)
+        return stages
+
+    def run(self, interval=1.0, max_checks=None):
+        """
+        Build once, then rebuild whenever watched files change
+
+        Args:
+            interval (float): Seconds between checks
+            max_checks (int, optional): Stop after this many checks (runs until interrupted if None)
+
+        Returns:
+            int: Exit code
+        """
+        # Watch the configuration first, so edits made during the first build are seen
+        self.watcher.watch(self.watched_files())
+        self.build(self.STAGES)
+        self.watcher.watch(self.watched_files())
+        print(f"Watching {len(self.watcher.signatures)} files (Ctrl+C to stop)")
+
+        checks = 0
+        try:
+            while max_checks is None or checks < max_checks:
+                time.sleep(interval)
+                self.check()
+                checks += 1
+        except KeyboardInterrupt:
+            print("Stopped watching")
+        return 0
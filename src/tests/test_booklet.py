@@ -0,0 +1,67 @@
+import io
+import pydyf
+import pytest
+from sabbath_school_reproducer.generator.booklet import BookletImposer
+
+
+def make_pdf(page_count, width=612, height=792):
+    pdf = pydyf.PDF()
+    resources = pydyf.Dictionary({})
+    pdf.add_object(resources)
+    for _ in range(page_count):
+        stream = pydyf.Stream([b'0 0 10 10 re f'])
+        pdf.add_object(stream)
+        pdf.add_page(pydyf.Dictionary({
+            'Type': '/Page',
+            'Parent': pdf.pages.reference,
+            'MediaBox': pydyf.Array([0, 0, width, height]),
+            'Contents': stream.reference,
+            'Resources': resources.reference,
+        }))
+    return pdf
+
+
+class TestBookletImposer:
+    def test_saddle_stitch_order(self):
+        sides = BookletImposer.signature_order(8)
+        assert [side[:2] for side in sides] == [(7, 0), (1, 6), (5, 2), (3, 4)]
+        assert [side[2:] for side in sides] == [(0, 2), (0, 2), (1, 2), (1, 2)]
+
+    def test_pages_are_padded_with_blanks(self):
+        sides = BookletImposer.signature_order(6)
+        assert [side[:2] for side in sides] == [(None, 0), (1, None), (5, 2), (3, 4)]
+
+    def test_signatures(self):
+        sides = BookletImposer.signature_order(16, signature_pages=8)
+        assert [side[:2] for side in sides[4:]] == [(15, 8), (9, 14), (13, 10), (11, 12)]
+        # Every page is printed exactly once
+        pages = [page for side in BookletImposer.signature_order(30, 8) for page in side[:2]]
+        assert sorted(page for page in pages if page is not None) == list(range(30))
+
+    def test_invalid_signature_size(self):
+        with pytest.raises(ValueError):
+            BookletImposer.signature_order(8, signature_pages=6)
+
+    def test_creep_grows_toward_the_centre(self):
+        assert [BookletImposer.creep_shift(sheet, 3, 9) for sheet in range(3)] == [0, 4.5, 9]
+        assert BookletImposer.creep_shift(0, 1, 9) == 0
+
+    def test_impose_reuses_page_streams(self):
+        pdf = make_pdf(4)
+        contents = [pdf.objects[number]['Contents'] for number in pdf.pages['Kids'][::3]]
+
+        assert BookletImposer.impose(pdf, creep=7.2) == 2
+        assert pdf.pages['Count'] == 2
+        sheets = [pdf.objects[number] for number in pdf.pages['Kids'][::3]]
+        assert list(sheets[0]['MediaBox']) == [0, 0, 1224, 792]
+
+        # The first side shows page 4 on the left and page 1 on the right
+        x_objects = pdf.objects[BookletImposer.page_number(sheets[0]['Resources'])]['XObject']
+        assert x_objects['P3'] == contents[3] and x_objects['P0'] == contents[0]
+        form = pdf.objects[BookletImposer.page_number(contents[0])]
+        assert form.extra['Subtype'] == '/Form'
+
+        output = io.BytesIO()
+        pdf.write(output)
+        assert b'/Count 2' in output.getvalue()
+        assert output.getvalue().count(b'/Type /Page/') == 2
@@ -78,4 +78,19 @@ reproduce:
         
         # Check that GitHub paths use reproduction settings
         paths = config.get_github_paths()
-        assert "1900s/1905/q3/en" in paths["base_url"]
\ No newline at end of file
+        assert "1900s/1905/q3/en" in paths["base_url"]
+    
+    def test_lessons_base_url_override(self):
+        with open(self.config_path, "w") as f:
+            f.write("""
+year: 2025
+quarter: q2
+language: en
+input_file: ./test_input.md
+output_file: ./test_output.pdf
+lessons_base_url: http://127.0.0.1:8000/
+            """)
+        
+        config = Config(self.config_path)
+        paths = config.get_github_paths()
+        assert paths["base_url"] == "http://127.0.0.1:8000/1900s/1905/q2/en"
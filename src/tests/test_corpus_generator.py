@@ -0,0 +1,38 @@
+import io
+import pytest
+from sabbath_school_reproducer.processor import MarkdownProcessor
+from sabbath_school_reproducer.utils.corpus_generator import CorpusGenerator
+
+
+class TestCorpusGenerator:
+    def test_output_is_deterministic(self):
+        first = CorpusGenerator(seed=7, tables=True).generate_combined(5)
+        assert first == CorpusGenerator(seed=7, tables=True).generate_combined(5)
+        assert first != CorpusGenerator(seed=8, tables=True).generate_combined(5)
+    
+    def test_combined_file_parses(self):
+        generator = CorpusGenerator(questions_per_lesson=9, notes_count=2, additional_sections=2)
+        matter = {}
+        lessons = list(MarkdownProcessor.iter_lessons(io.StringIO(generator.generate_combined(4)), 'en', matter))
+        
+        assert [lesson.number for lesson in lessons] == ['1', '2', '3', '4']
+        assert lessons[0].title == generator.lesson_title(1)
+        assert lessons[1].date == 'January 12, 1895'
+        assert all(len(lesson.questions) == 9 for lesson in lessons)
+        assert [section.title for section in lessons[0].additional_sections][0] == 'READING'
+        assert lessons[0].notes.startswith('1. ')
+        assert "# Sabbath School Lessons" in matter['frontmatter']
+    
+    def test_1895_layout(self):
+        generator = CorpusGenerator(layout='1895', questions_per_lesson=18)
+        lesson = MarkdownProcessor.parse_lessons(generator.generate_lesson(2))[0]
+        
+        assert lesson.date == 'January 12, 1895'
+        assert lesson.title == generator.lesson_title(2)
+        assert len(lesson.question_headers) == 3
+        assert len(lesson.questions) == 18
+    
+    def test_week_ids_sort_in_lesson_order(self):
+        lessons = CorpusGenerator(questions_per_lesson=1, notes_count=0).generate_lessons(120)
+        assert sorted(lessons)[:2] == ['week-001', 'week-002']
+        assert sorted(lessons)[-1] == 'week-120'
@@ -0,0 +1,43 @@
+import pathlib
+import sys
+import tempfile
+from sabbath_school_reproducer.generator.cover_assets import CoverRasterizer
+from sabbath_school_reproducer.generator.html_generator import HtmlGenerator
+from sabbath_school_reproducer.utils.cache import DiskCache
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 10"><rect width="8" height="10"/></svg>'
+
+
+class TestCoverRasterizer:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        CoverRasterizer._rasterized.clear()
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+        CoverRasterizer._rasterized.clear()
+
+    def test_covers_stay_inline_by_default(self):
+        assert CoverRasterizer.artwork_html(SVG, {'cache_dir': self.temp_dir.name}) == SVG
+        assert '<svg' in HtmlGenerator.create_cover_page(None, {'year': 2025, 'quarter': 'q2'})
+
+    def test_cached_raster_is_referenced(self, monkeypatch):
+        # A cached image is used without rendering (or importing cairosvg) again
+        monkeypatch.setitem(sys.modules, 'cairosvg', None)
+        key = CoverRasterizer.make_key(SVG, 150)
+        path = DiskCache(self.temp_dir.name, 'covers').store_bytes(key, b'\x89PNG', '.png')
+        config = {'rasterize_covers': True, 'cover_dpi': 150, 'cache_dir': self.temp_dir.name}
+
+        html = CoverRasterizer.artwork_html(SVG, config)
+        assert html == f'<img class="cover-image" src="{pathlib.Path(path).resolve().as_uri()}" alt="">'
+
+    def test_key_depends_on_svg_and_resolution(self):
+        key = CoverRasterizer.make_key(SVG, 300)
+        assert CoverRasterizer.make_key(SVG, 150) != key
+        assert CoverRasterizer.make_key(SVG.replace('10', '11'), 300) != key
+
+    def test_missing_cairosvg_falls_back_to_inline_svg(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'cairosvg', None)
+        config = {'rasterize_covers': True, 'cache_dir': self.temp_dir.name}
+
+        assert CoverRasterizer.artwork_html(SVG, config) == SVG
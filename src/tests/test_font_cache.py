@@ -0,0 +1,64 @@
+import tempfile
+from sabbath_school_reproducer.generator.font_cache import FontSubsetCache
+
+
+class FakeFont:
+    def __init__(self, file_content, missing=None, index=0):
+        self.file_content = file_content
+        self.index = index
+        self.missing = missing or {}
+
+
+def fake_subset(font, to_unicode, hinting):
+    font.file_content = font.file_content[:1] + bytes(sorted(to_unicode))
+
+
+class TestFontSubsetCache:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+
+    def test_same_font_and_glyphs_are_subset_once(self):
+        cache = FontSubsetCache()
+        first, second = FakeFont(b'font'), FakeFont(b'font')
+        cache.subset(first, {3: 'a', 1: 'b'}, False, fake_subset)
+        cache.subset(second, {1: 'b', 3: 'a'}, False, fake_subset)
+
+        assert second.file_content == first.file_content == b'f\x01\x03'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_depends_on_font_glyphs_and_options(self):
+        key = FontSubsetCache.make_key(b'font', 0, {1: 'a'}, False, False)
+
+        assert FontSubsetCache.make_key(b'other', 0, {1: 'a'}, False, False) != key
+        assert FontSubsetCache.make_key(b'font', 1, {1: 'a'}, False, False) != key
+        assert FontSubsetCache.make_key(b'font', 0, {2: 'a'}, False, False) != key
+        assert FontSubsetCache.make_key(b'font', 0, {1: 'a'}, True, False) != key
+        assert FontSubsetCache.make_key(b'font', 0, {1: 'a'}, False, {5: 6}) != key
+
+    def test_faces_of_a_collection_are_cached_separately(self):
+        cache = FontSubsetCache()
+        cache.subset(FakeFont(b'collection', index=0), {1: 'a'}, False, fake_subset)
+        cache.subset(FakeFont(b'collection', index=1), {1: 'a'}, False, fake_subset)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_disk_tier_survives_new_instances(self):
+        FontSubsetCache(self.temp_dir.name).subset(FakeFont(b'font'), {2: 'a'}, False, fake_subset)
+
+        def fail(font, to_unicode, hinting):
+            raise AssertionError('subset again')
+
+        cache = FontSubsetCache(self.temp_dir.name)
+        font = FakeFont(b'font')
+        cache.subset(font, {2: 'a'}, False, fail)
+        assert font.file_content == b'f\x02'
+        assert cache.hits == 1
+
+    def test_fonts_without_used_glyphs_are_not_cached(self):
+        cache = FontSubsetCache()
+        cache.subset(FakeFont(b'font'), {}, False, fake_subset)
+
+        assert not cache.memory and cache.misses == 0
@@ -0,0 +1,76 @@
+import os
+import tempfile
+from sabbath_school_reproducer.generator.html_generator import HtmlGenerator
+from sabbath_school_reproducer.models import Lesson, Question
+from sabbath_school_reproducer.utils.cache import FragmentCache
+from sabbath_school_reproducer.utils.language_utils import LanguageConfig
+
+
+class TestFragmentCache:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = FragmentCache(max_entries=2)
+        cache.put('a', 'A')
+        cache.put('b', 'B')
+        assert cache.get('a') == 'A'
+        cache.put('c', 'C')
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 'A'
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_disk_tier_survives_new_instances(self):
+        FragmentCache(self.temp_dir.name).put('key', '<div>é</div>')
+        cache = FragmentCache(self.temp_dir.name, max_entries=1)
+
+        assert cache.get('key') == '<div>é</div>'
+        assert 'key' in cache.memory
+
+    def test_lesson_fragments_ignore_number_and_date(self):
+        cache = FragmentCache(self.temp_dir.name)
+        lesson = Lesson(number='1', title='Creation', date='January 4, 1895',
+                        questions=[Question(text='Who made the world?', scripture='Gen. 1:1')])
+        moved = Lesson.from_dict(lesson.to_dict())
+        moved.number, moved.date = '5', 'March 1, 2025'
+
+        assert HtmlGenerator.create_lesson_html_cached(lesson, 'en', cache) == HtmlGenerator.create_lesson_html(lesson)
+        html = HtmlGenerator.create_lesson_html_cached(moved, 'en', cache)
+
+        assert html == HtmlGenerator.create_lesson_html(moved)
+        assert '<div class="lesson-circle">5</div>' in html
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_date_in_preliminary_note_is_part_of_the_key(self):
+        cache = FragmentCache()
+        lesson = Lesson(number='1', title='Creation', date='January 4, 1895',
+                        preliminary_note='Golden text.\n\nJanuary 4, 1895')
+        moved = Lesson.from_dict(lesson.to_dict())
+        moved.date = 'March 1, 2025'
+
+        for item in (lesson, moved):
+            assert HtmlGenerator.create_lesson_html_cached(item, 'en', cache) == HtmlGenerator.create_lesson_html(item)
+        assert cache.misses == 2
+
+    def test_language_file_is_part_of_the_key(self, monkeypatch):
+        language_file = os.path.join(self.temp_dir.name, 'en.yaml')
+        with open(language_file, 'w') as f:
+            f.write('lesson: LESSON\n')
+        monkeypatch.setattr(LanguageConfig, 'get_language_file_path', staticmethod(lambda language_code: language_file))
+        cache = FragmentCache(self.temp_dir.name)
+        lesson = Lesson(number='1', title='Creation', date='January 4, 1895')
+
+        HtmlGenerator.create_lesson_html_cached(lesson, 'en', cache)
+        HtmlGenerator.create_lesson_html_cached(lesson, 'en', cache)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Edited labels are rendered again rather than served from the disk tier
+        with open(language_file, 'w') as f:
+            f.write('lesson: LECCIÓN\n')
+        fresh = FragmentCache(self.temp_dir.name)
+        HtmlGenerator.create_lesson_html_cached(lesson, 'en', fresh)
+        assert (fresh.hits, fresh.misses) == (0, 1)
@@ -68,6 +68,31 @@ class TestHtmlGenerator:
         assert 'Front Matter' in html
         assert 'Back Matter' in html
 
+    def test_stylesheet_does_not_depend_on_document(self):
+        def stylesheet(content_data):
+            html = HtmlGenerator.generate_html(content_data, None, None, self.config)
+            return html[html.index('<style>'):html.index('</style>')]
+
+        longer = dict(self.content_data, frontmatter='', lessons=self.content_data['lessons'] * 5)
+        css = stylesheet(self.content_data)
+
+        assert stylesheet(longer) == css
+        assert '@page :nth(1 of mainmatter)' in css
+        assert '@page :nth(1)' not in css
+
+    def test_sections_use_named_pages_and_breaks(self):
+        html = HtmlGenerator.generate_html(self.content_data, None, None, self.config)
+
+        assert html.count('class="frontmatter-container"') == 1
+        assert '<div class="recto-start">\n        <div class="front-matter">' in html
+        assert '<div class="recto-start"><div class="mainmatter-container">' in html
+
+    def test_sections_have_split_anchors(self):
+        html = HtmlGenerator.generate_html(self.content_data, None, None, self.config)
+
+        assert 'id="frontmatter"' in html
+        assert 'id="lesson-1"' in html
+
 class TestPdfGenerator:
     def test_count_pages(self, monkeypatch):
         # Mock Document class
@@ -77,4 +102,19 @@ class TestPdfGenerator:
         
         # Test the function
         page_count = PdfGenerator.count_pages_in_document(MockDoc())
-        assert page_count == 3
\ No newline at end of file
+        assert page_count == 3
+    
+    def test_verify_toc_pages(self):
+        class MockPage:
+            def __init__(self, anchors, links=()):
+                self.anchors = anchors
+                self.links = list(links)
+        
+        class MockDoc:
+            def __init__(self):
+                toc_links = [('internal', 'lesson-1', None, None), ('internal', 'lesson-2', None, None),
+                             ('internal', 'lesson-9', None, None), ('external', 'https://example.org', None, None)]
+                self.pages = [MockPage({}, toc_links), MockPage({'lesson-1': (0, 0)}), MockPage({'lesson-2': (0, 0)})]
+        
+        toc_pages = PdfGenerator.verify_toc_pages(MockDoc())
+        assert toc_pages == {'lesson-1': 2, 'lesson-2': 3, 'lesson-9': None}
@@ -0,0 +1,68 @@
+from sabbath_school_reproducer.generator.html_optimizer import HtmlOptimizer
+
+
+DOCUMENT = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+/* Lesson styles */
+.lesson { color: #333; }
+.unused, .question { margin: 0; }
+.missing-class { color: red; }
+.toc-table a.toc-page::after { content: "  {page}  "; }
+@media print { .also-missing { color: blue; } }
+@page mainmatter { margin: 0.75in; }
+    </style>
+</head>
+<body>
+    <!-- Cover page: starts at page 1 -->
+    <div class="lesson">
+        <div class="question" style="padding: 5px;">Who   <em>made</em> <strong>the</strong>&nbsp;world?</div>
+        <td style="">1</td>
+        <table class="toc-table"><tr><td><a class="toc-page" href="#lesson-1"></a></td></tr></table>
+    </div>
+    <svg viewBox="0 0 10 10"><style>.missing-class { fill: red; }</style>
+        <text style="fill: red">  Cover  </text></svg>
+</body>
+</html>"""
+
+
+class TestHtmlOptimizer:
+    def test_optimize_strips_comments_and_whitespace(self):
+        lean = HtmlOptimizer.optimize(DOCUMENT)
+
+        assert '<!--' not in lean
+        assert '<body><div class="lesson">' in lean
+        assert 'Who <em>made</em> <strong>the</strong>&nbsp;world?' in lean
+
+    def test_inline_styles_become_classes(self):
+        lean = HtmlOptimizer.optimize(DOCUMENT)
+
+        assert '<div class="question inline-style-1">' in lean
+        assert '<td>1</td>' in lean
+        assert '.inline-style-1{padding: 5px !important}' in lean
+
+    def test_unused_rules_are_pruned(self):
+        lean = HtmlOptimizer.optimize(DOCUMENT)
+        css = lean[lean.index('<style>'):lean.index('</head>')]
+
+        assert '.lesson{color: #333;}' in css
+        assert '.question{margin: 0;}' in css
+        assert '.unused' not in css and '.missing-class' not in css and '@media' not in css
+        assert 'content: "  {page}  ";' in css
+        assert '@page mainmatter{margin: 0.75in;}' in css
+
+    def test_svg_is_left_untouched(self):
+        lean = HtmlOptimizer.optimize(DOCUMENT)
+
+        assert '<style>.missing-class { fill: red; }</style>' in lean
+        assert '<text style="fill: red">  Cover  </text>' in lean
+
+    def test_split_rules_handles_strings_and_nesting(self):
+        rules = HtmlOptimizer.split_rules('@import "a;b.css"; @page { @top { content: "}"; } } p { x: 1 }')
+        assert rules == [
+            ('@import "a;b.css"', None),
+            ('@page', ' @top { content: "}"; } '),
+            ('p', ' x: 1 '),
+        ]
@@ -0,0 +1,58 @@
+import pytest
+from sabbath_school_reproducer.processor import MarkdownProcessor
+from sabbath_school_reproducer.utils.corpus_generator import CorpusGenerator
+
+
+def split_blocks(content):
+    return list(MarkdownProcessor.split_lesson_blocks(content.split('\n')))
+
+
+class TestLessonFormats:
+    @pytest.mark.parametrize("layout", CorpusGenerator.LAYOUTS)
+    def test_detects_layout(self, layout):
+        blocks = split_blocks(CorpusGenerator(layout=layout).generate_combined(3))
+        assert MarkdownProcessor.detect_lesson_format(blocks) == layout
+
+    def test_mixed_layouts_use_generic(self):
+        blocks = split_blocks(CorpusGenerator(layout='modern').generate_lesson(1)
+                              + CorpusGenerator(layout='1895').generate_lesson(2))
+        assert MarkdownProcessor.detect_lesson_format(blocks) == 'generic'
+        assert MarkdownProcessor.detect_lesson_format(["# Lesson 3\n\n## Title"]) == 'generic'
+        assert MarkdownProcessor.detect_lesson_format(["Some introduction"]) is None
+
+    @pytest.mark.parametrize("layout", CorpusGenerator.LAYOUTS)
+    @pytest.mark.parametrize("seed", range(3))
+    def test_specialized_parser_matches_generic(self, layout, seed):
+        generator = CorpusGenerator(seed=seed, layout=layout, questions_per_lesson=7,
+                                    notes_count=2, additional_sections=2, tables=True)
+        blocks = split_blocks(generator.generate_combined(4))
+        report = {}
+
+        for block in blocks:
+            specialized = MarkdownProcessor.parse_lesson_block_as(block, 'en', layout, report)
+            assert specialized == MarkdownProcessor.parse_lesson_block(block, 'en')
+        assert report[layout] == 4
+
+    def test_unrecognized_block_falls_back(self):
+        content = """# Lesson 1 - Creation
+
+January 4, 2025
+
+## Questions
+
+1. Who created the world? Gen. 1:1.
+
+# Lesson 2 -
+
+## Redemption
+
+1. Who redeems? Isa. 44:22.
+"""
+        report = {}
+        lessons = MarkdownProcessor.parse_lessons(content, 'en', report)
+
+        assert report == {'format': 'modern', 'modern': 1, 'generic': 1}
+        assert lessons[1].title == 'Redemption'
+        assert lessons[1].questions[0].references[0].book == 'Isaiah'
+        assert MarkdownProcessor.format_parse_report(report) == \
+            "Lesson format: modern (parsed: 1 modern, 1 generic)"
@@ -0,0 +1,62 @@
+import tempfile
+import requests
+from sabbath_school_reproducer.downloader import GitHubDownloader
+from sabbath_school_reproducer.utils.benchmark import Benchmark
+from sabbath_school_reproducer.utils.lesson_server import LessonServer
+
+class TestLessonServer:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        LessonServer.build_lessons_tree(
+            self.temp_dir.name, 1905, 'q2', 'en', Benchmark.sample_lessons(lesson_count=3),
+            front_matter="# Front Matter", back_matter="# Back Matter"
+        )
+    
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+    
+    def github_paths(self, server):
+        base_url = f"{server.base_url}/1900s/1905/q2/en"
+        return {
+            'base_url': base_url,
+            'contents_url': f"{base_url}/contents.json",
+            'front_matter_url': f"{base_url}/front-matter.md",
+            'back_matter_url': f"{base_url}/back-matter.md"
+        }
+    
+    def test_downloader_against_server(self):
+        with LessonServer(self.temp_dir.name) as server:
+            result = GitHubDownloader(self.github_paths(server)).download_lesson_data()
+        
+        assert result['front_matter'] == "# Front Matter"
+        assert sorted(result['lessons']) == ['week-01', 'week-02', 'week-03']
+        assert result['lessons']['week-02']['title'] == 'Sample Lesson 2'
+        assert server.status_counts == {200: 6}
+    
+    def test_not_modified(self):
+        with LessonServer(self.temp_dir.name) as server:
+            url = self.github_paths(server)['front_matter_url']
+            first = requests.get(url)
+            second = requests.get(url, headers={'If-None-Match': first.headers['ETag']})
+            third = requests.get(url, headers={'If-Modified-Since': first.headers['Last-Modified']})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert third.status_code == 304
+    
+    def test_errors_and_missing_files(self):
+        with LessonServer(self.temp_dir.name, error_rate=1.0) as server:
+            assert GitHubDownloader(self.github_paths(server)).download_markdown(
+                self.github_paths(server)['front_matter_url']) == ""
+        
+        with LessonServer(self.temp_dir.name) as server:
+            assert requests.get(f"{server.base_url}/../../etc/passwd").status_code == 404
+            assert requests.get(f"{server.base_url}/1900s/1905/q2/en/week-09.md").status_code == 404
+    
+    def test_benchmark_download(self):
+        results = Benchmark.benchmark_download(latency=0.001, repeat=2)
+        
+        assert results['requests'] == 32
+        assert results['status_counts'] == {200: 32}
+        assert results['p50_latency'] <= results['p99_latency']
+        assert results['requests_per_sec'] > 0
@@ -0,0 +1,22 @@
+import pytest
+from sabbath_school_reproducer.utils.markdown_lists import MarkdownLists
+
+
+class TestMarkdownLists:
+    def test_renumber_restarts(self):
+        lines = ["1. First", "", "2. Second", "", "1. Third", "", "2. Fourth"]
+        assert MarkdownLists.renumber_restarts(lines) == ["1. First", "", "2. Second", "", "3. Third", "", "2. Fourth"]
+    
+    def test_restart_kept_when_next_item_is_not_two(self):
+        lines = ["1. First", "2. Second", "1. New list", "5. Other"]
+        assert MarkdownLists.renumber_restarts(lines) == lines
+    
+    def test_indent_continuations(self):
+        assert MarkdownLists.indent_continuations(["1. Item", "More text"]) == ["1. Item", "\tMore text"]
+        assert MarkdownLists.indent_continuations(["Plain", "text"]) == ["Plain", "text"]
+    
+    def test_long_notes_scale_linearly(self):
+        lines = ["1. Item", "Paragraph", "2. Next"] * 20000
+        fixed = MarkdownLists.renumber_restarts(lines)
+        assert fixed[:6] == ["1. Item", "Paragraph", "2. Next", "3. Item", "Paragraph", "2. Next"]
+        assert fixed.count("3. Item") == 19999
@@ -0,0 +1,52 @@
+import pickle
+import pytest
+from sabbath_school_reproducer.models import Lesson, Question, Section
+
+class TestLessonModel:
+    def test_dict_compatible_access(self):
+        lesson = Lesson(number='1', title='Nature of Man')
+        
+        assert lesson['number'] == '1'
+        assert lesson.get('title') == 'Nature of Man'
+        assert lesson.get('original_date') is None
+        assert 'number' in lesson
+        assert 'original_date' not in lesson
+        
+        lesson['original_date'] = 'April 1, 1905'
+        assert 'original_date' in lesson
+        assert lesson.original_date == 'April 1, 1905'
+        
+        with pytest.raises(KeyError):
+            lesson['unknown'] = 'value'
+        with pytest.raises(KeyError):
+            Question()['answer']
+    
+    def test_slots_have_no_instance_dict(self):
+        for record in (Lesson(), Question(), Section()):
+            assert not hasattr(record, '__dict__')
+    
+    def test_list_defaults_are_not_shared(self):
+        first, second = Lesson(), Lesson()
+        first.questions.append(Question(text='Who?'))
+        
+        assert second.questions == []
+    
+    def test_round_trip_through_dict(self):
+        data = {
+            'number': '2',
+            'date': 'January 12, 1895',
+            'title': 'THE WORLDLY SANCTUARY',
+            'preliminary_note': '',
+            'questions': [{'text': 'Who?', 'scripture': 'Ex. 25:1.', 'section': 'QUESTIONS'}],
+            'question_headers': ['QUESTIONS'],
+            'notes': '1. A note.',
+            'additional_sections': [{'title': 'READING', 'content': 'Desire of Ages'}]
+        }
+        lesson = Lesson.from_dict(data)
+        
+        assert isinstance(lesson.questions[0], Question)
+        assert isinstance(lesson.additional_sections[0], Section)
+        assert lesson.to_dict() == data
+        assert lesson == data
+        assert Lesson.coerce(lesson) is lesson
+        assert pickle.loads(pickle.dumps(lesson)) == lesson
@@ -0,0 +1,80 @@
+import io
+import sys
+import pydyf
+from sabbath_school_reproducer.generator.pdf_optimizer import PdfOptimizer
+
+
+def make_pdf():
+    pdf = pydyf.PDF()
+    images = []
+    for _ in range(2):
+        image = pydyf.Stream([b'\x00\xff'], {'Type': '/XObject', 'Subtype': '/Image', 'Width': 1, 'Height': 1})
+        pdf.add_object(image)
+        images.append(image)
+
+    fonts = []
+    for _ in range(2):
+        font_file = pydyf.Stream([b'glyphs'], compress=True)
+        pdf.add_object(font_file)
+        descriptor = pydyf.Dictionary({'Type': '/FontDescriptor', 'FontFile2': font_file.reference})
+        pdf.add_object(descriptor)
+        font = pydyf.Dictionary({'Type': '/Font', 'FontDescriptor': descriptor.reference})
+        pdf.add_object(font)
+        fonts.append(font)
+
+    resources = pydyf.Dictionary({
+        'XObject': pydyf.Dictionary({'Im0': images[0].reference, 'Im1': images[1].reference}),
+        'Font': pydyf.Dictionary({'F0': fonts[0].reference, 'F1': fonts[1].reference}),
+    })
+    pdf.add_object(resources)
+    for _ in range(2):
+        stream = pydyf.Stream([b'/Im0 Do'])
+        pdf.add_object(stream)
+        pdf.add_page(pydyf.Dictionary({
+            'Type': '/Page',
+            'Parent': pdf.pages.reference,
+            'MediaBox': pydyf.Array([0, 0, 612, 792]),
+            'Contents': stream.reference,
+            'Resources': resources.reference,
+        }))
+    return pdf, resources
+
+
+class TestPdfOptimizer:
+    def test_identical_objects_are_merged(self):
+        pdf, resources = make_pdf()
+
+        # One image, and a font file, descriptor and font once the chain is merged
+        assert PdfOptimizer.deduplicate(pdf) == 4
+        assert resources['XObject']['Im0'] == resources['XObject']['Im1']
+        assert resources['Font']['F0'] == resources['Font']['F1']
+        assert sum(1 for obj in pdf.objects[1:] if obj.free == 'f') == 4
+
+        output = io.BytesIO()
+        pdf.write(output, compress=True)
+        assert output.getvalue().count(b'/Subtype /Image') == 1
+
+    def test_page_contents_stay_distinct(self):
+        pdf, _ = make_pdf()
+        PdfOptimizer.deduplicate(pdf)
+
+        contents = [pdf.objects[number]['Contents'] for number in pdf.pages['Kids'][::3]]
+        assert contents[0] != contents[1]
+        assert pdf.pages['Count'] == 2
+
+    def test_options(self):
+        assert PdfOptimizer.write_options() == {}
+        assert PdfOptimizer.render_options({'optimize_pdf': False}) == {}
+
+        options = PdfOptimizer.write_options({'optimize_pdf': True, 'full_fonts': True})
+        assert options['finisher'] == PdfOptimizer.finisher
+        assert options['full_fonts'] is True
+        assert PdfOptimizer.render_options({'optimize_pdf': True}) == {'optimize_images': True}
+
+    def test_linearize_without_pikepdf(self, monkeypatch, tmp_path):
+        monkeypatch.setitem(sys.modules, 'pikepdf', None)
+        path = tmp_path / 'lessons.pdf'
+        path.write_bytes(b'%PDF-1.7')
+
+        assert PdfOptimizer.linearize(str(path)) is False
+        assert path.read_bytes() == b'%PDF-1.7'
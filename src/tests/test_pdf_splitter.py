@@ -0,0 +1,70 @@
+import os
+import tempfile
+from sabbath_school_reproducer.generator.pdf_splitter import PdfSplitter
+
+
+class FakeDocument:
+    """Stands in for a rendered WeasyPrint document; pages are their numbers"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def copy(self, pages):
+        return FakeDocument(pages)
+
+    def write_pdf(self, target, **options):
+        with open(target, 'w') as f:
+            f.write(' '.join(str(page) for page in self.pages))
+
+
+ANCHORS = {
+    'frontmatter': 2,
+    'lesson-1': 5,
+    'lesson-2': 8,
+    'backmatter': 11,
+    'back-cover': 16,
+    'scripture-note': 6,
+}
+
+
+class TestPdfSplitter:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_pdf = os.path.join(self.temp_dir.name, 'lessons.pdf')
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+
+    def test_section_ranges(self):
+        assert PdfSplitter.section_ranges(ANCHORS, 16) == [
+            ('frontmatter', 2, 4),
+            ('lesson-1', 5, 7),
+            ('lesson-2', 8, 10),
+            ('backmatter', 11, 15),
+        ]
+
+    def test_last_section_runs_to_the_end(self):
+        assert PdfSplitter.section_ranges({'lesson-1': 3, 'lesson-2': 6}, 9)[-1] == ('lesson-2', 6, 9)
+
+    def test_section_path(self):
+        path = PdfSplitter.section_path(os.path.join('output', 'lessons.pdf'), 'lesson-3')
+        assert path == os.path.join('output', 'lessons_sections', 'lesson-3.pdf')
+
+    def test_write_sections(self):
+        document = FakeDocument(list(range(1, 17)))
+        paths = PdfSplitter.write_sections(document, self.output_pdf, ANCHORS, jobs=1)
+
+        assert [os.path.basename(path) for path in paths] == [
+            'frontmatter.pdf', 'lesson-1.pdf', 'lesson-2.pdf', 'backmatter.pdf']
+        with open(paths[1]) as f:
+            assert f.read() == '5 6 7'
+
+    def test_parallel_matches_serial(self):
+        document = FakeDocument(list(range(1, 17)))
+        paths = PdfSplitter.write_sections(document, self.output_pdf, ANCHORS, jobs=2)
+
+        with open(paths[-1]) as f:
+            assert f.read() == '11 12 13 14 15'
+
+    def test_no_anchors(self):
+        assert PdfSplitter.write_sections(FakeDocument([1, 2]), self.output_pdf, {}) == []
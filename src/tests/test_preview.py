@@ -0,0 +1,44 @@
+import os
+import tempfile
+import pytest
+from sabbath_school_reproducer.generator.preview import PreviewGenerator
+from sabbath_school_reproducer.generator.templates import LessonTemplates
+from sabbath_school_reproducer.models import Lesson
+
+
+class TestPreviewGenerator:
+    def test_parse_lesson_selection(self):
+        assert PreviewGenerator.parse_lesson_selection('3') == {3}
+        assert PreviewGenerator.parse_lesson_selection('1, 4-6') == {1, 4, 5, 6}
+        with pytest.raises(ValueError):
+            PreviewGenerator.parse_lesson_selection('4-')
+
+    def test_select_lessons_drops_other_content(self):
+        content_data = {
+            'lessons': [{'number': '1'}, Lesson(number='2'), {'number': '3'}],
+            'frontmatter': '# Front',
+            'backmatter': '# Back',
+        }
+        selected = PreviewGenerator.select_lessons(content_data, '2-3')
+
+        assert [lesson['number'] if isinstance(lesson, dict) else lesson.number
+                for lesson in selected['lessons']] == ['2', '3']
+        assert selected['frontmatter'] == selected['backmatter'] == ''
+        assert len(content_data['lessons']) == 3
+
+    def test_preview_html_adds_sheets(self):
+        toc = LessonTemplates.for_language('en').render_toc([Lesson(number='1', title='Faith')])
+        html = f'<html><head><style></style></head><body>{toc}</body></html>'
+        preview = PreviewGenerator.create_preview_html(html)
+
+        assert '@media screen' in preview
+        assert '<div class="toc-sheet"><div class="toc-title">' in preview
+        assert '<div class="sectionbreaknone"></div></div>' in preview
+
+    def test_write_preview_next_to_pdf(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_pdf = os.path.join(temp_dir, 'output', 'lessons_preview.pdf')
+            path = PreviewGenerator.write_preview('<html><head></head></html>', output_pdf)
+
+            assert path == os.path.join(temp_dir, 'output', 'lessons_preview.html')
+            assert os.path.exists(path)
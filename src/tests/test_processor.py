@@ -112,4 +112,86 @@ Some other content."""
         
         assert updated[0]['date'] == 'April 1, 2025'
         assert updated[1]['date'] == 'April 8, 2025'
-        assert updated[0]['original_date'] == 'January 1, 1905'
\ No newline at end of file
+        assert updated[0]['original_date'] == 'January 1, 1905'
+    
+    def test_iter_lessons_streams_combined_file(self):
+        matter = {}
+        lessons = MarkdownProcessor.iter_lessons(self.test_md_path, 'en', matter)
+        
+        first = next(lessons)
+        assert first['number'] == '1'
+        assert first['title'] == 'Nature of Man'
+        assert len(first['questions']) == 2
+        
+        rest = list(lessons)
+        assert [lesson['number'] for lesson in rest] == ['2']
+        assert "# Sabbath School Lesson Quarterly" in matter['frontmatter']
+        assert "# Lesson Helps" in matter['backmatter']
+    
+    def test_iter_lessons_matches_parse_lessons(self):
+        with open(self.test_md_path, "r") as f:
+            content = f.read()
+        lessons_content, _, _ = MarkdownProcessor.parse_file_sections(content)
+        
+        assert list(MarkdownProcessor.iter_lessons(self.test_md_path)) == MarkdownProcessor.parse_lessons(lessons_content)
+    
+    def test_iter_lessons_from_directory(self):
+        week_dir = os.path.join(self.temp_dir.name, "en")
+        os.makedirs(week_dir)
+        with open(os.path.join(week_dir, "front-matter.md"), "w") as f:
+            f.write("# Front\n")
+        with open(os.path.join(week_dir, "week-02.md"), "w") as f:
+            f.write("# Lesson 2 - Second\n\n## Questions\n\n1. Why? Gen. 1:2.\n")
+        with open(os.path.join(week_dir, "week-01.md"), "w") as f:
+            f.write("# Lesson 1 - First\n\n## Questions\n\n1. Who? Gen. 1:1.\n")
+        
+        matter = {}
+        lessons = list(MarkdownProcessor.iter_lessons(week_dir, 'en', matter))
+        
+        assert [lesson['title'] for lesson in lessons] == ['First', 'Second']
+        assert lessons[1]['questions'][0]['scripture'] == 'Gen. 1:2.'
+        assert matter['frontmatter'] == "# Front"
+    
+    def test_process_markdown_file_uses_parse_cache(self, monkeypatch):
+        config = {'language': 'en', 'cache_dir': os.path.join(self.temp_dir.name, "cache")}
+        first = MarkdownProcessor.process_markdown_file(self.test_md_path, config)
+        
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("cached parse should be reused")
+        monkeypatch.setattr(MarkdownProcessor, 'iter_lessons', fail_parse)
+        
+        second = MarkdownProcessor.process_markdown_file(self.test_md_path, config)
+        assert second['lessons'] == first['lessons']
+        assert second['frontmatter'] == first['frontmatter']
+        assert second['lessons'][0].questions[0].scripture == 'Gen. 1:26, 27.'
+    
+    def test_parse_cache_key_tracks_source(self):
+        key = MarkdownProcessor.parse_cache_key(self.test_md_path, 'en')
+        assert MarkdownProcessor.parse_cache_key(self.test_md_path, 'en') == key
+        assert MarkdownProcessor.parse_cache_key(self.test_md_path, 'es') != key
+        
+        with open(self.test_md_path, "a") as f:
+            f.write("\n")
+        assert MarkdownProcessor.parse_cache_key(self.test_md_path, 'en') != key
+    
+    def test_parse_lessons_parallel_matches_serial(self, monkeypatch):
+        with open(self.test_md_path, "r") as f:
+            content = f.read()
+        lessons_content, _, _ = MarkdownProcessor.parse_file_sections(content)
+        lessons_content = lessons_content * 3
+        monkeypatch.setattr(MarkdownProcessor, 'PARALLEL_THRESHOLD', 2)
+        
+        parallel = MarkdownProcessor.parse_lessons_parallel(lessons_content, 'en', jobs=2, chunksize=1)
+        assert parallel == MarkdownProcessor.parse_lessons(lessons_content)
+        assert [lesson.number for lesson in parallel] == ['1', '2'] * 3
+    
+    def test_parse_files_parallel_keeps_input_order(self):
+        second_path = os.path.join(self.temp_dir.name, "second.md")
+        with open(second_path, "w") as f:
+            f.write("# File: week-01.md\n#---\n\n# Lesson 7 - Other\n\n## Questions\n\n1. Why? Gen. 1:2.\n")
+        
+        results = MarkdownProcessor.parse_files_parallel([second_path, self.test_md_path], 'en', jobs=2)
+        
+        assert [lesson.number for lesson in results[0]['lessons']] == ['7']
+        assert [lesson.number for lesson in results[1]['lessons']] == ['1', '2']
+        assert "# Lesson Helps" in results[1]['backmatter']
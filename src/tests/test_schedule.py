@@ -0,0 +1,30 @@
+from datetime import date, datetime
+from sabbath_school_reproducer.utils.language_utils import LanguageConfig
+from sabbath_school_reproducer.utils.schedule import LessonSchedule
+
+
+class TestLessonSchedule:
+    def test_weekly_dates_match_format_date(self):
+        schedule = LessonSchedule.build('2025-12-20', 3, 'en')
+
+        assert [lesson_date for lesson_date, _ in schedule] == [
+            date(2025, 12, 20), date(2025, 12, 27), date(2026, 1, 3)
+        ]
+        assert [formatted for _, formatted in schedule] == [
+            LanguageConfig.format_date(datetime(2025, 12, 20), 'en'),
+            'December 27, 2025',
+            'January 3, 2026'
+        ]
+
+    def test_schedules_are_cached(self):
+        first = LessonSchedule.build('2025-01-04', 13, 'en')
+        assert LessonSchedule.build(date(2025, 1, 4), 13, 'en') is first
+        assert LessonSchedule.build(datetime(2025, 1, 4), 13, 'en') is first
+        assert len(LessonSchedule.build('2025-01-04', 14, 'en')) == 14
+
+    def test_build_matrix_shares_identical_editions(self):
+        editions = [('2025-01-04', 13, 'en'), (date(2025, 1, 4), 13, 'en'), ('2025-04-05', 13, 'en')]
+        schedules = LessonSchedule.build_matrix(editions)
+
+        assert list(schedules) == [(date(2025, 1, 4), 13, 'en'), (date(2025, 4, 5), 13, 'en')]
+        assert schedules[(date(2025, 4, 5), 13, 'en')][-1][1] == 'June 28, 2025'
@@ -0,0 +1,31 @@
+import pytest
+from sabbath_school_reproducer.models import Question
+from sabbath_school_reproducer.scripture import ScriptureParser
+
+
+def labels(references):
+    return [ScriptureParser.format_reference(reference) for reference in references]
+
+
+class TestScriptureParser:
+    def test_parse_books_and_verse_lists(self):
+        assert labels(ScriptureParser.parse("Ex. 25:1, 8.")) == ['Exodus 25:1', 'Exodus 25:8']
+        assert labels(ScriptureParser.parse("Ex. 24:12-18.")) == ['Exodus 24:12-18']
+        assert labels(ScriptureParser.parse("1 Thess. 4:13; II Cor. 5:17")) == ['1 Thessalonians 4:13', '2 Corinthians 5:17']
+        assert labels(ScriptureParser.parse("Ps. 23")) == ['Psalms 23']
+    
+    def test_parse_skips_notes_and_remarks(self):
+        text = "Ex. 26:33; Heb. 9:2 (margin), 3. See also Revised Version. Note 1."
+        assert labels(ScriptureParser.parse(text)) == ['Exodus 26:33', 'Hebrews 9:2', 'Hebrews 9:3']
+    
+    def test_parse_resolves_relative_references(self):
+        assert labels(ScriptureParser.parse("Isa. 7:14. Verse 18.")) == ['Isaiah 7:14', 'Isaiah 7:18']
+        assert labels(ScriptureParser.parse("Gen. 1:26; 2:7")) == ['Genesis 1:26', 'Genesis 2:7']
+        assert ScriptureParser.parse("Verse 9.") == []
+    
+    def test_annotate_questions_carries_context(self):
+        questions = [Question(scripture="Ex. 25:1, 8."), Question(scripture="Verses 3-7."), Question(scripture="")]
+        ScriptureParser.annotate_questions(questions)
+        
+        assert labels(questions[1].references) == ['Exodus 25:3-7']
+        assert questions[2].references == []
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import pytest
+from sabbath_school_reproducer.search_index import LessonIndex
+from sabbath_school_reproducer.utils.lesson_server import LessonServer
+
+
+class TestLessonIndex:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tree = os.path.join(self.temp_dir.name, "lessons")
+        LessonServer.build_lessons_tree(self.tree, 1905, 'q2', 'en', {
+            'week-01': {'content': "# Lesson 1 - Nature of Man\n\n## Questions\n\n"
+                                   "1. Of what was man formed? Gen. 2:7.\n\n## Notes\n\n1. Dust of the ground.\n"},
+            'week-02': {'content': "# Lesson 2 - The Sanctuary\n\n## Questions\n\n"
+                                   "1. What did Moses build? Ex. 25:8.\n"}
+        })
+        self.index = LessonIndex(os.path.join(self.temp_dir.name, "index.sqlite"))
+    
+    def teardown_method(self):
+        self.index.close()
+        self.temp_dir.cleanup()
+    
+    def test_infer_source(self):
+        quarter_dir = os.path.join(self.tree, "1900s", "1905", "q2", "en")
+        assert LessonIndex.infer_source(quarter_dir) == {'year': 1905, 'quarter': 'q2', 'language': 'en'}
+        assert LessonIndex.infer_source("combined_lessons_2025_q1_swa_1_null.md")['language'] == 'swa'
+    
+    def test_update_prefers_explicit_source(self):
+        combined = os.path.join(self.temp_dir.name, "combined_lessons_2025_q2_en_1_null.md")
+        with open(combined, "w") as f:
+            f.write("# File: week-01.md\n#" + "-" * 78 + "\n\n# Lesson 1 - Nature of Man\n\n"
+                    "## Questions\n\n1. Of what was man formed? Gen. 2:7.\n")
+        
+        self.index.update([combined], year=1905, quarter='q1')
+        
+        hits = self.index.search("man")
+        assert (hits[0]['year'], hits[0]['quarter'], hits[0]['language']) == (1905, 'q1', 'en')
+    
+    def test_search_returns_lesson_hits(self):
+        counts = self.index.update([self.tree])
+        assert counts['indexed'] == 1
+        assert counts['lessons'] == 2
+        
+        hits = self.index.search("sanctuary")
+        assert len(hits) == 1
+        assert (hits[0]['year'], hits[0]['quarter'], hits[0]['lesson']) == (1905, 'q2', 2)
+        
+        assert [hit['lesson'] for hit in self.index.search("dust")] == [1]
+        assert [hit['lesson'] for hit in self.index.search("Gen. 2:7")] == [1]
+    
+    def test_update_is_incremental(self):
+        self.index.update([self.tree])
+        assert self.index.update([self.tree])['indexed'] == 0
+        
+        week_file = os.path.join(self.tree, "1900s", "1905", "q2", "en", "week-02.md")
+        with open(week_file, "a") as f:
+            f.write("2. What is the mercy seat? Ex. 25:17.\n")
+        counts = self.index.update([self.tree])
+        
+        assert counts['indexed'] == 1
+        assert len(self.index.search("mercy")) == 1
+        assert len(self.index.search("sanctuary")) == 1
+    
+    def test_find_passage_matches_overlapping_references(self):
+        self.index.update([self.tree])
+        
+        hits = self.index.find_passage("Exodus 25:1-10")
+        assert [(hit['lesson'], hit['question']) for hit in hits] == [(2, 1)]
+        assert hits[0]['year'] == 1905
+        assert self.index.find_passage("Gen. 2:8") == []
+        assert [hit['lesson'] for hit in self.index.find_passage("Gen. 2")] == [1]
@@ -0,0 +1,87 @@
+import os
+import sys
+import gzip
+import tempfile
+from sabbath_school_reproducer.generator.site_exporter import SiteExporter
+
+
+def make_lesson(number, title):
+    return {
+        'number': number,
+        'title': title,
+        'date': 'April 1, 2025',
+        'questions': [{'text': 'Test question?', 'scripture': 'Gen. 1:1.', 'answer': ''}],
+        'notes': 'Test note.',
+        'preliminary_note': 'This is a test.'
+    }
+
+
+class TestSiteExporter:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.site_dir = os.path.join(self.temp_dir.name, 'site')
+        self.content_data = {
+            'lessons': [make_lesson('1', 'Faith'), make_lesson('2', 'Hope')],
+            'frontmatter': '# Front Matter\nTest front matter content.',
+            'backmatter': '# Back Matter\nTest back matter content.',
+        }
+        self.config = {'year': 2025, 'quarter': 'q2', 'title': 'Test Lessons'}
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+
+    def read(self, name):
+        with open(os.path.join(self.site_dir, name), encoding='utf-8') as f:
+            return f.read()
+
+    def test_one_page_per_lesson(self):
+        SiteExporter.export_site(self.content_data, self.site_dir, self.config)
+        files = sorted(os.listdir(self.site_dir))
+
+        assert [name for name in files if name.endswith('.html')] == [
+            'backmatter.html', 'index.html', 'lesson-1.html', 'lesson-2.html']
+        index = self.read('index.html')
+        assert 'href="lesson-2.html"' in index
+        assert 'href="#lesson-' not in index
+        assert 'Test front matter content.' in index
+
+        lesson = self.read('lesson-2.html')
+        assert 'Hope' in lesson
+        assert 'href="lesson-1.html"' in lesson and 'href="backmatter.html"' in lesson
+
+    def test_stylesheet_name_follows_content(self):
+        SiteExporter.export_site(self.content_data, self.site_dir, self.config)
+        stylesheets = [name for name in os.listdir(self.site_dir) if name.endswith('.css')]
+
+        assert len(stylesheets) == 1
+        with open(os.path.join(self.site_dir, stylesheets[0]), 'rb') as f:
+            assert SiteExporter.hashed_name('styles.css', f.read()) == stylesheets[0]
+        assert f'href="{stylesheets[0]}"' in self.read('index.html')
+        assert SiteExporter.hashed_name('styles.css', b'a') != SiteExporter.hashed_name('styles.css', b'b')
+
+    def test_cover_is_hashed_asset(self):
+        svg = '<svg xmlns="http://www.w3.org/2000/svg"></svg>'
+        SiteExporter.export_site(self.content_data, self.site_dir, self.config, front_cover_svg=svg)
+
+        cover = SiteExporter.hashed_name('cover.svg', svg.encode('utf-8'))
+        assert os.path.exists(os.path.join(self.site_dir, cover))
+        assert f'src="{cover}"' in self.read('index.html')
+
+    def test_precompressed_files(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'brotli', None)
+        config = dict(self.config, site_precompress=True)
+        written = SiteExporter.export_site(self.content_data, self.site_dir, config)
+
+        assert os.path.join(self.site_dir, 'index.html.gz') in written
+        assert not any(path.endswith('.br') for path in written)
+        with gzip.open(os.path.join(self.site_dir, 'lesson-1.html.gz'), 'rt', encoding='utf-8') as f:
+            assert f.read() == self.read('lesson-1.html')
+
+    def test_encodings(self):
+        assert SiteExporter.get_encodings({}) == []
+        assert SiteExporter.get_encodings({'site_precompress': True}) == ['gzip', 'br']
+        assert SiteExporter.get_encodings({'site_precompress': 'gzip'}) == ['gzip']
+
+    def test_site_dir(self):
+        assert SiteExporter.get_site_dir({'output_file': os.path.join('output', 'q2.pdf')}) == os.path.join('output', 'q2_site')
+        assert SiteExporter.get_site_dir({'output_file': 'q2.pdf', 'site_dir': 'web'}) == 'web'
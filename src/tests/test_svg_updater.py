@@ -0,0 +1,59 @@
+import os
+import tempfile
+from sabbath_school_reproducer.generator.svg_updater import SvgTemplate, SvgUpdater
+
+COVER = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 800 1000">
+<text x="400" y="170">TOPICAL STUDIES</text>
+<text x="400" y="230">ON THE MESSAGE</text>
+<text x="400" y="810">FIRST QUARTER, 1895</text>
+<text x="400" y="840">January - March 1895</text>
+</svg>"""
+
+
+class TestSvgUpdater:
+    def setup_method(self):
+        self.config = {'year': 2025, 'quarter': 'q2', 'reproduce': {}}
+
+    def test_template_slots(self):
+        template = SvgTemplate(COVER)
+
+        assert template.slots == {'quarter', 'months', 'title', 'subtitle', 'attribution'}
+        assert template.render({}) == COVER
+
+    def test_render_replaces_cover_text(self):
+        svg = SvgUpdater.render_svg(COVER, self.config, {'front_matter': '# Faith & Works\n'})
+
+        assert '>SECOND QUARTER, 2025</text>' in svg
+        assert '>April - June 2025</text>' in svg
+        assert '>FAITH &amp; WORKS</text>' in svg
+        assert '>ON THE MESSAGE</text>' in svg
+        assert 'Adapted from' not in svg
+
+    def test_reproduction_splits_title_and_adds_attribution(self):
+        config = dict(self.config, reproduce={'year': 1895, 'quarter': 'q1'})
+        svg = SvgUpdater.render_svg(COVER, config)
+
+        assert '>SABBATH SCHOOL LESSONS</text>' in svg
+        assert '>(FROM 1895 FIRST QUARTER)</text>' in svg
+        assert svg.endswith('>Adapted from FIRST QUARTER, 1895</text>\n</svg>')
+        assert SvgUpdater.render_svg(svg, config).count('Adapted from') == 1
+
+    def test_rendered_covers_are_cached(self):
+        first = SvgUpdater.render_svg(COVER, self.config)
+
+        assert SvgUpdater.render_svg(COVER, self.config) is first
+        assert SvgUpdater.render_svg(COVER, dict(self.config, year=2026)) is not first
+
+    def test_update_svg_with_config_returns_content(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'cover.svg')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(COVER)
+
+            svg = SvgUpdater.update_svg_with_config(path, self.config, 'plain markdown')
+            assert '>SECOND QUARTER, 2025</text>' in svg
+            assert os.listdir(temp_dir) == ['cover.svg']
+            with open(path, encoding='utf-8') as f:
+                assert f.read() == COVER
+
+        assert SvgUpdater.update_svg_with_config(None, self.config) is None
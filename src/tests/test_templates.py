@@ -0,0 +1,31 @@
+from sabbath_school_reproducer.generator.templates import LessonTemplates
+from sabbath_school_reproducer.models import Lesson, Question
+
+
+class TestLessonTemplates:
+    def test_templates_are_compiled_once_per_language(self):
+        templates = LessonTemplates.for_language('en')
+        assert LessonTemplates.for_language('en') is templates
+        assert 'TABLE OF CONTENTS' in templates.toc
+        assert templates.answer == '<div class="answer"><em>Ans. — {answer}</em></div>'
+
+    def test_bake_escapes_label_braces(self):
+        template = LessonTemplates._bake('<b>{label}</b> {value}', label='{odd}')
+        assert template.format(value='1') == '<b>{odd}</b> 1'
+
+    def test_render_question(self):
+        templates = LessonTemplates.for_language('en')
+        question = Question(text='Who {spoke}', scripture='Gen. 1:3', answer='God')
+
+        first = templates.render_question(1, question)
+        assert '<span class="question-number one-digit">1.</span>' in first
+        assert 'Who {spoke}. <span class="scripture-ref">Gen. 1:3.</span>' in first
+        assert 'Ans. — God' in first
+
+        later = templates.render_question(LessonTemplates.PRECOMPUTED_NUMBERS + 5, question)
+        assert f'two-digit">{LessonTemplates.PRECOMPUTED_NUMBERS + 5}.</span>' in later
+
+    def test_render_toc(self):
+        toc = LessonTemplates.for_language('en').render_toc([Lesson(number='3', title='Faith', date='May 1, 2025')])
+        assert '<a href="#lesson-3">Faith</a>' in toc
+        assert '<td style="">May 1, 2025</td>' in toc
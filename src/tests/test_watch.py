@@ -0,0 +1,90 @@
+import os
+import tempfile
+from sabbath_school_reproducer.config import Config
+from sabbath_school_reproducer.downloader import GitHubDownloader
+from sabbath_school_reproducer.utils.corpus_generator import CorpusGenerator
+from sabbath_school_reproducer.watch import FileWatcher, WatchSession
+
+CONFIG = """year: 2025
+quarter: q2
+language: en
+input_file: ./input.md
+output_file: ./output/out.pdf
+cache_dir: null
+color_theme_path: ./theme.yaml
+reproduce:
+  year: 1905
+  quarter: q2
+  quarter_start_date: "2025-04-05"
+"""
+
+
+class TestFileWatcher:
+    def test_changed_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'a.yaml')
+            missing = os.path.join(temp_dir, 'b.yaml')
+            with open(path, 'w') as f:
+                f.write('a')
+            watcher = FileWatcher([path, missing])
+            assert watcher.changed() == []
+
+            with open(path, 'a') as f:
+                f.write('b')
+            with open(missing, 'w') as f:
+                f.write('c')
+            assert sorted(watcher.changed()) == [path, missing]
+            assert watcher.changed() == []
+
+
+class TestWatchSession:
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir.name)
+        with open('config.yaml', 'w') as f:
+            f.write(CONFIG)
+        self.markdown_path = GitHubDownloader.get_lesson_range_filename(Config('config.yaml'))
+        CorpusGenerator(seed=1).write_combined(self.markdown_path, 3)
+
+    def teardown_method(self):
+        os.chdir(self.cwd)
+        self.temp_dir.cleanup()
+
+    def test_stages_for(self):
+        assert WatchSession.stages_for(['theme']) == ['html', 'output']
+        assert WatchSession.stages_for(['cover', 'source']) == ['parse', 'html', 'output']
+        assert WatchSession.stages_for(['config']) == list(WatchSession.STAGES)
+        assert WatchSession.stages_for([]) == []
+
+    def test_rebuilds_only_affected_stages(self):
+        session = WatchSession('config.yaml', preview=True, lessons='2')
+        assert session.build(WatchSession.STAGES)
+        preview_path = os.path.join('output', 'sabbath_school_lesson_2025_q2_en_preview.html')
+        assert os.path.exists(preview_path)
+        assert len(session.content_data['lessons']) == 1
+
+        session.watcher.watch(session.watched_files())
+        assert session.check() == []
+
+        content_data = session.content_data
+        with open('theme.yaml', 'w') as f:
+            f.write('{}\n')
+        assert session.check() == ['html', 'output']
+        assert session.content_data is content_data
+
+        with open(self.markdown_path, 'a') as f:
+            f.write('\n')
+        assert session.check() == ['parse', 'html', 'output']
+        assert session.content_data is not content_data
+
+    def test_failed_stage_is_retried(self):
+        os.remove(self.markdown_path)
+        session = WatchSession('config.yaml', preview=True)
+
+        assert not session.build(WatchSession.STAGES)
+        assert session.pending == {'parse', 'html', 'output'}
+
+        CorpusGenerator(seed=1).write_combined(self.markdown_path, 2)
+        assert session.build([])
+        assert len(session.content_data['lessons']) == 2